@@ -3,6 +3,7 @@ __all__ = (
     "auth",
 	"categories",
 	"ingredients",
+    "events",
     "menus",
     "orders",
 	"payment_methods",
@@ -20,6 +21,7 @@ from fastapi import APIRouter
 
 from .auth import auth
 from .categories import categories
+from .events import events
 from .ingredients import ingredients
 from .menus import menus
 from .orders import orders
@@ -36,6 +38,7 @@ from .users import users
 api = APIRouter()
 api.include_router(auth)
 api.include_router(categories)
+api.include_router(events)
 api.include_router(ingredients)
 api.include_router(menus)
 api.include_router(orders)
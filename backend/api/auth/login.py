@@ -41,7 +41,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
             raise auth_error
 
         payload = TokenJwt(
-            user.id, user.role_id, await (await user.role).get_permissions()
+            user.id, user.role_id, (await user.role).get_permissions()
         )
 
     return LoginResponse(access_token=encode_jwt(payload))
@@ -43,4 +43,4 @@ async def register(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.USER_ALREADY_EXISTS)
 
-    return RegisterUserResponse(user=await user.to_dict())
+    return RegisterUserResponse(user=user.to_dict())
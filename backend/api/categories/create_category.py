@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Category
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict
 from backend.models.categories import (
     CreateCategoryItem,
@@ -16,6 +16,7 @@ create_category_router = APIRouter()
 
 @create_category_router.post("/", response_model=CreateCategoryResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def create_category(
     item: CreateCategoryItem,
     token: TokenJwt = Depends(validate_token),
@@ -36,5 +37,5 @@ async def create_category(
             raise Conflict(code=ErrorCodes.CATEGORY_ALREADY_EXISTS)
 
     return CreateCategoryResponse(
-        category=await new_category.to_dict()
+        category=new_category.to_dict()
     )
@@ -3,7 +3,7 @@ from tortoise.exceptions import OperationalError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Category
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import Conflict, NotFound
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -13,6 +13,7 @@ delete_category_router = APIRouter()
 
 @delete_category_router.delete("/{category_id}", response_model=BaseResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def delete_category(
     category_id: int,
     token: TokenJwt = Depends(validate_token)
@@ -1,29 +1,44 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from tortoise.exceptions import ParamsError
 from tortoise.expressions import Q
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Category
-from backend.decorators import check_role
+from backend.decorators import catalog_etag, check_role
 from backend.models.error import BadRequest
 from backend.models.categories import (
     GetCategoriesResponse,
     Category as CategoryModel,
     CategoryName,
 )
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils import (
+    CountMode,
+    ErrorCodes,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
 
 get_categories_router = APIRouter()
 
 
 @get_categories_router.get("/", response_model=GetCategoriesResponse)
 @check_role(Permission.CAN_ADMINISTER, Permission.CAN_CONFIRM_ORDERS)
+@catalog_etag()
 async def get_categories(
+    response: Response,
     offset: int = 0,
     limit: int | None = None,
     only_name: bool = False,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
+    if_none_match: str | None = Header(default=None),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -36,24 +51,38 @@ async def get_categories(
         (
             categories_query,
             total_count,
-            limit,
+            page_limit,
         ) = await process_query_with_pagination(
-            Category, Q(), connection, offset, limit, order_by
+            Category,
+            Q(),
+            connection,
+            offset,
+            limit,
+            order_by,
+            after=after,
+            before=before,
+            count=count,
         )
 
         try:
             categories = await categories_query.offset(offset).limit(
-                limit
+                page_limit
             )
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+    previous_cursor, next_cursor = get_page_cursors(
+        categories, order_by, limit, after, before
+    )
+
     return GetCategoriesResponse(
         total_count=total_count,
+        previous_cursor=previous_cursor,
+        next_cursor=next_cursor,
         categories=[
-            CategoryName(**await category.to_dict_name())
+            CategoryName(**category.to_dict_name())
             if only_name
-            else CategoryModel(**await category.to_dict())
+            else CategoryModel(**category.to_dict())
             for category in categories
         ],
     )
@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Category
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import Conflict, NotFound
 from backend.models.categories import UpdateParentCategoryItem
@@ -15,6 +15,7 @@ update_category_parent_main_products_router = APIRouter()
 
 @update_category_parent_main_products_router.put("/{category_id}/parent_main_products", response_model=BaseResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_category_parent_main_products(
     category_id: int,
     item: UpdateParentCategoryItem,
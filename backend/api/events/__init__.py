@@ -0,0 +1,11 @@
+__all__ = (
+    "events",
+    "get_events_router",
+)
+
+from fastapi import APIRouter
+
+from .get_events import get_events_router
+
+events = APIRouter(prefix="/events", tags=["events"])
+events.include_router(get_events_router)
@@ -0,0 +1,64 @@
+import contextlib
+import json
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from backend.decorators import check_role
+from backend.services.events import Event, EventBus
+from backend.utils import EventType, Permission, TokenJwt, validate_token
+
+get_events_router = APIRouter()
+
+
+@get_events_router.get("/", response_class=StreamingResponse)
+@check_role(
+    Permission.CAN_ADMINISTER,
+    Permission.CAN_ORDER,
+    Permission.CAN_CONFIRM_ORDERS
+)
+async def get_events(
+    categories: list[int] = Query(default=[]),
+    roles: list[int] = Query(default=[]),
+    types: list[EventType] = Query(default=[]),
+    last_event_id: str | None = Header(default=None),
+    token: TokenJwt = Depends(validate_token),
+):
+    """
+    Stream the order and ticket events as Server-Sent Events, filtered by
+    the categories of the tickets, the role of the order creator and the
+    event type. The id of an event is the resume token to send in the
+    Last-Event-ID header when reconnecting. A reset event means that some
+    events were lost and the data must be reloaded.
+
+    **Permission**: can_administer, can_order, can_confirm_orders
+    """
+
+    def is_requested(event: Event) -> bool:
+        return (
+            (not categories or not event.category_ids.isdisjoint(categories))
+            and (not roles or event.role_id in roles)
+            and (not types or event.type in types)
+        )
+
+    async def stream():
+        async with contextlib.aclosing(
+            EventBus.subscribe(last_event_id)
+        ) as subscription:
+            async for event in subscription:
+                # An event without data keeps the resume token up to date
+                if event is None:
+                    yield "id: %s\n\n" % EventBus.get_resume_token()
+                elif event.type == EventType.RESET or is_requested(event):
+                    yield "id: %s\nevent: %s\ndata: %s\n\n" % (
+                        EventBus.get_resume_token(event.id),
+                        event.type,
+                        json.dumps(jsonable_encoder(event.data)),
+                    )
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
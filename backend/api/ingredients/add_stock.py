@@ -40,4 +40,4 @@ async def add_stock(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.STOCK_ALREADY_EXISTS)
 
-    return AddStockResponse(stock=await new_stock.to_dict())
+    return AddStockResponse(stock=new_stock.to_dict())
@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Ingredient
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict
 from backend.models.ingredients import CreateIngredientItem, CreateIngredientResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -13,6 +13,7 @@ create_ingredient_router = APIRouter()
 
 @create_ingredient_router.post("/", response_model=CreateIngredientResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def create_ingredient(
     item: CreateIngredientItem,
     token: TokenJwt = Depends(validate_token),
@@ -38,4 +39,4 @@ async def create_ingredient(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.INGREDIENT_ALREADY_EXISTS)
 
-    return CreateIngredientResponse(ingredient=await new_ingredient.to_dict())
+    return CreateIngredientResponse(ingredient=new_ingredient.to_dict())
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Ingredient
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import NotFound
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -12,6 +12,7 @@ delete_ingredient_router = APIRouter()
 
 @delete_ingredient_router.delete("/{ingredient_id}", response_model=BaseResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def delete_ingredient(
     ingredient_id: int, token: TokenJwt = Depends(validate_token)
 ):
@@ -36,4 +36,4 @@ async def get_ingredient(
             if not ingredient:
                 raise NotFound(code=ErrorCodes.INGREDIENT_NOT_FOUND)
 
-            return GetIngredientResponse(**await ingredient.to_dict())
+            return GetIngredientResponse(**ingredient.to_dict())
@@ -12,8 +12,11 @@ from backend.models.ingredients import (
     IngredientStock,
     IngredientQuantities
 )
-from backend.utils import TokenJwt, validate_token, ErrorCodes
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils import CountMode, TokenJwt, validate_token, ErrorCodes
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
 from backend.services.ingredients import get_ingredient_stock, get_ingredients_completed_quantities
 
 get_ingredients_router = APIRouter()
@@ -25,6 +28,9 @@ async def get_ingredients(
     limit: int | None = None,
     only_name: bool = False,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
     ward: str = None,
     deleted: bool = False,
     include_stock_quantities: bool = False,
@@ -68,22 +74,36 @@ async def get_ingredients(
             (
                 ingredient_query,
                 total_count,
-                limit,
+                page_limit,
             ) = await process_query_with_pagination(
-                Ingredient, query, connection, offset, limit, order_by
+                Ingredient,
+                query,
+                connection,
+                offset,
+                limit,
+                order_by,
+                after=after,
+                before=before,
+                count=count,
             )
 
             try:
-                ingredients = await ingredient_query.offset(offset).limit(limit)
+                ingredients = await ingredient_query.offset(offset).limit(page_limit)
             except ParamsError:
                 raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+            previous_cursor, next_cursor = get_page_cursors(
+                ingredients, order_by, limit, after, before
+            )
+
             return GetIngredientsResponse(
                 total_count=total_count,
+                previous_cursor=previous_cursor,
+                next_cursor=next_cursor,
                 ingredients=[
-                    IngredientName(**await ingredient.to_dict_name())
+                    IngredientName(**ingredient.to_dict_name())
                     if only_name
-                    else IngredientModel(**await ingredient.to_dict())
+                    else IngredientModel(**ingredient.to_dict())
                     for ingredient in ingredients
                 ],
             )
@@ -44,7 +44,7 @@ async def get_stock_list(
     return StockListResponse(
         total_quantity=total_quantity,
         stocks=[
-            StockModel(**await stock.to_dict())
+            StockModel(**stock.to_dict())
             for stock in stocks
         ]
     )
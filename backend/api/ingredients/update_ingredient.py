@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Ingredient
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import Conflict, NotFound
 from backend.models.ingredients import CreateIngredientItem
@@ -14,6 +14,7 @@ update_ingredient_router = APIRouter()
 
 @update_ingredient_router.put("/{ingredient_id}", response_model=BaseResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_ingredient(
     ingredient_id: int,
     item: CreateIngredientItem,
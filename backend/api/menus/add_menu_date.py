@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu, MenuDate
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound
 from backend.models.menu import AddMenuDateItem, AddMenuDateResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -15,6 +15,7 @@ add_menu_date_router = APIRouter()
     "/{menu_id}/date", response_model=AddMenuDateResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_menu_date(
     menu_id: int,
     item: AddMenuDateItem,
@@ -45,4 +46,4 @@ async def add_menu_date(
         except ValueError as e:
             raise Conflict(code=e.args[0])
 
-    return AddMenuDateResponse(date=await new_menu_date.to_dict())
+    return AddMenuDateResponse(date=new_menu_date.to_dict())
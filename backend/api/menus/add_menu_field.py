@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu, MenuField
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound
 from backend.models.menu import AddMenuFieldItem, AddMenuFieldResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -15,6 +15,7 @@ add_menu_field_router = APIRouter()
     "/{menu_id}/field", response_model=AddMenuFieldResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_menu_field(
     menu_id: int,
     item: AddMenuFieldItem,
@@ -45,4 +46,4 @@ async def add_menu_field(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.MENU_FIELD_ALREADY_EXISTS)
 
-    return AddMenuFieldResponse(field=await new_menu_field.to_dict())
+    return AddMenuFieldResponse(field=new_menu_field.to_dict())
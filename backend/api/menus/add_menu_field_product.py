@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu, MenuField, MenuFieldProduct, Product
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound
 from backend.models.menu import (
     AddMenuFieldProductItem,
@@ -19,6 +19,7 @@ add_menu_field_product_router = APIRouter()
     response_model=AddMenuFieldProductResponse,
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_menu_field_product(
     menu_id: int,
     menu_field_id: int,
@@ -62,5 +63,5 @@ async def add_menu_field_product(
             raise Conflict(code=ErrorCodes.MENU_FIELD_PRODUCT_ALREADY_EXISTS)
 
     return AddMenuFieldProductResponse(
-        field_product=await new_menu_field_product.to_dict()
+        field_product=new_menu_field_product.to_dict()
     )
@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu, MenuRole, Role
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound, Unauthorized
 from backend.models.menu import AddMenuRoleItem, AddMenuRoleResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -15,6 +15,7 @@ add_menu_role_router = APIRouter()
     "/{menu_id}/role", response_model=AddMenuRoleResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_menu_role(
     menu_id: int,
     item: AddMenuRoleItem,
@@ -48,4 +49,4 @@ async def add_menu_role(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.MENU_ROLE_ALREADY_EXISTS)
 
-    return AddMenuRoleResponse(role=await new_menu_role.to_dict())
+    return AddMenuRoleResponse(role=new_menu_role.to_dict())
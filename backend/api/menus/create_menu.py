@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict
 from backend.models.menu import CreateMenuItem, CreateMenuResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -13,6 +13,7 @@ create_menu_router = APIRouter()
 
 @create_menu_router.post("/", response_model=CreateMenuResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def create_menu(
     item: CreateMenuItem,
     token: TokenJwt = Depends(validate_token),
@@ -34,4 +35,4 @@ async def create_menu(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.MENU_ALREADY_EXISTS)
 
-    return CreateMenuResponse(menu=await new_menu.to_dict())
+    return CreateMenuResponse(menu=new_menu.to_dict())
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from tortoise.query_utils import Prefetch
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu, ProductIngredient, ProductVariant
+from backend.decorators import catalog_etag
 from backend.models.error import NotFound
 from backend.models.menu import GetMenuResponse
-from backend.services.orders import get_today_quantities
+from backend.services.orders import get_today_quantity
 from backend.utils import ErrorCodes, TokenJwt, validate_token
 from backend.utils.query_filters import build_single_query_filter
 
@@ -13,7 +14,9 @@ get_menu_router = APIRouter()
 
 
 @get_menu_router.get("/{menu_id}", response_model=GetMenuResponse)
+@catalog_etag()
 async def get_menu(
+    response: Response,
     menu_id: int,
     include_dates: bool = False,
     include_fields: bool = False,
@@ -23,6 +26,7 @@ async def get_menu(
     include_fields_products_roles: bool = False,
     include_fields_products_variants: bool = False,
     include_roles: bool = False,
+    if_none_match: str | None = Header(default=None),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -49,7 +53,9 @@ async def get_menu(
                 "roles",
                 Prefetch(
                     "menu_fields__field_products__product__ingredients",
-                    queryset=ProductIngredient.filter(is_deleted=False),
+                    queryset=ProductIngredient.filter(
+                        is_deleted=False
+                    ).prefetch_related("ingredient"),
                 ),
                 Prefetch(
                     "menu_fields__field_products__product__variants",
@@ -64,16 +70,15 @@ async def get_menu(
             raise NotFound(code=ErrorCodes.MENU_NOT_FOUND)
 
         if not token.permissions["can_administer"] and menu.daily_max_sales:
-            today_quantities = await get_today_quantities(
-                {menu.id}, connection, True
+            today_quantity = await get_today_quantity(
+                menu.id, connection, True
             )
-            today_quantity = today_quantities.get(menu.id, 0)
 
             if today_quantity >= menu.daily_max_sales:
                 raise NotFound(code=ErrorCodes.MENU_NOT_FOUND)
 
     return GetMenuResponse(
-        **await menu.to_dict(
+        **menu.to_dict(
             include_dates,
             include_fields,
             include_fields_products,
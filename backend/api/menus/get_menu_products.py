@@ -5,7 +5,7 @@ from tortoise.transactions import in_transaction
 from backend.database.models import Menu, ProductIngredient, ProductVariant
 from backend.models.error import NotFound
 from backend.models.menu import GetMenuProductsResponse
-from backend.services.orders import get_today_quantities
+from backend.services.orders import get_today_quantity
 from backend.utils import ErrorCodes, TokenJwt, validate_token
 from backend.utils.query_filters import build_single_query_filter
 
@@ -42,7 +42,9 @@ async def get_menu_products(
                 "menu_fields__field_products__product__roles",
                 Prefetch(
                     "menu_fields__field_products__product__ingredients",
-                    queryset=ProductIngredient.filter(is_deleted=False),
+                    queryset=ProductIngredient.filter(
+                        is_deleted=False
+                    ).prefetch_related("ingredient"),
                 ),
                 Prefetch(
                     "menu_fields__field_products__product__variants",
@@ -57,16 +59,16 @@ async def get_menu_products(
             raise NotFound(code=ErrorCodes.MENU_NOT_FOUND)
 
         if not token.permissions["can_administer"] and menu.daily_max_sales:
-            today_quantities = await get_today_quantities(
-                {menu.id}, connection, True
+            today_quantity = await get_today_quantity(
+                menu.id, connection, True
             )
 
-            if today_quantities.get(menu.id, 0) >= menu.daily_max_sales:
+            if today_quantity >= menu.daily_max_sales:
                 raise NotFound(code=ErrorCodes.MENU_NOT_FOUND)
 
         # Get product details
         menu_products = [
-            await field_product.product.to_dict(
+            field_product.product.to_dict(
                 include_dates,
                 include_ingredients,
                 include_roles,
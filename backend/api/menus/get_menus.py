@@ -1,24 +1,33 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from tortoise.exceptions import ParamsError
 from tortoise.query_utils import Prefetch
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu, ProductIngredient, ProductVariant
+from backend.decorators import catalog_etag
 from backend.models.error import BadRequest
-from backend.models.menu import GetMenusResponse, Menu as MenuModel
+from backend.models.menu import GetMenusResponse
 from backend.services.orders import get_today_quantities
 from backend.utils import ErrorCodes, TokenJwt, validate_token
 from backend.utils.query_filters import build_multiple_query_filter
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
+from backend.utils.response_utils import model_response
 
 get_menus_router = APIRouter()
 
 
 @get_menus_router.get("/", response_model=GetMenusResponse)
+@catalog_etag()
 async def get_menus(
+    response: Response,
     offset: int = 0,
     limit: int | None = None,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
     include_dates: bool = False,
     include_fields: bool = False,
     include_fields_products: bool = False,
@@ -27,6 +36,7 @@ async def get_menus(
     include_fields_products_roles: bool = False,
     include_fields_products_variants: bool = False,
     include_roles: bool = False,
+    if_none_match: str | None = Header(default=None),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -42,13 +52,19 @@ async def get_menus(
             include_fields_products_roles,
         )
 
-        menus_query, _, limit = await process_query_with_pagination(
+        (
+            menus_query,
+            _,
+            page_limit,
+        ) = await process_query_with_pagination(
             Menu,
             menus_query_filter,
             connection,
             offset,
             limit,
             order_by,
+            after=after,
+            before=before,
         )
 
         try:
@@ -61,7 +77,9 @@ async def get_menus(
                     "roles",
                     Prefetch(
                         "menu_fields__field_products__product__ingredients",
-                        queryset=ProductIngredient.filter(is_deleted=False),
+                        queryset=ProductIngredient.filter(
+                            is_deleted=False
+                        ).prefetch_related("ingredient"),
                     ),
                     Prefetch(
                         "menu_fields__field_products__product__variants",
@@ -69,11 +87,16 @@ async def get_menus(
                     ),
                 )
                 .offset(offset)
-                .limit(limit)
+                .limit(page_limit)
             )
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+        # Sold out items are hidden after the cursors are taken
+        previous_cursor, next_cursor = get_page_cursors(
+            menus, order_by, limit, after, before
+        )
+
         if not token.permissions["can_administer"]:
             menu_ids = {m.id for m in menus if m.daily_max_sales}
             today_quantities = await get_today_quantities(
@@ -87,11 +110,14 @@ async def get_menus(
                 or today_quantities.get(m.id, 0) < m.daily_max_sales
             ]
 
-    return GetMenusResponse(
-        total_count=len(menus),
-        menus=[
-            MenuModel(
-                **await menu.to_dict(
+    return model_response(
+        GetMenusResponse,
+        {
+            "total_count": len(menus),
+            "previous_cursor": previous_cursor,
+            "next_cursor": next_cursor,
+            "menus": [
+                menu.to_dict(
                     include_dates,
                     include_fields,
                     include_fields_products,
@@ -101,7 +127,7 @@ async def get_menus(
                     include_fields_products_variants,
                     include_roles,
                 )
-            )
-            for menu in menus
-        ],
+                for menu in menus
+            ],
+        },
     )
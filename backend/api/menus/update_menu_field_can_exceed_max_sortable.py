@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu, MenuField
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import NotFound
 from backend.models.menu import UpdateMenuFieldCanExceedMaxSortableItem
@@ -16,6 +16,7 @@ update_menu_field_can_exceed_max_sortable_router = APIRouter()
     response_model=BaseResponse,
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_menu_field_can_exceed_max_sortable(
     menu_id: int,
     menu_field_id: int,
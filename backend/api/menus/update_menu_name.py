@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import Conflict, NotFound
 from backend.models.menu import UpdateMenuNameItem
@@ -14,6 +14,7 @@ update_menu_name_router = APIRouter()
 
 @update_menu_name_router.put("/{menu_id}/name", response_model=BaseResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_menu_name(
     menu_id: int,
     item: UpdateMenuNameItem,
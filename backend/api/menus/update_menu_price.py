@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Menu
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import NotFound
 from backend.models.menu import UpdateMenuPriceItem
@@ -13,6 +13,7 @@ update_menu_price_router = APIRouter()
 
 @update_menu_price_router.put("/{menu_id}/price", response_model=BaseResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_menu_price(
     menu_id: int,
     item: UpdateMenuPriceItem,
@@ -3,9 +3,14 @@ __all__ = (
 	"confirm_order_router",
 	"confirm_orders_router",
     "create_order_router",
+    "create_orders_router",
+    "quote_order_router",
     "update_order_router",
     "delete_order_router",
     "resume_order_router",
+    "get_order_changes_router",
+    "search_orders_router",
+    "get_order_summaries_router",
     "get_order_router",
     "get_orders_router",
     "print_order_router",
@@ -19,9 +24,14 @@ from fastapi import APIRouter
 from .confirm_order import confirm_order_router
 from .confirm_orders import confirm_orders_router
 from .create_order import create_order_router
+from .create_orders import create_orders_router
+from .quote_order import quote_order_router
 from .update_order import update_order_router
 from .delete_order import delete_order_router
 from .resume_order import resume_order_router
+from .get_order_changes import get_order_changes_router
+from .search_orders import search_orders_router
+from .get_order_summaries import get_order_summaries_router
 from .get_order import get_order_router
 from .get_orders import get_orders_router
 from .print_order import print_order_router
@@ -33,9 +43,14 @@ orders = APIRouter(prefix="/orders", tags=["orders"])
 orders.include_router(confirm_order_router)
 orders.include_router(confirm_orders_router)
 orders.include_router(create_order_router)
+orders.include_router(create_orders_router)
+orders.include_router(quote_order_router)
 orders.include_router(update_order_router)
 orders.include_router(delete_order_router)
 orders.include_router(resume_order_router)
+orders.include_router(get_order_changes_router)
+orders.include_router(search_orders_router)
+orders.include_router(get_order_summaries_router)
 orders.include_router(get_order_router)
 orders.include_router(get_orders_router)
 orders.include_router(print_order_router)
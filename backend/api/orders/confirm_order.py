@@ -10,7 +10,15 @@ from backend.decorators import check_role
 from backend.models import BaseResponse
 from backend.models.error import Unauthorized, NotFound
 from backend.models.orders import ConfirmOrderItem
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.events import publish_order_events
+from backend.services.order_changes import add_order_changes
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
 
 confirm_order_router = APIRouter()
 
@@ -56,5 +64,8 @@ async def confirm_order(
                 "confirmed_at": now_in_rome,
             }
         ).save(using_db=connection)
+        await add_order_changes([order.id], connection)
+
+    await publish_order_events(EventType.ORDER_CONFIRMED, [order.id])
 
     return BaseResponse()
@@ -1,23 +1,33 @@
 import datetime
 import pytz
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from tortoise.transactions import in_transaction
 
 from backend.config import Session
 from backend.database.models import Order
-from backend.decorators import check_role
+from backend.decorators import check_role, idempotent
 from backend.models.error import Unauthorized
 from backend.models.orders import ConfirmOrdersItem, ConfirmOrdersResponse
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.events import publish_order_events
+from backend.services.order_changes import add_order_changes
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
 
 confirm_orders_router = APIRouter()
 
 
 @confirm_orders_router.patch("/confirm", response_model=ConfirmOrdersResponse)
 @check_role(Permission.CAN_CONFIRM_ORDERS)
+@idempotent
 async def confirm_orders(
     item: ConfirmOrdersItem,
+    idempotency_key: str | None = Header(default=None, max_length=64),
     token: TokenJwt = Depends(validate_token),
 ):
     if (not Session.settings.order_requires_confirmation
@@ -89,6 +99,13 @@ async def confirm_orders(
                 errors.append({"order_id": order_id, "type": "confirm",  "message": "Errore durante il salvataggio"})
                 continue
 
+        await add_order_changes(
+            rollbacks_succeeded + confirms_succeeded, connection
+        )
+
+    await publish_order_events(EventType.ORDER_UPDATED, rollbacks_succeeded)
+    await publish_order_events(EventType.ORDER_CONFIRMED, confirms_succeeded)
+
     return ConfirmOrdersResponse(
         confirms_succeeded=confirms_succeeded,
         rollbacks_succeeded=rollbacks_succeeded,
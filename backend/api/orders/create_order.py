@@ -1,25 +1,34 @@
-import datetime
-import pytz
-
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from tortoise.transactions import in_transaction
 
 from backend.config import Session
 from backend.database.models import Order, PaymentMethod
-from backend.decorators import check_role
+from backend.decorators import check_role, idempotent, retry_transaction
 from backend.models.error import BadRequest, Conflict, NotFound
 from backend.models.orders import (
     CreateOrderItem,
     CreateOrderResponse,
     Order as OrderModel,
 )
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.catalog import CatalogCache
+from backend.services.events import publish_order_events
+from backend.services.locking import acquire_locks, get_order_lock_keys
+from backend.services.order_changes import add_order_changes
+from backend.services.orders import add_daily_sales, get_order_item_quantities
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.datetime_utils import get_service_day
 from backend.utils.order_utils import (
     check_menus,
     check_products,
-    create_order_menus,
-    create_order_products,
+    create_order_items,
     create_tickets,
+    get_order_fields,
     get_order_price,
 )
 
@@ -28,8 +37,11 @@ create_order_router = APIRouter()
 
 @create_order_router.post("/", response_model=CreateOrderResponse)
 @check_role(Permission.CAN_ORDER)
+@idempotent
+@retry_transaction
 async def create_order(
     item: CreateOrderItem,
+    idempotency_key: str | None = Header(default=None, max_length=64),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -59,10 +71,12 @@ async def create_order(
     ):
         raise BadRequest(code=ErrorCodes.SET_GUESTS_NUMBER, message="Specificare il numero di coperti")
     """
+    catalog = await CatalogCache.get()
+
     async with in_transaction() as connection:
-        await connection.execute_query(
-            "SET TRANSACTION ISOLATION LEVEL SERIALIZABLE;"
-        )
+        # Serialize only the orders that share a limited counter or a
+        # stocked ingredient
+        await acquire_locks(get_order_lock_keys(item, catalog), connection)
 
         if item.parent_order_id:
             parent_order = await Order.get_or_none(
@@ -81,67 +95,37 @@ async def create_order(
                 raise NotFound(code=ErrorCodes.PAYMENT_METHOD_NOT_FOUND)
 
         (has_error_products, error_code_products) = await check_products(
-            item.products, token.role_id, connection
+            item.products, token.role_id, catalog, connection
         )
 
         if has_error_products:
             raise Conflict(code=error_code_products)
 
         (has_error_menus, error_code_menus) = await check_menus(
-            item.menus, token.role_id, connection
+            item.menus, token.role_id, catalog, connection
         )
 
         if has_error_menus:
             raise Conflict(code=error_code_menus)
 
-        order_price = await get_order_price(item)
-
-        rome_tz = pytz.timezone("Europe/Rome")
-        now_in_rome = datetime.datetime.now(rome_tz)
+        order_price = get_order_price(item, catalog)
 
         order = await Order.create(
-            customer=item.customer,
-            guests=(item.guests
-                if not item.is_take_away and not item.parent_order_id
-                else None
-            ),
-            is_take_away=(item.is_take_away
-                if not item.parent_order_id
-                else False
-            ),
-            table=(item.table
-                if (not item.is_take_away
-                and not Session.settings.order_requires_confirmation
-                and not item.parent_order_id)
-                or not item.has_tickets
-                else None
-            ),
-            is_confirmed=(True
-                if item.is_take_away
-                or not Session.settings.order_requires_confirmation
-                or not item.has_tickets
-                else False
-            ),
-            confirmed_at=(now_in_rome
-                if item.is_take_away
-                or not Session.settings.order_requires_confirmation
-                or not item.has_tickets
-                else None
-            ),
-            is_done=not item.has_tickets,
-            is_voucher=item.is_voucher,
-            is_for_service=item.is_for_service,
-            has_tickets=item.has_tickets,
-            notes=item.notes,
+            **get_order_fields(item),
             price=order_price,
-            payment_method_id=item.payment_method_id,
             user_id=token.user_id,
-            parent_order_id=item.parent_order_id,
             using_db=connection,
         )
 
-        await create_order_products(item.products, order, connection)
-        await create_order_menus(item.menus, order, connection)
-        await create_tickets(order, connection)
+        await create_order_items([(order, item)], catalog, connection)
+        await add_daily_sales(
+            get_service_day(order.created_at),
+            *get_order_item_quantities(item),
+            connection,
+        )
+        await create_tickets([(order, item)], catalog, connection)
+        await add_order_changes([order.id], connection)
+
+    await publish_order_events(EventType.ORDER_CREATED, [order.id])
 
-    return CreateOrderResponse(order=OrderModel(**await order.to_dict()))
+    return CreateOrderResponse(order=OrderModel(**order.to_dict()))
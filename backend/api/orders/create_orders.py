@@ -0,0 +1,285 @@
+import datetime
+from collections import Counter
+
+from fastapi import APIRouter, Depends, Header
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+
+from backend.database.models import Order, PaymentMethod
+from backend.decorators import check_role, idempotent, retry_transaction
+from backend.models import UnicornException
+from backend.models.orders import (
+    CreateOrderItem,
+    CreateOrdersItem,
+    CreateOrdersResponse,
+    CreateOrdersResult,
+)
+from backend.services.catalog import Catalog, CatalogCache
+from backend.services.events import publish_order_events
+from backend.services.locking import acquire_locks, get_order_lock_keys
+from backend.services.order_changes import add_order_changes
+from backend.services.orders import (
+    add_daily_sales,
+    get_order_item_quantities,
+    get_today_quantities,
+)
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.datetime_utils import get_service_day
+from backend.utils.order_utils import (
+    check_menus,
+    check_products,
+    create_order_items,
+    create_tickets,
+    get_order_fields,
+    get_order_price,
+)
+from backend.utils.query_utils import bulk_insert
+
+ORDER_COLUMNS = (
+    "customer",
+    "guests",
+    "is_take_away",
+    "table",
+    "is_confirmed",
+    "confirmed_at",
+    "is_done",
+    "is_voucher",
+    "is_for_service",
+    "has_tickets",
+    "notes",
+    "payment_method_id",
+    "parent_order_id",
+    "price",
+    "user_id",
+    "created_at",
+    "is_deleted",
+)
+
+# Failures of an order's writes that reject only that order
+WRITE_ERRORS = (UnicornException, IntegrityError)
+
+create_orders_router = APIRouter()
+
+
+async def _write_orders(
+    accepted: list[tuple[CreateOrdersResult, CreateOrderItem]],
+    catalog: Catalog,
+    user_id: int,
+    now: datetime.datetime,
+    connection: BaseDBAsyncClient,
+) -> list[int]:
+    """
+    Write validated and priced orders with their items, tickets and daily
+    sales, using one multi-row statement per table.
+    """
+
+    orders_fields = []
+    sold_products = Counter()
+    sold_menus = Counter()
+
+    for result, order_item in accepted:
+        products, menus = get_order_item_quantities(order_item)
+        sold_products.update(products)
+        sold_menus.update(menus)
+
+        orders_fields.append(
+            {
+                **get_order_fields(order_item),
+                "price": result.price,
+                "user_id": user_id,
+                "created_at": now,
+                "is_deleted": False,
+            }
+        )
+
+    order_ids = await bulk_insert(
+        Order,
+        ORDER_COLUMNS,
+        [tuple(x[c] for c in ORDER_COLUMNS) for x in orders_fields],
+        connection,
+    )
+
+    orders = [
+        (Order(id=order_id, **fields), order_item)
+        for order_id, fields, (_, order_item) in zip(
+            order_ids, orders_fields, accepted
+        )
+    ]
+
+    await create_order_items(orders, catalog, connection)
+    await add_daily_sales(
+        get_service_day(now),
+        sold_products,
+        sold_menus,
+        connection,
+    )
+    await create_tickets(orders, catalog, connection)
+    await add_order_changes(order_ids, connection)
+
+    for order_id, (result, _) in zip(order_ids, accepted):
+        result.order_id = order_id
+
+    return order_ids
+
+
+@create_orders_router.post("/batch", response_model=CreateOrdersResponse)
+@check_role(Permission.CAN_ORDER)
+@idempotent
+@retry_transaction
+async def create_orders(
+    item: CreateOrdersItem,
+    idempotency_key: str | None = Header(default=None, max_length=64),
+    token: TokenJwt = Depends(validate_token),
+):
+    """
+    Create many orders at once, e.g. the ones queued by a till while
+    offline. Every order is validated and written on its own: the ones
+    that are invalid or cannot be written are reported and skipped, the
+    others are created. Only a serialization failure or a deadlock rolls
+    back the whole batch, which is then run again.
+
+    **Permission**: can_order
+    """
+
+    catalog = await CatalogCache.get()
+    results = [CreateOrdersResult(index=i) for i in range(len(item.orders))]
+    accepted = []
+
+    async with in_transaction() as connection:
+        lock_keys = set()
+        for order_item in item.orders:
+            lock_keys |= get_order_lock_keys(order_item, catalog)
+
+        await acquire_locks(lock_keys, connection)
+
+        parent_order_ids = set(
+            await Order.filter(
+                id__in=[
+                    x.parent_order_id
+                    for x in item.orders
+                    if x.parent_order_id
+                ]
+            )
+            .using_db(connection)
+            .values_list("id", flat=True)
+        )
+        payment_method_ids = set(
+            await PaymentMethod.filter(
+                id__in=[x.payment_method_id for x in item.orders],
+                is_deleted=False,
+            )
+            .using_db(connection)
+            .values_list("id", flat=True)
+        )
+
+        product_ids = set()
+        menu_ids = set()
+        for order_item in item.orders:
+            products, menus = get_order_item_quantities(order_item)
+            product_ids.update(products)
+            menu_ids.update(menus)
+
+        # Today's quantities, updated with the orders of the batch
+        product_quantities = Counter(
+            await get_today_quantities(product_ids, connection)
+        )
+        menu_quantities = Counter(
+            await get_today_quantities(menu_ids, connection, True)
+        )
+
+        for result, order_item in zip(results, item.orders):
+            if not order_item.products and not order_item.menus:
+                error_code = ErrorCodes.NO_PRODUCTS_AND_MENUS
+            elif (
+                order_item.parent_order_id
+                and order_item.parent_order_id not in parent_order_ids
+            ):
+                error_code = ErrorCodes.ORDER_NOT_FOUND
+            elif (
+                order_item.payment_method_id
+                and order_item.payment_method_id not in payment_method_ids
+            ):
+                error_code = ErrorCodes.PAYMENT_METHOD_NOT_FOUND
+            else:
+                (_, error_code) = await check_products(
+                    order_item.products,
+                    token.role_id,
+                    catalog,
+                    connection,
+                    product_quantities,
+                )
+
+                if not error_code:
+                    (_, error_code) = await check_menus(
+                        order_item.menus,
+                        token.role_id,
+                        catalog,
+                        connection,
+                        menu_quantities,
+                    )
+
+            if error_code:
+                result.error = True
+                result.code = error_code.value
+                continue
+
+            products, menus = get_order_item_quantities(order_item)
+            product_quantities.update(products)
+            menu_quantities.update(menus)
+
+            accepted.append((result, order_item))
+
+        if not accepted:
+            return CreateOrdersResponse(results=results)
+
+        now = timezone.now()
+        for result, order_item in accepted:
+            result.price = get_order_price(order_item, catalog)
+
+        # The orders are written together in a savepoint. When that fails
+        # they are written again one by one, so that only the orders that
+        # cannot be written are rejected
+        try:
+            async with in_transaction() as savepoint:
+                order_ids = await _write_orders(
+                    accepted, catalog, token.user_id, now, savepoint
+                )
+        except WRITE_ERRORS:
+            order_ids = []
+
+            for result, order_item in accepted:
+                try:
+                    async with in_transaction() as savepoint:
+                        order_ids += await _write_orders(
+                            [(result, order_item)],
+                            catalog,
+                            token.user_id,
+                            now,
+                            savepoint,
+                        )
+                except WRITE_ERRORS as e:
+                    code = (
+                        e.code
+                        if isinstance(e, UnicornException) and e.code
+                        else ErrorCodes.ORDER_CREATION_FAILED
+                    )
+
+                    result.error = True
+                    result.code = code.value
+                    result.order_id = None
+                    result.price = None
+
+        if not order_ids:
+            return CreateOrdersResponse(results=results)
+
+    await publish_order_events(EventType.ORDER_CREATED, order_ids)
+
+    return CreateOrdersResponse(results=results)
@@ -6,7 +6,15 @@ from backend.database.models import Ticket
 from backend.decorators import check_role
 from backend.models.base import BaseResponse
 from backend.models.error import Conflict
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.events import publish_order_events
+from backend.services.order_changes import add_order_changes
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
 
 delete_tickets_router = APIRouter()
 
@@ -31,7 +39,13 @@ async def delete_tickets(
                 await ticket.delete(using_db=connection)
             except IntegrityError:
                 raise Conflict(code=ErrorCodes.TICKET_UPDATE_FAILED)
+
+        await add_order_changes([order_id] if tickets else [], connection)
         
+    await publish_order_events(
+        EventType.ORDER_UPDATED, [order_id] if tickets else []
+    )
+
     return BaseResponse()
 
 
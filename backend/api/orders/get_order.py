@@ -6,6 +6,8 @@ from backend.decorators import check_role
 from backend.models.error import Unauthorized, NotFound
 from backend.models.orders import GetOrderResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.utils.prefetch_utils import ORDER_INCLUDES, get_prefetch_paths
+from backend.utils.response_utils import model_response
 
 get_order_router = APIRouter()
 
@@ -52,6 +54,12 @@ async def get_order(
     **Permission**: can_administer, can_order, can_confirm_orders
     """
 
+    includes = {
+        flag: value
+        for flag, value in locals().items()
+        if flag in ORDER_INCLUDES
+    }
+
     if not token.permissions["can_administer"]:
         if (
             include_menus_menu_dates
@@ -69,27 +77,7 @@ async def get_order(
         order = (
             await Order.filter(id=order_id)
             .prefetch_related(
-                "order_menus__order_menu_fields__order_menu_field_products",
-                "order_menus__order_menu_fields__order_menu_field_products__order_product_ingredients",
-                "order_menus__menu__dates",
-                "order_menus__menu__menu_fields",
-                "order_menus__menu__menu_fields__field_products",
-                "order_menus__menu__menu_fields__field_products__product__dates",
-                "order_menus__menu__menu_fields__field_products__product__ingredients",
-                "order_menus__menu__menu_fields__field_products__product__roles",
-                "order_menus__menu__menu_fields__field_products__product__variants",
-                "order_menus__menu__roles",
-                "order_products__order_product_ingredients",
-                "order_products__product__dates",
-                "order_products__product__ingredients",
-                "order_products__product__roles",
-                "order_products__product__variants",
-                "order_revisions",
-                "order_tickets",
-                "order_tickets__category",
-                "payment_method",
-                "user",
-                "confirmed_by",
+                *get_prefetch_paths(ORDER_INCLUDES, includes)
             )
             .using_db(connection)
             .first()
@@ -101,33 +89,10 @@ async def get_order(
         if order.is_deleted and not include_deleted_orders:
             raise NotFound(code=ErrorCodes.ORDER_NOT_FOUND)
 
-    return GetOrderResponse(
-        **await order.to_dict(
-            include_menus,
-            include_menus_menu,
-            include_menus_menu_dates,
-            include_menus_menu_fields,
-            include_menus_menu_fields_products,
-            include_menus_menu_fields_products_dates,
-            include_menus_menu_fields_products_ingredients,
-            include_menus_menu_fields_products_roles,
-            include_menus_menu_fields_products_variants,
-            include_menus_menu_roles,
-            include_menus_fields,
-            include_menus_fields_products,
-            include_menus_fields_products_ingredients,
-            include_products,
-            include_products_product,
-            include_products_product_dates,
-            include_products_product_ingredients,
-            include_products_product_roles,
-            include_products_product_variants,
-            include_products_ingredients,
-            include_payment_method,
-            include_revisions,
-            include_tickets,
-            include_user,
-            include_confirmer_user,
-        ),
-        is_deleted=order.is_deleted if include_deleted_orders else None
+    return model_response(
+        GetOrderResponse,
+        {
+            **order.to_dict(**includes),
+            "is_deleted": order.is_deleted if include_deleted_orders else None,
+        },
     )
@@ -0,0 +1,149 @@
+from fastapi import APIRouter, Depends
+from tortoise.functions import Max
+from tortoise.transactions import in_transaction
+
+from backend.database.models import Order, OrderChange
+from backend.decorators import check_role
+from backend.models.error import BadRequest, Unauthorized
+from backend.models.orders import GetOrderChangesResponse
+from backend.services.order_changes import get_finished_transaction_id
+from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.utils.prefetch_utils import ORDER_INCLUDES, get_prefetch_paths
+from backend.utils.response_utils import model_response
+
+get_order_changes_router = APIRouter()
+
+
+@get_order_changes_router.get(
+    "/changes", response_model=GetOrderChangesResponse
+)
+@check_role(
+    Permission.CAN_ADMINISTER,
+    Permission.CAN_ORDER,
+    Permission.CAN_CONFIRM_ORDERS
+)
+async def get_order_changes(
+    since: int = 0,
+    limit: int = 100,
+    include_menus: bool = False,
+    include_menus_menu: bool = False,
+    include_menus_menu_dates: bool = False,
+    include_menus_menu_fields: bool = False,
+    include_menus_menu_fields_products: bool = False,
+    include_menus_menu_fields_products_dates: bool = False,
+    include_menus_menu_fields_products_ingredients: bool = False,
+    include_menus_menu_fields_products_roles: bool = False,
+    include_menus_menu_fields_products_variants: bool = False,
+    include_menus_menu_roles: bool = False,
+    include_menus_fields: bool = False,
+    include_menus_fields_products: bool = False,
+    include_menus_fields_products_ingredients: bool = False,
+    include_products: bool = False,
+    include_products_product: bool = False,
+    include_products_product_dates: bool = False,
+    include_products_product_ingredients: bool = False,
+    include_products_product_roles: bool = False,
+    include_products_product_variants: bool = False,
+    include_products_ingredients: bool = False,
+    include_payment_method: bool = False,
+    include_revisions: bool = False,
+    include_tickets: bool = False,
+    include_user: bool = False,
+    include_confirmer_user: bool = False,
+    token: TokenJwt = Depends(validate_token),
+):
+    """
+    Get the orders changed from the change `since`, in commit order.
+    Deleted orders are returned as ids only. Pass the returned
+    last_change_id as `since` to get the next changes. The changes are
+    kept for a week, a client that has been away longer must reload the
+    orders.
+
+    **Permission**: can_administer, can_order, can_confirm_orders
+    """
+
+    includes = {
+        flag: value
+        for flag, value in locals().items()
+        if flag in ORDER_INCLUDES
+    }
+
+    if not token.permissions["can_administer"]:
+        if (
+            include_menus_menu_dates
+            or include_menus_menu_roles
+            or include_menus_menu_fields_products_dates
+            or include_menus_menu_fields_products_roles
+            or include_products_product_dates
+            or include_products_product_roles
+        ):
+            raise Unauthorized(code=ErrorCodes.ADMIN_OPTION_REQUIRED)
+
+    if since < 0 or limit < 1:
+        raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
+
+    async with in_transaction() as connection:
+        # A transaction still running may commit after a later one, so
+        # only the changes of the finished transactions are served
+        finished_id = await get_finished_transaction_id(connection)
+
+        # Latest change of every order changed in [since, finished_id)
+        changes = (
+            await OrderChange.filter(
+                transaction_id__gte=since, transaction_id__lt=finished_id
+            )
+            .annotate(last_transaction_id=Max("transaction_id"))
+            .group_by("order_id")
+            .order_by("last_transaction_id", "order_id")
+            .limit(limit + 1)
+            .using_db(connection)
+            .values("order_id", "last_transaction_id")
+        )
+
+        next_since = max(since, finished_id)
+        if len(changes) > limit:
+            # The page ends with a whole transaction, the next page starts
+            # from the first one left out
+            next_since = changes[limit]["last_transaction_id"]
+            changes = [
+                x
+                for x in changes
+                if x["last_transaction_id"] < next_since
+            ]
+
+            # A single transaction changed more orders than the limit
+            if not changes:
+                changes = (
+                    await OrderChange.filter(transaction_id=next_since)
+                    .distinct()
+                    .order_by("order_id")
+                    .using_db(connection)
+                    .values("order_id")
+                )
+                next_since += 1
+
+        orders = {
+            order.id: order
+            for order in await Order.filter(
+                id__in=[x["order_id"] for x in changes]
+            )
+            .prefetch_related(*get_prefetch_paths(ORDER_INCLUDES, includes))
+            .using_db(connection)
+        }
+
+    changed = [orders[x["order_id"]] for x in changes]
+
+    return model_response(
+        GetOrderChangesResponse,
+        {
+            "last_change_id": next_since,
+            "orders": [
+                order.to_dict(**includes)
+                for order in changed
+                if not order.is_deleted
+            ],
+            "deleted_order_ids": [
+                order.id for order in changed if order.is_deleted
+            ],
+        },
+    )
@@ -0,0 +1,120 @@
+import datetime
+
+from fastapi import APIRouter, Depends
+from tortoise.exceptions import ParamsError
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+
+from backend.database.models import Order
+from backend.decorators import check_role
+from backend.models.error import BadRequest
+from backend.models.orders import GetOrderSummariesResponse
+from backend.utils import (
+    CountMode,
+    ErrorCodes,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
+from backend.utils.response_utils import model_response
+
+get_order_summaries_router = APIRouter()
+
+
+@get_order_summaries_router.get(
+    "/summary", response_model=GetOrderSummariesResponse
+)
+@check_role(
+    Permission.CAN_ADMINISTER,
+    Permission.CAN_ORDER,
+    Permission.CAN_CONFIRM_ORDERS
+)
+async def get_order_summaries(
+    offset: int = 0,
+    limit: int | None = None,
+    order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
+    from_date: datetime.datetime | None = None,
+    to_date: datetime.datetime | None = None,
+    search_by_customer: str = None,
+    search_by_table: str = None,
+    need_confirm: bool = False,
+    confirmed_by_user: bool = False,
+    created_by_user: bool = False,
+    token: TokenJwt = Depends(validate_token),
+):
+    """
+    Get list of orders with their ticket progress, without their items.
+
+    **Permission**: can_administer, can_order, can_confirm_orders
+    """
+
+    async with in_transaction() as connection:
+        query = Q(is_deleted=False)
+
+        if from_date is not None:
+            query &= Q(created_at__gte=from_date)
+
+        if to_date is not None:
+            query &= Q(created_at__lt=to_date)
+
+        if need_confirm:
+            query &= Q(is_confirmed=False, is_done=False)
+
+        if confirmed_by_user:
+            query &= Q(confirmed_by_id=token.user_id)
+
+        if search_by_customer is not None:
+            query &= Q(customer__icontains=search_by_customer.strip())
+
+        if search_by_table is not None:
+            query &= Q(table__icontains=search_by_table.strip())
+
+        if created_by_user:
+            query &= Q(user_id=token.user_id)
+
+        (
+            orders_query,
+            total_count,
+            page_limit,
+        ) = await process_query_with_pagination(
+            Order,
+            query,
+            connection,
+            offset,
+            limit,
+            order_by,
+            after=after,
+            before=before,
+            count=count,
+        )
+
+        try:
+            # Orders and summaries are read with a single join
+            orders = (
+                await orders_query.select_related("summary")
+                .offset(offset)
+                .limit(page_limit)
+            )
+        except ParamsError:
+            raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
+
+    previous_cursor, next_cursor = get_page_cursors(
+        orders, order_by, limit, after, before
+    )
+
+    return model_response(
+        GetOrderSummariesResponse,
+        {
+            "total_count": total_count,
+            "previous_cursor": previous_cursor,
+            "next_cursor": next_cursor,
+            "orders": [order.to_dict_summary() for order in orders],
+        },
+    )
@@ -21,7 +21,12 @@ async def get_order_tickets(
     """
 
     async with in_transaction() as connection:
-        tickets = await Ticket.filter(order_id=order_id).using_db(connection)
+        tickets_query = Ticket.filter(order_id=order_id).using_db(connection)
+
+        if include_category_name:
+            tickets_query = tickets_query.prefetch_related("category")
+
+        tickets = await tickets_query
 
         if not tickets:
             raise NotFound(code=ErrorCodes.TICKET_NOT_FOUND)
@@ -29,9 +34,9 @@ async def get_order_tickets(
     return GetTicketsResponse(
         total_count=len(tickets),
         tickets=[
-            TicketCategory(**await ticket.to_dict_category())
+            TicketCategory(**ticket.to_dict_category())
             if include_category_name
-            else TicketModel(**await ticket.to_dict())
+            else TicketModel(**ticket.to_dict())
             for ticket in tickets
         ]
     )
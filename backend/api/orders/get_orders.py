@@ -1,3 +1,5 @@
+import datetime
+
 from fastapi import APIRouter, Depends
 from tortoise.exceptions import ParamsError
 from tortoise.expressions import Q
@@ -6,9 +8,20 @@ from tortoise.transactions import in_transaction
 from backend.database.models import Order
 from backend.decorators import check_role
 from backend.models.error import BadRequest, Unauthorized
-from backend.models.orders import GetOrdersResponse, Order as OrderModel
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
-from backend.utils.query_utils import process_query_with_pagination
+from backend.models.orders import GetOrdersResponse
+from backend.utils import (
+    CountMode,
+    ErrorCodes,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.prefetch_utils import ORDER_INCLUDES, get_prefetch_paths
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
+from backend.utils.response_utils import model_response
 
 get_orders_router = APIRouter()
 
@@ -23,6 +36,11 @@ async def get_orders(
     offset: int = 0,
     limit: int | None = None,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
+    from_date: datetime.datetime | None = None,
+    to_date: datetime.datetime | None = None,
     include_menus: bool = False,
     include_menus_menu: bool = False,
     include_menus_menu_dates: bool = False,
@@ -61,6 +79,12 @@ async def get_orders(
     **Permission**: can_administer, can_order, can_confirm_orders
     """
 
+    includes = {
+        flag: value
+        for flag, value in locals().items()
+        if flag in ORDER_INCLUDES
+    }
+
     if not token.permissions["can_administer"]:
         if (
             include_menus_menu_dates
@@ -75,11 +99,11 @@ async def get_orders(
     async with in_transaction() as connection:
         query = Q(is_deleted=False)
 
-        #if from_date is not None:
-        #    query &= Q(created_at__ge=from_date)
+        if from_date is not None:
+            query &= Q(created_at__gte=from_date)
 
-        #if to_date is not None:
-        #    query &= Q(created_at__lt=to_date)
+        if to_date is not None:
+            query &= Q(created_at__lt=to_date)
         
         if need_confirm:
             query &= Q(is_confirmed=False, is_done=False)
@@ -96,73 +120,43 @@ async def get_orders(
         if created_by_user:
             query &= Q(user_id=token.user_id)
 
-        orders_query, total_count, limit = await process_query_with_pagination(
-            Order, query, connection, offset, limit, order_by
+        (
+            orders_query,
+            total_count,
+            page_limit,
+        ) = await process_query_with_pagination(
+            Order,
+            query,
+            connection,
+            offset,
+            limit,
+            order_by,
+            after=after,
+            before=before,
+            count=count,
         )
 
         try:
             orders = (
                 await orders_query.prefetch_related(
-                    "order_menus__order_menu_fields__order_menu_field_products",
-                    "order_menus__order_menu_fields__order_menu_field_products__order_product_ingredients",
-                    "order_menus__menu__dates",
-                    "order_menus__menu__menu_fields",
-                    "order_menus__menu__menu_fields__field_products",
-                    "order_menus__menu__menu_fields__field_products__product__dates",
-                    "order_menus__menu__menu_fields__field_products__product__ingredients",
-                    "order_menus__menu__menu_fields__field_products__product__roles",
-                    "order_menus__menu__menu_fields__field_products__product__variants",
-                    "order_menus__menu__roles",
-                    "order_products__order_product_ingredients",
-                    "order_products__product__dates",
-                    "order_products__product__ingredients",
-                    "order_products__product__roles",
-                    "order_products__product__variants",
-                    "order_revisions",
-                    "order_tickets",
-                    "order_tickets__category",
-                    "payment_method",
-                    "user",
-                    "confirmed_by",
+                    *get_prefetch_paths(ORDER_INCLUDES, includes)
                 )
                 .offset(offset)
-                .limit(limit)
+                .limit(page_limit)
             )
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
-    return GetOrdersResponse(
-        total_count=total_count,
-        orders=[
-            OrderModel(
-                **await order.to_dict(
-                    include_menus,
-                    include_menus_menu,
-                    include_menus_menu_dates,
-                    include_menus_menu_fields,
-                    include_menus_menu_fields_products,
-                    include_menus_menu_fields_products_dates,
-                    include_menus_menu_fields_products_ingredients,
-                    include_menus_menu_fields_products_roles,
-                    include_menus_menu_fields_products_variants,
-                    include_menus_menu_roles,
-                    include_menus_fields,
-                    include_menus_fields_products,
-                    include_menus_fields_products_ingredients,
-                    include_products,
-                    include_products_product,
-                    include_products_product_dates,
-                    include_products_product_ingredients,
-                    include_products_product_roles,
-                    include_products_product_variants,
-                    include_products_ingredients,
-                    include_payment_method,
-                    include_revisions,
-                    include_tickets,
-                    include_user,
-                    include_confirmer_user,
-                )
-            )
-            for order in orders
-        ],
+    previous_cursor, next_cursor = get_page_cursors(
+        orders, order_by, limit, after, before
+    )
+
+    return model_response(
+        GetOrdersResponse,
+        {
+            "total_count": total_count,
+            "previous_cursor": previous_cursor,
+            "next_cursor": next_cursor,
+            "orders": [order.to_dict(**includes) for order in orders],
+        },
     )
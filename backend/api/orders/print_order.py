@@ -5,14 +5,13 @@ from backend.config import Session
 from backend.database.models import Order
 from backend.decorators import check_role
 from backend.models.error import NotFound
-from backend.models import BaseResponse
-from backend.models.orders import PrintOrderItem
+from backend.models.orders import PrintOrderItem, PrintOrderResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
 
 print_order_router = APIRouter()
 
 
-@print_order_router.post("/{order_id}/print", response_model=BaseResponse)
+@print_order_router.post("/{order_id}/print", response_model=PrintOrderResponse)
 @check_role(Permission.CAN_ADMINISTER)
 async def print_order(
     order_id: int,
@@ -20,7 +19,8 @@ async def print_order(
     token: TokenJwt = Depends(validate_token),
 ):
     """
-    Print order.
+    Print order. The print is queued, its status is returned by
+    GET /printers/jobs/{job_id}.
 
     **Permission**: can_administer
     """
@@ -30,9 +30,14 @@ async def print_order(
             await Order.filter(id=order_id)
             .prefetch_related(
                 "order_menus__order_menu_fields__order_menu_field_products__order_product_ingredients__ingredient",
+                "order_menus__order_menu_fields__order_menu_field_products__product",
+                "order_menus__order_menu_fields__order_menu_field_products__variant",
                 "order_menus__menu",
+                "order_products__product__subcategory",
                 "order_products__order_product_ingredients__ingredient",
                 "order_products__variant",
+                "order_tickets__category",
+                "parent_order",
                 "user__role__printers__printer",
                 "user__role__order_confirmer__printers__printer",
                 "order_printers__role_printer__printer",
@@ -45,6 +50,6 @@ async def print_order(
         if not order:
             raise NotFound(code=ErrorCodes.ORDER_NOT_FOUND)
 
-    await Session.print_manager.add_job(order, item.printer_types)
+    job = await Session.print_manager.add_job(order, item.printer_types)
 
-    return BaseResponse()
+    return PrintOrderResponse(job=job.to_dict())
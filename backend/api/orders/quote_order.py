@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends
+from tortoise import connections
+
+from backend.config import Session
+from backend.decorators import check_role
+from backend.models.error import BadRequest, Conflict
+from backend.models.orders import (
+    CreateOrderItem,
+    QuoteOrderMenu,
+    QuoteOrderMenuField,
+    QuoteOrderProduct,
+    QuoteOrderResponse,
+)
+from backend.services.catalog import CatalogCache
+from backend.services.pricing import price_order
+from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.utils.order_utils import check_menus, check_products
+from backend.utils.price_utils import from_cents
+
+quote_order_router = APIRouter()
+
+
+@quote_order_router.post("/quote", response_model=QuoteOrderResponse)
+@check_role(Permission.CAN_ORDER)
+async def quote_order(
+    item: CreateOrderItem,
+    token: TokenJwt = Depends(validate_token),
+):
+    """
+    Validate and price an order without creating it.
+
+    **Permission**: can_order
+    """
+
+    if not item.products and not item.menus:
+        raise BadRequest(code=ErrorCodes.NO_PRODUCTS_AND_MENUS, message="Nessun prodotto e nessun menù selezionato")
+
+    catalog = await CatalogCache.get()
+
+    # Only today's quantities are read, no transaction is needed
+    connection = connections.get("default")
+
+    (has_error_products, error_code_products) = await check_products(
+        item.products, token.role_id, catalog, connection
+    )
+
+    if has_error_products:
+        raise Conflict(code=error_code_products)
+
+    (has_error_menus, error_code_menus) = await check_menus(
+        item.menus, token.role_id, catalog, connection
+    )
+
+    if has_error_menus:
+        raise Conflict(code=error_code_menus)
+
+    order_price = price_order(item, catalog, Session.settings.cover_charge)
+
+    return QuoteOrderResponse(
+        price=from_cents(order_price.price),
+        cover_charge=from_cents(order_price.cover_charge),
+        products=[
+            QuoteOrderProduct(
+                product_id=product.product_id,
+                variant_id=product.variant_id,
+                quantity=product.quantity,
+                price=from_cents(price),
+            )
+            for product, price in zip(item.products, order_price.products)
+        ],
+        menus=[
+            QuoteOrderMenu(
+                menu_id=menu.menu_id,
+                quantity=menu.quantity,
+                price=from_cents(menu_price.price),
+                fields=[
+                    QuoteOrderMenuField(
+                        menu_field_id=field.menu_field_id,
+                        products=[
+                            QuoteOrderProduct(
+                                product_id=product.product_id,
+                                variant_id=product.variant_id,
+                                quantity=product.quantity,
+                                price=from_cents(price),
+                            )
+                            for product, price in zip(field.products, prices)
+                        ],
+                    )
+                    for field, prices in zip(menu.fields, menu_price.fields)
+                ],
+            )
+            for menu, menu_price in zip(item.menus, order_price.menus)
+        ],
+    )
@@ -5,7 +5,16 @@ from backend.database.models import Order
 from backend.decorators import check_role
 from backend.models import BaseResponse
 from backend.models.error import NotFound
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.events import publish_order_events
+from backend.services.order_changes import add_order_changes
+from backend.services.orders import update_order_daily_sales
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
 
 resume_order_router = APIRouter()
 
@@ -27,7 +36,13 @@ async def resume_order(
         if not order:
             raise NotFound(code=ErrorCodes.ORDER_NOT_FOUND)
 
+        if order.is_deleted:
+            await update_order_daily_sales(order, connection)
+
         order.is_deleted = False
         await order.save(using_db=connection)
+        await add_order_changes([order.id], connection)
+
+    await publish_order_events(EventType.ORDER_UPDATED, [order.id])
 
     return BaseResponse()
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends
+from tortoise.transactions import in_transaction
+
+from backend.database.models import Order
+from backend.decorators import check_role
+from backend.models.error import BadRequest
+from backend.models.orders import SearchOrdersResponse
+from backend.services.order_search import OrderSearchIndex
+from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.utils.response_utils import model_response
+
+search_orders_router = APIRouter()
+
+
+@search_orders_router.get("/search", response_model=SearchOrdersResponse)
+@check_role(
+    Permission.CAN_ADMINISTER,
+    Permission.CAN_ORDER,
+    Permission.CAN_CONFIRM_ORDERS
+)
+async def search_orders(
+    text: str,
+    limit: int = 20,
+    token: TokenJwt = Depends(validate_token),
+):
+    """
+    Search the orders of the service day by customer and table, best
+    match first.
+
+    **Permission**: can_administer, can_order, can_confirm_orders
+    """
+
+    if limit < 1:
+        raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
+
+    order_ids = await OrderSearchIndex.search(text, limit)
+
+    async with in_transaction() as connection:
+        orders = {
+            order.id: order
+            for order in await Order.filter(
+                id__in=order_ids, is_deleted=False
+            ).using_db(connection)
+        }
+
+    return model_response(
+        SearchOrdersResponse,
+        {
+            "orders": [
+                orders[x].to_dict() for x in order_ids if x in orders
+            ],
+        },
+    )
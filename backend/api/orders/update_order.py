@@ -1,28 +1,47 @@
 import datetime
 import pytz
+from collections import defaultdict
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from tortoise.transactions import in_transaction
 from tortoise.exceptions import IntegrityError
 
 from backend.config import Session
-from backend.database.models import Order, OrderProduct, Product, Revision
-from backend.decorators import check_role
+from backend.database.models import Order, OrderProduct, Revision
+from backend.decorators import check_role, idempotent, retry_transaction
 from backend.models.error import Conflict, NotFound
 from backend.models import BaseResponse
 from backend.models.orders import (
     CreateOrderItem
 )
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.catalog import CatalogCache
+from backend.services.events import publish_order_events
+from backend.services.locking import acquire_locks, get_order_lock_keys
+from backend.services.order_changes import add_order_changes
+from backend.services.orders import add_daily_sales
+from backend.services.pricing import price_product_unit
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.datetime_utils import get_service_day
+from backend.utils.order_utils import check_generic_product, check_products
+from backend.utils.price_utils import from_cents, to_cents
 
 update_order_router = APIRouter()
 
 
 @update_order_router.put("/{order_id}", response_model=BaseResponse)
 @check_role(Permission.CAN_ORDER)
+@idempotent
+@retry_transaction
 async def create_order(
     order_id: int,
     item: CreateOrderItem,
+    idempotency_key: str | None = Header(default=None, max_length=64),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -31,19 +50,23 @@ async def create_order(
     **Permission**: can_order
     """
 
-    async with in_transaction() as connection:
-        await connection.execute_query(
-            "SET TRANSACTION ISOLATION LEVEL SERIALIZABLE;"
-        )
+    catalog = await CatalogCache.get()
 
-        order = await Order.get_or_none(
-            id=order_id, using_db=connection
+    async with in_transaction() as connection:
+        # Same locks as a new order with these products, so the edit can't
+        # exceed a daily limit together with a concurrent order
+        await acquire_locks(get_order_lock_keys(item, catalog), connection)
+
+        order = (
+            await Order.select_for_update()
+            .using_db(connection)
+            .get_or_none(id=order_id)
         )
 
         if not order:
             raise NotFound(code=ErrorCodes.ORDER_NOT_FOUND)
         
-        old_price = float(order.price)
+        old_price = to_cents(order.price)
         new_price = old_price
 
         order.customer = item.customer
@@ -56,48 +79,96 @@ async def create_order(
         order.payment_method_id = item.payment_method_id
         order.is_for_service = item.is_for_service
 
-        edited_products = 0
+        edited_products = []
+        product_quantities = defaultdict(int)
         for product in item.products:
             if product.edited_product:
-                edited_products += 1
-                p = await Product.get_or_none(id=product.product_id)
-                
+                product_db = catalog.products.get(product.product_id)
+
+                if not product_db:
+                    raise NotFound(code=ErrorCodes.PRODUCT_NOT_FOUND)
+
+                (has_error, error_code) = check_generic_product(
+                    product_db, product
+                )
+
+                if has_error:
+                    raise Conflict(code=error_code)
+
+                op = None
                 if product.original_quantity == 0:
-                    try:
-                        await OrderProduct.create( #Some fields has been omitted
-                            product_id=product.product_id,
-                            quantity=product.quantity,
-                            price=product.quantity * p.price,
-                            variant_id=product.variant_id,
-                            notes=product.notes,
-                            order=order,
-                            category_id=product.category_id,
-                            using_db=connection,
-                        )
-                        new_price += product.quantity * float(p.price)
-                    except IntegrityError:
-                        raise Conflict(ErrorCodes.ORDER_UPDATE_FAILED, message=f"Errore durante la creazione del prodotto order_product del prodotto con id {product.product_id}")
+                    product_quantities[product.product_id] += product.quantity
                 else:
                     op = await OrderProduct.filter(order_id=order_id, product_id=product.product_id).using_db(connection).first()
-                    if product.quantity == 0:
-                        try:
-                            await op.delete(using_db=connection)
-                            new_price -= op.quantity * float(p.price)
-                        except IntegrityError:
-                            raise Conflict(ErrorCodes.ORDER_UPDATE_FAILED, message=f"Errore durante l'eliminazione del prodotto order_product {op.id}")
-                    else:
-                        delta_price = (product.quantity - product.original_quantity) * float(p.price)
-                        op.quantity = product.quantity
-                        op.notes = product.notes
-                        op.price = float(op.price) + delta_price
-
-                        try:
-                            await op.save(using_db=connection)
-                            new_price += float(delta_price)
-                        except IntegrityError:
-                            raise Conflict(ErrorCodes.ORDER_UPDATE_FAILED, message=f"Errore durante l'aggiornamento del prodotto order_product {op.id}")
-
-        order.price = new_price
+                    product_quantities[product.product_id] += product.quantity - op.quantity
+
+                edited_products.append((product, product_db, op))
+
+        # Only the quantities added today count towards today's limits
+        if (
+            not order.is_deleted
+            and get_service_day(order.created_at) == get_service_day()
+        ):
+            added_products = {
+                product.product_id: product.model_copy(
+                    update={"quantity": product_quantities[product.product_id]}
+                )
+                for product, _, _ in edited_products
+                if product_quantities[product.product_id] > 0
+            }
+
+            (has_error_products, error_code_products) = await check_products(
+                list(added_products.values()), token.role_id, catalog, connection
+            )
+
+            if has_error_products:
+                raise Conflict(code=error_code_products)
+
+        for product, product_db, op in edited_products:
+            unit_price = price_product_unit(product_db, product)
+
+            if op is None:
+                try:
+                    await OrderProduct.create( #Some fields has been omitted
+                        product_id=product.product_id,
+                        quantity=product.quantity,
+                        price=from_cents(product.quantity * unit_price),
+                        variant_id=product.variant_id,
+                        notes=product.notes,
+                        order=order,
+                        category_id=product.category_id,
+                        using_db=connection,
+                    )
+                    new_price += product.quantity * unit_price
+                except IntegrityError:
+                    raise Conflict(ErrorCodes.ORDER_UPDATE_FAILED, message=f"Errore durante la creazione del prodotto order_product del prodotto con id {product.product_id}")
+            elif product.quantity == 0:
+                try:
+                    await op.delete(using_db=connection)
+                    new_price -= to_cents(op.price)
+                except IntegrityError:
+                    raise Conflict(ErrorCodes.ORDER_UPDATE_FAILED, message=f"Errore durante l'eliminazione del prodotto order_product {op.id}")
+            else:
+                delta_price = (product.quantity - product.original_quantity) * unit_price
+                op.quantity = product.quantity
+                op.notes = product.notes
+                op.price = from_cents(to_cents(op.price) + delta_price)
+
+                try:
+                    await op.save(using_db=connection)
+                    new_price += delta_price
+                except IntegrityError:
+                    raise Conflict(ErrorCodes.ORDER_UPDATE_FAILED, message=f"Errore durante l'aggiornamento del prodotto order_product {op.id}")
+
+        order.price = from_cents(new_price)
+
+        if not order.is_deleted:
+            await add_daily_sales(
+                get_service_day(order.created_at),
+                product_quantities,
+                {},
+                connection,
+            )
 
         try:
             await order.save(using_db=connection)
@@ -105,10 +176,15 @@ async def create_order(
             await Revision.create(
                 order=order,
                 user_id=token.user_id,
-                price_difference=(new_price-old_price),
-                edited_products=edited_products
+                price_difference=from_cents(new_price - old_price),
+                edited_products=len(edited_products),
+                using_db=connection,
             )
         except IntegrityError:
             raise Conflict(ErrorCodes.ORDER_UPDATE_FAILED, message="Errore durante il salvataggio dell'ordine aggiornato")
 
+        await add_order_changes([order.id], connection)
+
+    await publish_order_events(EventType.ORDER_UPDATED, [order.id])
+
     return BaseResponse()
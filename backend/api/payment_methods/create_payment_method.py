@@ -37,5 +37,5 @@ async def create_payment_method(
             raise Conflict(code=ErrorCodes.PAYMENT_METHOD_ALREADY_EXISTS)
 
     return CreatePaymentMethodResponse(
-        payment_method=await new_payment_method.to_dict()
+        payment_method=new_payment_method.to_dict()
     )
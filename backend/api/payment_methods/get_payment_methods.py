@@ -11,8 +11,17 @@ from backend.models.payment_methods import (
     PaymentMethod as PaymentMethodModel,
     PaymentMethodName,
 )
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils import (
+    CountMode,
+    ErrorCodes,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
 
 get_payment_methods_router = APIRouter()
 
@@ -23,6 +32,9 @@ async def get_payment_methods(
     limit: int | None = None,
     only_name: bool = False,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -35,22 +47,36 @@ async def get_payment_methods(
         (
             payment_methods_query,
             total_count,
-            limit,
+            page_limit,
         ) = await process_query_with_pagination(
-            PaymentMethod, Q(is_deleted=False), connection, offset, limit, order_by
+            PaymentMethod,
+            Q(is_deleted=False),
+            connection,
+            offset,
+            limit,
+            order_by,
+            after=after,
+            before=before,
+            count=count,
         )
 
         try:
-            payment_methods = await payment_methods_query.offset(offset).limit(limit)
+            payment_methods = await payment_methods_query.offset(offset).limit(page_limit)
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+    previous_cursor, next_cursor = get_page_cursors(
+        payment_methods, order_by, limit, after, before
+    )
+
     return GetPaymentMethodsResponse(
         total_count=total_count,
+        previous_cursor=previous_cursor,
+        next_cursor=next_cursor,
         payment_methods=[
-            PaymentMethodName(**await payment_method.to_dict_name())
+            PaymentMethodName(**payment_method.to_dict_name())
             if only_name
-            else PaymentMethodModel(**await payment_method.to_dict())
+            else PaymentMethodModel(**payment_method.to_dict())
             for payment_method in payment_methods
         ],
     )
@@ -40,5 +40,5 @@ async def create_printer(
     Session.print_manager.add_printer(new_printer.id, new_printer.ip_address)
 
     return CreatePrinterResponse(
-        printer=PrinterModel(**await new_printer.to_dict())
+        printer=PrinterModel(**new_printer.to_dict())
     )
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+
+from backend.config import Session
+from backend.decorators import check_role
+from backend.models.error import NotFound
+from backend.models.printers import GetPrintJobResponse
+from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+
+get_print_job_router = APIRouter()
+
+
+@get_print_job_router.get("/jobs/{job_id}", response_model=GetPrintJobResponse)
+@check_role(Permission.CAN_ADMINISTER)
+async def get_print_job(
+    job_id: int, token: TokenJwt = Depends(validate_token)
+):
+    """
+    Get the status of a print job.
+
+    **Permission**: can_administer
+    """
+
+    job = Session.print_manager.get_job(job_id)
+
+    if not job:
+        raise NotFound(code=ErrorCodes.PRINT_JOB_NOT_FOUND)
+
+    return GetPrintJobResponse(**job.to_dict())
@@ -27,4 +27,4 @@ async def get_printer(
         if not printer:
             raise NotFound(code=ErrorCodes.PRINTER_NOT_FOUND)
 
-    return GetPrinterResponse(**await printer.to_dict())
+    return GetPrinterResponse(**printer.to_dict())
@@ -11,8 +11,17 @@ from backend.models.printers import (
     Printer as PrinterModel,
     PrinterName,
 )
-from backend.utils import Permission, TokenJwt, validate_token, ErrorCodes
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils import (
+    CountMode,
+    Permission,
+    TokenJwt,
+    validate_token,
+    ErrorCodes,
+)
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
 
 get_printers_router = APIRouter()
 
@@ -24,6 +33,9 @@ async def get_printers(
     limit: int | None = None,
     only_name: bool = False,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -36,22 +48,36 @@ async def get_printers(
         (
             printer_query,
             total_count,
-            limit,
+            page_limit,
         ) = await process_query_with_pagination(
-            Printer, Q(), connection, offset, limit, order_by
+            Printer,
+            Q(),
+            connection,
+            offset,
+            limit,
+            order_by,
+            after=after,
+            before=before,
+            count=count,
         )
 
         try:
-            printers = await printer_query.offset(offset).limit(limit)
+            printers = await printer_query.offset(offset).limit(page_limit)
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+    previous_cursor, next_cursor = get_page_cursors(
+        printers, order_by, limit, after, before
+    )
+
     return GetPrintersResponse(
         total_count=total_count,
+        previous_cursor=previous_cursor,
+        next_cursor=next_cursor,
         printers=[
-            PrinterName(**await printer.to_dict_name())
+            PrinterName(**printer.to_dict_name())
             if only_name
-            else PrinterModel(**await printer.to_dict())
+            else PrinterModel(**printer.to_dict())
             for printer in printers
         ],
     )
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+
+from backend.config import Session
+from backend.decorators import check_role
+from backend.models.printers import GetPrintersStatusResponse
+from backend.utils import Permission, TokenJwt, validate_token
+
+get_printers_status_router = APIRouter()
+
+
+@get_printers_status_router.get("/status", response_model=GetPrintersStatusResponse)
+@check_role(Permission.CAN_ADMINISTER)
+async def get_printers_status(token: TokenJwt = Depends(validate_token)):
+    """
+    Get the health and the queue of every printer.
+
+    **Permission**: can_administer
+    """
+
+    return GetPrintersStatusResponse(
+        printers=Session.print_manager.get_printers_status()
+    )
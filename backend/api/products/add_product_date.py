@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Product, ProductDate
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound
 from backend.models.products import AddProductDateItem, AddProductDateResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -15,6 +15,7 @@ add_product_date_router = APIRouter()
     "/{product_id}/date", response_model=AddProductDateResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_product_date(
     product_id: int,
     item: AddProductDateItem,
@@ -45,4 +46,4 @@ async def add_product_date(
         except ValueError as e:
             raise Conflict(code=e.args[0])
 
-    return AddProductDateResponse(date=await new_product_date.to_dict())
+    return AddProductDateResponse(date=new_product_date.to_dict())
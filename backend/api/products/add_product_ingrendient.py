@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Ingredient, Product, ProductIngredient
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound
 from backend.models.products import (
     AddProductIngredientItem,
@@ -18,6 +18,7 @@ add_product_ingredient_router = APIRouter()
     "/{product_id}/ingredient", response_model=AddProductIngredientResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_product_ingredient(
     product_id: int,
     item: AddProductIngredientItem,
@@ -54,6 +55,7 @@ async def add_product_ingredient(
             product_ingredient.max_quantity=item.max_quantity
             product_ingredient.is_default=item.is_default
             product_ingredient.is_deleted=False
+            product_ingredient.ingredient=ingredient
 
         try:
             await product_ingredient.save(using_db=connection)
@@ -62,5 +64,5 @@ async def add_product_ingredient(
             raise Conflict(code=ErrorCodes.PRODUCT_INGREDIENT_ALREADY_EXISTS)
 
     return AddProductIngredientResponse(
-        product_ingredient=await product_ingredient.to_dict_name()
+        product_ingredient=product_ingredient.to_dict_name()
     )
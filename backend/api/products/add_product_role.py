@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Product, ProductRole, Role
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound, Unauthorized
 from backend.models.products import AddProductRoleItem, AddProductRoleResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -15,6 +15,7 @@ add_product_role_router = APIRouter()
     "/{product_id}/role", response_model=AddProductRoleResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_product_role(
     product_id: int,
     item: AddProductRoleItem,
@@ -48,4 +49,4 @@ async def add_product_role(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.PRODUCT_ROLE_ALREADY_EXISTS)
 
-    return AddProductRoleResponse(role=await new_product_role.to_dict())
+    return AddProductRoleResponse(role=new_product_role.to_dict())
@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Product, ProductVariant
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound
 from backend.models.products import (
     AddProductVariantItem,
@@ -18,6 +18,7 @@ add_product_variant_router = APIRouter()
     "/{product_id}/variant", response_model=AddProductVariantResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def add_product_variant(
     product_id: int,
     item: AddProductVariantItem,
@@ -46,5 +47,5 @@ async def add_product_variant(
             raise Conflict(code=ErrorCodes.PRODUCT_VARIANT_ALREADY_EXISTS)
 
     return AddProductVariantResponse(
-        variant=await new_product_variant.to_dict()
+        variant=new_product_variant.to_dict()
     )
@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Category, Product, Subcategory
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict, NotFound
 from backend.models.products import CreateProductItem, CreateProductResponse
 from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
@@ -13,6 +13,7 @@ create_product_router = APIRouter()
 
 @create_product_router.post("/", response_model=CreateProductResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def create_product(
     item: CreateProductItem,
     token: TokenJwt = Depends(validate_token),
@@ -51,4 +52,4 @@ async def create_product(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.PRODUCT_ALREADY_EXISTS)
 
-    return CreateProductResponse(product=await new_product.to_dict())
+    return CreateProductResponse(product=new_product.to_dict())
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from tortoise.query_utils import Prefetch
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Product, ProductIngredient, ProductVariant
+from backend.decorators import catalog_etag
 from backend.models.error import NotFound
 from backend.models.products import GetProductResponse
-from backend.services.orders import get_today_quantities
+from backend.services.orders import get_today_quantity
 from backend.utils import ErrorCodes, TokenJwt, validate_token
 from backend.utils.query_filters import build_single_query_filter
 
@@ -13,13 +14,16 @@ get_product_router = APIRouter()
 
 
 @get_product_router.get("/{product_id}", response_model=GetProductResponse)
+@catalog_etag()
 async def get_product(
+    response: Response,
     product_id: int,
     include_dates: bool = False,
     include_ingredients: bool = False,
     include_roles: bool = False,
     include_subcategory: bool = False,
     include_variants: bool = False,
+    if_none_match: str | None = Header(default=None),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -36,9 +40,12 @@ async def get_product(
             .prefetch_related(
                 "dates",
                 "roles",
+                "subcategory",
                 Prefetch(
                     "ingredients",
-                    queryset=ProductIngredient.filter(is_deleted=False),
+                    queryset=ProductIngredient.filter(
+                        is_deleted=False
+                    ).prefetch_related("ingredient"),
                 ),
                 Prefetch(
                     "variants",
@@ -53,16 +60,13 @@ async def get_product(
             raise NotFound(code=ErrorCodes.PRODUCT_NOT_FOUND)
 
         if not token.permissions["can_administer"] and product.daily_max_sales:
-            today_quantities = await get_today_quantities(
-                {product.id}, connection
-            )
-            today_quantity = today_quantities.get(product.id, 0)
+            today_quantity = await get_today_quantity(product.id, connection)
 
             if today_quantity >= product.daily_max_sales:
                 raise NotFound(code=ErrorCodes.PRODUCT_NOT_FOUND)
 
     return GetProductResponse(
-        **await product.to_dict(
+        **product.to_dict(
             include_dates, include_ingredients, include_roles, include_subcategory, include_variants
         )
     )
@@ -1,31 +1,36 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from tortoise.exceptions import ParamsError
 from tortoise.expressions import Q
 from tortoise.query_utils import Prefetch
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Product, ProductIngredient, ProductVariant
+from backend.decorators import catalog_etag
 from backend.models.error import BadRequest
-from backend.models.products import (
-    GetProductsResponse,
-    Product as ProductModel,
-    ProductName,
-)
+from backend.models.products import GetProductsResponse
 from backend.services.orders import get_today_quantities
 from backend.utils import ErrorCodes, TokenJwt, validate_token
 from backend.utils.query_filters import build_multiple_query_filter
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
+from backend.utils.response_utils import model_response
 from backend.services.ingredients import get_ingredient_stock
 
 get_products_router = APIRouter()
 
 
 @get_products_router.get("/", response_model=GetProductsResponse)
+@catalog_etag("include_locks")
 async def get_products(
+    response: Response,
     offset: int = 0,
     limit: int | None = None,
     only_name: bool = False,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
     category_id: int = None,
     subcategory_id: int = None,
     include_dates: bool = False,
@@ -34,6 +39,7 @@ async def get_products(
     include_subcategory: bool = False,
     include_variants: bool = False,
     include_locks: bool = False,
+    if_none_match: str | None = Header(default=None),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -51,13 +57,19 @@ async def get_products(
         if subcategory_id:
             products_query_filter &= Q(subcategory_id=subcategory_id)
 
-        (products_query, _, limit,) = await process_query_with_pagination(
+        (
+            products_query,
+            _,
+            page_limit,
+        ) = await process_query_with_pagination(
             Product,
             products_query_filter,
             connection,
             offset,
             limit,
             order_by,
+            after=after,
+            before=before,
         )
 
         try:
@@ -65,9 +77,12 @@ async def get_products(
                 await products_query.prefetch_related(
                     "dates",
                     "roles",
+                    "subcategory",
                     Prefetch(
                         "ingredients",
-                        queryset=ProductIngredient.filter(is_deleted=False),
+                        queryset=ProductIngredient.filter(
+                            is_deleted=False
+                        ).prefetch_related("ingredient"),
                     ),
                     Prefetch(
                         "variants",
@@ -75,11 +90,16 @@ async def get_products(
                     ),
                 )
                 .offset(offset)
-                .limit(limit)
+                .limit(page_limit)
             )
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+        # Sold out items are hidden after the cursors are taken
+        previous_cursor, next_cursor = get_page_cursors(
+            products, order_by, limit, after, before
+        )
+
         if not token.permissions["can_administer"]:
             product_ids = {p.id for p in products if p.daily_max_sales}
             today_quantities = await get_today_quantities(
@@ -100,27 +120,32 @@ async def get_products(
                 added = ing["added_stock"] if ing["added_stock"] is not None else 0
                 ingredient_stock_levels[ing["id"]] = added - ing["consumed_stock"]
 
-    return GetProductsResponse(
-        total_count=len(products),
-        products=[
-            ProductName(**await product.to_dict_name())
-            if only_name
-            else ProductModel(
-                **await product.to_dict(
-                    include_dates,
-                    include_ingredients,
-                    include_roles,
-                    include_subcategory,
-                    include_variants,
-                ),
-                locked=(
-                    len([
-                        ing
-                        for ing in product.ingredients
-                        if ing.is_default and ing.max_quantity > ingredient_stock_levels.get(ing.ingredient_id, ing.max_quantity)]
-                    ) > 0
-                ) if include_locks else None
-            )
-            for product in products
-        ],
+    return model_response(
+        GetProductsResponse,
+        {
+            "total_count": len(products),
+            "previous_cursor": previous_cursor,
+            "next_cursor": next_cursor,
+            "products": [
+                product.to_dict_name()
+                if only_name
+                else {
+                    **product.to_dict(
+                        include_dates,
+                        include_ingredients,
+                        include_roles,
+                        include_subcategory,
+                        include_variants,
+                    ),
+                    "locked": (
+                        len([
+                            ing
+                            for ing in product.ingredients
+                            if ing.is_default and ing.max_quantity > ingredient_stock_levels.get(ing.ingredient_id, ing.max_quantity)]
+                        ) > 0
+                    ) if include_locks else None,
+                }
+                for product in products
+            ],
+        },
     )
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Category, Product
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import NotFound
 from backend.models.products import UpdateProductCategoryItem
@@ -15,6 +15,7 @@ update_product_category_router = APIRouter()
     "/{product_id}/category", response_model=BaseResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_product_category(
     product_id: int,
     item: UpdateProductCategoryItem,
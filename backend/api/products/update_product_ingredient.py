@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from tortoise.transactions import in_transaction
 
 from backend.database.models import ProductIngredient
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import NotFound
 from backend.models.products import UpdateProductIngredientItem
@@ -15,6 +15,7 @@ update_product_ingredient_router = APIRouter()
     "/{product_id}/ingredient/{product_ingredient_id}", response_model=BaseResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_product_ingredient(
     product_ingredient_id: int,
     item: UpdateProductIngredientItem,
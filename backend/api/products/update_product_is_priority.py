@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Product
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import NotFound
 from backend.models.products import UpdateProductIsPriorityItem
@@ -15,6 +15,7 @@ update_product_is_priority_router = APIRouter()
     "/{product_id}/priority", response_model=BaseResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_product_is_priority(
     product_id: int,
     item: UpdateProductIsPriorityItem,
@@ -49,4 +49,4 @@ async def add_role_printer(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.ROLE_PRINTER_ALREADY_EXISTS)
 
-    return AddRolePrinterResponse(printer=await new_role_printer.to_dict())
+    return AddRolePrinterResponse(printer=new_role_printer.to_dict())
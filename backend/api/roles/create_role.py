@@ -36,4 +36,4 @@ async def create_role(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.ROLE_ALREADY_EXISTS)
 
-    return CreateRoleResponse(role=RoleModel(**await new_role.to_dict()))
+    return CreateRoleResponse(role=RoleModel(**new_role.to_dict()))
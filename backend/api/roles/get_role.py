@@ -33,5 +33,5 @@ async def get_role(
             raise NotFound(code=ErrorCodes.ROLE_NOT_FOUND)
 
     return GetRoleResponse(
-        **await role.to_dict(include_order_confirmer, include_printers)
+        **role.to_dict(include_order_confirmer, include_printers)
     )
@@ -7,8 +7,17 @@ from backend.database.models import Role
 from backend.decorators import check_role
 from backend.models.error import BadRequest
 from backend.models.roles import GetRolesResponse, Role as RoleModel, RoleName
-from backend.utils import Permission, TokenJwt, validate_token, ErrorCodes
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils import (
+    CountMode,
+    Permission,
+    TokenJwt,
+    validate_token,
+    ErrorCodes,
+)
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
 
 get_roles_router = APIRouter()
 
@@ -22,6 +31,9 @@ get_roles_router = APIRouter()
 async def get_roles(
     offset: int = 0,
     limit: int | None = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
     only_name: bool = False,
     can_order: bool | None = None,
     can_confirm_orders: bool | None = None,
@@ -44,8 +56,20 @@ async def get_roles(
         if can_confirm_orders is not None:
             query &= Q(can_confirm_orders=can_confirm_orders)
 
-        roles_query, total_count, limit = await process_query_with_pagination(
-            Role, query, connection, offset, limit, ""
+        (
+            roles_query,
+            total_count,
+            page_limit,
+        ) = await process_query_with_pagination(
+            Role,
+            query,
+            connection,
+            offset,
+            limit,
+            "",
+            after=after,
+            before=before,
+            count=count,
         )
 
         try:
@@ -54,18 +78,24 @@ async def get_roles(
                     "printers", "order_confirmer"
                 )
                 .offset(offset)
-                .limit(limit)
+                .limit(page_limit)
             )
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+    previous_cursor, next_cursor = get_page_cursors(
+        roles, "", limit, after, before
+    )
+
     return GetRolesResponse(
         total_count=total_count,
+        previous_cursor=previous_cursor,
+        next_cursor=next_cursor,
         roles=[
-            RoleName(**await role.to_dict_name())
+            RoleName(**role.to_dict_name())
             if only_name
             else RoleModel(
-                **await role.to_dict(include_order_confirmer, include_printers)
+                **role.to_dict(include_order_confirmer, include_printers)
             )
             for role in roles
         ],
@@ -20,7 +20,7 @@ async def get_settings(token: TokenJwt = Depends(validate_token)):
         setting = await Setting.first(using_db=connection)
 
     return GetSettingsResponse(
-        settings=Settings(**await setting.to_dict())
+        settings=Settings(**setting.to_dict())
         if token.permissions["can_administer"]
-        else SettingsUser(**await setting.to_dict())
+        else SettingsUser(**setting.to_dict())
     )
@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Subcategory
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models.error import Conflict
 from backend.models.subcategories import (
     CreateSubcategoryItem,
@@ -16,6 +16,7 @@ create_subcategory_router = APIRouter()
 
 @create_subcategory_router.post("/", response_model=CreateSubcategoryResponse)
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def create_subcategory(
     item: CreateSubcategoryItem,
     token: TokenJwt = Depends(validate_token),
@@ -36,5 +37,5 @@ async def create_subcategory(
             raise Conflict(code=ErrorCodes.SUBCATEGORY_ALREADY_EXISTS)
 
     return CreateSubcategoryResponse(
-        subcategory=await new_subcategory.to_dict()
+        subcategory=new_subcategory.to_dict()
     )
@@ -1,28 +1,43 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from tortoise.exceptions import ParamsError
 from tortoise.expressions import Q
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Subcategory
-from backend.decorators import check_role
+from backend.decorators import catalog_etag, check_role
 from backend.models.error import BadRequest
 from backend.models.subcategories import (
     GetSubcategoriesResponse,
     Subcategory as SubcategoryModel,
     SubcategoryName,
 )
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils import (
+    CountMode,
+    ErrorCodes,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
 
 get_subcategories_router = APIRouter()
 
 @get_subcategories_router.get("/", response_model=GetSubcategoriesResponse)
 @check_role(Permission.CAN_ADMINISTER, Permission.CAN_ORDER, Permission.CAN_CONFIRM_ORDERS)
+@catalog_etag()
 async def get_subcategories(
+    response: Response,
     offset: int = 0,
     limit: int | None = None,
     only_name: bool = False,
     order_by: str = None,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
+    if_none_match: str | None = Header(default=None),
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -35,24 +50,38 @@ async def get_subcategories(
         (
             subcategories_query,
             total_count,
-            limit,
+            page_limit,
         ) = await process_query_with_pagination(
-            Subcategory, Q(), connection, offset, limit, order_by
+            Subcategory,
+            Q(),
+            connection,
+            offset,
+            limit,
+            order_by,
+            after=after,
+            before=before,
+            count=count,
         )
 
         try:
             subcategories = await subcategories_query.offset(offset).limit(
-                limit
+                page_limit
             )
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+    previous_cursor, next_cursor = get_page_cursors(
+        subcategories, order_by, limit, after, before
+    )
+
     return GetSubcategoriesResponse(
         total_count=total_count,
+        previous_cursor=previous_cursor,
+        next_cursor=next_cursor,
         subcategories=[
-            SubcategoryName(**await subcategory.to_dict_name())
+            SubcategoryName(**subcategory.to_dict_name())
             if only_name
-            else SubcategoryModel(**await subcategory.to_dict())
+            else SubcategoryModel(**subcategory.to_dict())
             for subcategory in subcategories
         ],
     )
@@ -3,7 +3,7 @@ from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Subcategory
-from backend.decorators import check_role
+from backend.decorators import check_role, invalidate_catalog
 from backend.models import BaseResponse
 from backend.models.error import Conflict, NotFound
 from backend.models.subcategories import UpdateSubcategoryNameItem
@@ -16,6 +16,7 @@ update_subcategory_name_router = APIRouter()
     "/{subcategory_id}/name", response_model=BaseResponse
 )
 @check_role(Permission.CAN_ADMINISTER)
+@invalidate_catalog
 async def update_subcategory_name(
     subcategory_id: int,
     item: UpdateSubcategoryNameItem,
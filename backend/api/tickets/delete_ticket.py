@@ -5,7 +5,15 @@ from backend.database.models import Ticket
 from backend.decorators import check_role
 from backend.models import BaseResponse
 from backend.models.error import NotFound
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.events import publish_order_events
+from backend.services.order_changes import add_order_changes
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
 
 delete_ticket_router = APIRouter()
 
@@ -29,5 +37,8 @@ async def delete_ticket(
             raise NotFound(code=ErrorCodes.TICKET_NOT_FOUND)
 
         await ticket.delete(using_db=connection)
+        await add_order_changes([ticket.order_id], connection)
+
+    await publish_order_events(EventType.ORDER_UPDATED, [ticket.order_id])
 
     return BaseResponse()
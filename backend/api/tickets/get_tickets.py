@@ -1,12 +1,14 @@
+import datetime
+
 from fastapi import APIRouter, Depends, Query
 from tortoise.transactions import in_transaction
 from tortoise.expressions import Q
 
 from backend.database.models import Ticket
-from backend.models.orders import TicketOrder, GetTicketsResponse
-from backend.models.tickets import Ticket as TicketModel
+from backend.models.orders import GetTicketsResponse
 from backend.models.error import NotFound
 from backend.utils import ErrorCodes, TokenJwt, validate_token
+from backend.utils.response_utils import model_response
 
 get_tickets_router = APIRouter()
 
@@ -18,6 +20,8 @@ async def get_tickets(
     is_printed: bool = None,
     is_completed: bool = None,
     categories: list[int] = Query(default=[]),
+    from_date: datetime.datetime | None = None,
+    to_date: datetime.datetime | None = None,
     token: TokenJwt = Depends(validate_token)
 ):
     """
@@ -27,11 +31,11 @@ async def get_tickets(
     async with in_transaction() as connection:
         query = Q(order__is_deleted=False)
 
-        #if from_date is not None:
-        #    query &= Q(order__created_at__ge=from_date)
+        if from_date is not None:
+            query &= Q(order__created_at__gte=from_date)
 
-        #if to_date is not None:
-        #    query &= Q(order__created_at__lt=to_date)
+        if to_date is not None:
+            query &= Q(order__created_at__lt=to_date)
 
         if is_confirmed is not None:
             query &= Q(order__is_confirmed=is_confirmed)
@@ -50,12 +54,13 @@ async def get_tickets(
         if not tickets:
             raise NotFound(code=ErrorCodes.TICKET_NOT_FOUND)
 
-    return GetTicketsResponse(
-        total_count=len(tickets),
-        tickets=[
-            TicketOrder(**await ticket.to_dict_order())
-            if include_order else
-            TicketModel(**await ticket.to_dict())
-            for ticket in tickets
-        ]
+    return model_response(
+        GetTicketsResponse,
+        {
+            "total_count": len(tickets),
+            "tickets": [
+                ticket.to_dict_order() if include_order else ticket.to_dict()
+                for ticket in tickets
+            ],
+        },
     )
@@ -1,25 +1,35 @@
 import datetime
 import pytz
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
 from backend.database.models import Ticket
-from backend.decorators import check_role
+from backend.decorators import check_role, idempotent
 from backend.models import BaseResponse
 from backend.models.error import Conflict, NotFound
 from backend.models.tickets import UpdateTicketCompletedItem
-from backend.utils import ErrorCodes, Permission, TokenJwt, validate_token
+from backend.services.events import publish_ticket_events
+from backend.services.order_changes import add_order_changes
+from backend.utils import (
+    ErrorCodes,
+    EventType,
+    Permission,
+    TokenJwt,
+    validate_token,
+)
 
 update_ticket_completed_router = APIRouter()
 
 
 @update_ticket_completed_router.put("/{ticket_id}/completed", response_model=BaseResponse)
 @check_role(Permission.CAN_ADMINISTER, Permission.CAN_CONFIRM_ORDERS)
+@idempotent
 async def update_ticket_completed(
     ticket_id: int,
     item: UpdateTicketCompletedItem,
+    idempotency_key: str | None = Header(default=None, max_length=64),
     token: TokenJwt = Depends(validate_token)
 ):
     """
@@ -44,4 +54,8 @@ async def update_ticket_completed(
         except IntegrityError:
             raise Conflict(code=ErrorCodes.TICKET_UPDATE_FAILED)
 
+        await add_order_changes([ticket.order_id], connection)
+
+    await publish_ticket_events(EventType.TICKET_COMPLETED, [ticket])
+
     return BaseResponse()
@@ -8,8 +8,17 @@ from backend.database.models import User
 from backend.decorators import check_role
 from backend.models.error import BadRequest
 from backend.models.users import GetUsersResponse
-from backend.utils import Permission, TokenJwt, validate_token, ErrorCodes
-from backend.utils.query_utils import process_query_with_pagination
+from backend.utils import (
+    CountMode,
+    Permission,
+    TokenJwt,
+    validate_token,
+    ErrorCodes,
+)
+from backend.utils.query_utils import (
+    get_page_cursors,
+    process_query_with_pagination,
+)
 
 get_users_router = APIRouter()
 
@@ -19,6 +28,9 @@ get_users_router = APIRouter()
 async def get_users(
     offset: int = 0,
     limit: int = Session.config.DEFAULT_LIMIT_VALUE,
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
     token: TokenJwt = Depends(validate_token),
 ):
     """
@@ -30,15 +42,34 @@ async def get_users(
     async with in_transaction() as connection:
         query = ~Q(id=token.user_id)
 
-        users_query, total_count, limit = await process_query_with_pagination(
-            User, query, connection, offset, limit, ""
+        (
+            users_query,
+            total_count,
+            page_limit,
+        ) = await process_query_with_pagination(
+            User,
+            query,
+            connection,
+            offset,
+            limit,
+            "",
+            after=after,
+            before=before,
+            count=count,
         )
 
         try:
-            users = await users_query.offset(offset).limit(limit)
+            users = await users_query.offset(offset).limit(page_limit)
         except ParamsError:
             raise BadRequest(code=ErrorCodes.INVALID_OFFSET_OR_LIMIT_NEGATIVE)
 
+    previous_cursor, next_cursor = get_page_cursors(
+        users, "", limit, after, before
+    )
+
     return GetUsersResponse(
-        total_count=total_count, users=[await user.to_dict() for user in users]
+        total_count=total_count,
+        previous_cursor=previous_cursor,
+        next_cursor=next_cursor,
+        users=[user.to_dict() for user in users],
     )
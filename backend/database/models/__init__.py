@@ -1,5 +1,7 @@
 __all__ = (
 	"Category",
+    "DailySale",
+    "IdempotencyKey",
 	"Ingredient",
     "Menu",
     "MenuDate",
@@ -7,11 +9,13 @@ __all__ = (
     "MenuFieldProduct",
     "MenuRole",
     "Order",
+    "OrderChange",
     "OrderMenu",
     "OrderMenuField",
     "OrderPrinter",
     "OrderProduct",
     "OrderProductIngredient",
+    "OrderSummary",
 	"PaymentMethod",
     "Printer",
     "Product",
@@ -30,6 +34,8 @@ __all__ = (
 )
 
 from .category import Category
+from .daily_sale import DailySale
+from .idempotency_key import IdempotencyKey
 from .ingredient import Ingredient
 from .menu import Menu
 from .menu_date import MenuDate
@@ -37,11 +43,13 @@ from .menu_field import MenuField
 from .menu_field_product import MenuFieldProduct
 from .menu_role import MenuRole
 from .order import Order
+from .order_change import OrderChange
 from .order_menu import OrderMenu
 from .order_menu_field import OrderMenuField
 from .order_printer import OrderPrinter
 from .order_product import OrderProduct
 from .order_product_ingredient import OrderProductIngredient
+from .order_summary import OrderSummary
 from .payment_method import PaymentMethod
 from .printer import Printer
 from .product import Product
@@ -56,7 +56,7 @@ class Category(Model):
     class Meta:
         table = "category"
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -68,7 +68,7 @@ class Category(Model):
             "parent_for_main_products_id": self.parent_for_main_products_id
         }
 
-    async def to_dict_name(self) -> dict:
+    def to_dict_name(self) -> dict:
         return {
             "id": self.id,
             "name": self.name
@@ -0,0 +1,18 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class DailySale(Model):
+    """
+    The DailySale model
+    """
+
+    id = fields.IntField(pk=True)
+    day = fields.DateField()
+    is_menu = fields.BooleanField(default=False)
+    item_id = fields.IntField()
+    quantity = fields.IntField(default=0)
+
+    class Meta:
+        table = "daily_sale"
+        unique_together = ("day", "is_menu", "item_id")
@@ -0,0 +1,20 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class IdempotencyKey(Model):
+    """
+    The IdempotencyKey model
+    """
+
+    id = fields.IntField(pk=True)
+    key = fields.CharField(64)
+    user_id = fields.IntField()
+    endpoint = fields.CharField(64)
+    fingerprint = fields.CharField(64)
+    response = fields.JSONField()
+    created_at = fields.DatetimeField(auto_now_add=True, index=True)
+
+    class Meta:
+        table = "idempotency_key"
+        unique_together = ("key", "user_id", "endpoint")
@@ -30,7 +30,7 @@ class Ingredient(Model):
     class Meta:
         table = "ingredient"
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -41,7 +41,7 @@ class Ingredient(Model):
             "target_quantity": self.target_quantity,
         }
     
-    async def to_dict_name(self) -> dict:
+    def to_dict_name(self) -> dict:
         return {
             "id": self.id,
             "name": self.name
@@ -25,7 +25,7 @@ class Menu(Model):
     class Meta:
         table = "menu"
 
-    async def to_dict(
+    def to_dict(
         self,
         include_dates: bool = False,
         include_fields: bool = False,
@@ -47,12 +47,12 @@ class Menu(Model):
 
         # Add dates if pre-fetched and requested
         if include_dates and hasattr(self, "dates"):
-            result["dates"] = [await date.to_dict() for date in self.dates]
+            result["dates"] = [date.to_dict() for date in self.dates]
 
         # Add fields if pre-fetched and requested
         if include_fields and hasattr(self, "menu_fields"):
             result["fields"] = [
-                await field.to_dict(
+                field.to_dict(
                     include_fields_products,
                     include_fields_products_dates,
                     include_fields_products_ingredients,
@@ -64,6 +64,6 @@ class Menu(Model):
 
         # Add roles if pre-fetched and requested
         if include_roles and hasattr(self, "roles"):
-            result["roles"] = [await role.to_dict() for role in self.roles]
+            result["roles"] = [role.to_dict() for role in self.roles]
 
         return result
@@ -49,7 +49,7 @@ class MenuDate(Model):
 
         await super().save(*args, **kwargs)
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "start_date": self.start_date,
@@ -33,7 +33,7 @@ class MenuField(Model):
         table = "menu_field"
         unique_together = ("name", "menu_id")
 
-    async def to_dict(
+    def to_dict(
         self,
         include_fields_products: bool = False,
         include_fields_products_dates: bool = False,
@@ -53,7 +53,7 @@ class MenuField(Model):
 
         if include_fields_products and hasattr(self, "field_products"):
             result["products"] = [
-                await product.to_dict(
+                product.to_dict(
                     include_fields_products_dates,
                     include_fields_products_ingredients,
                     include_fields_products_roles,
@@ -28,7 +28,7 @@ class MenuFieldProduct(Model):
         table = "menu_field_product"
         unique_together = ("product_id", "menu_field_id")
 
-    async def to_dict(
+    def to_dict(
         self,
         include_fields_products_dates: bool = False,
         include_fields_products_ingredients: bool = False,
@@ -38,11 +38,11 @@ class MenuFieldProduct(Model):
         return {
             "id": self.id,
             "price": self.price,
-            "product": await self.product.to_dict(
-                include_fields_products_dates,
-                include_fields_products_ingredients,
-                include_fields_products_roles,
-                include_fields_products_variants,
+            "product": self.product.to_dict(
+                include_dates=include_fields_products_dates,
+                include_ingredients=include_fields_products_ingredients,
+                include_roles=include_fields_products_roles,
+                include_variants=include_fields_products_variants,
             ),
             "menu_field_id": self.menu_field_id,
         }
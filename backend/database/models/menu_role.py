@@ -27,7 +27,7 @@ class MenuRole(Model):
         table = "menu_role"
         unique_together = ("role_id", "menu_id")
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "role_id": self.role_id,
@@ -4,7 +4,7 @@ from tortoise import fields
 from tortoise.models import Model
 
 if typing.TYPE_CHECKING:
-    from backend.database.models import OrderMenu, OrderProduct, OrderPrinter, Revision, Ticket
+    from backend.database.models import OrderChange, OrderMenu, OrderProduct, OrderPrinter, OrderSummary, Revision, Ticket
 
 
 class Order(Model):
@@ -56,16 +56,22 @@ class Order(Model):
     user_id: int
     parent_order_id: int
 
+    order_changes: fields.ReverseRelation["OrderChange"]
     order_menus: fields.ReverseRelation["OrderMenu"]
     order_products: fields.ReverseRelation["OrderProduct"]
     order_printers: fields.ReverseRelation["OrderPrinter"]
     order_revisions: fields.ReverseRelation["Revision"]
     order_tickets: fields.ReverseRelation["Ticket"]
+    summary: fields.BackwardOneToOneRelation["OrderSummary"]
 
     class Meta:
         table = "order"
+        indexes = (
+            ("is_deleted", "created_at"),
+            ("is_deleted", "is_confirmed", "is_done"),
+        )
 
-    async def to_dict(
+    def to_dict(
         self,
         include_menus: bool = False,
         include_menus_menu: bool = False,
@@ -113,7 +119,7 @@ class Order(Model):
 
         if include_menus and hasattr(self, "order_menus"):
             result["menus"] = [
-                await menu.to_dict(
+                menu.to_dict(
                     include_menus_menu,
                     include_menus_menu_dates,
                     include_menus_menu_fields,
@@ -132,7 +138,7 @@ class Order(Model):
 
         if include_products and hasattr(self, "order_products"):
             result["products"] = [
-                await product.to_dict(
+                product.to_dict(
                     include_products_product,
                     include_products_product_dates,
                     include_products_product_ingredients,
@@ -145,28 +151,47 @@ class Order(Model):
             ]
 
         if include_payment_method and hasattr(self, "payment_method"):
-            result["payment_method"] = await self.payment_method.to_dict_name()
+            result["payment_method"] = self.payment_method.to_dict_name()
 
         if include_user and hasattr(self, "user"):
-            result["user"] = await self.user.to_dict()
+            result["user"] = self.user.to_dict()
 
         if include_confirmer_user and hasattr(self, "confirmed_by"):
             result["confirmed_by"] = (
-                await self.confirmed_by.to_dict()
+                self.confirmed_by.to_dict()
                 if self.confirmed_by
                 else None
             )
         
         if include_revisions and hasattr(self, "order_revisions"):
             result["revisions"] = [
-                await revision.to_dict()
+                revision.to_dict()
                 for revision in self.order_revisions
             ]
         
         if include_tickets and hasattr(self, "order_tickets"):
             result["tickets"] = [
-                await ticket.to_dict()
+                ticket.to_dict()
                 for ticket in self.order_tickets
             ]
 
         return result
+
+    def to_dict_summary(self) -> dict:
+        summary = self.summary.to_dict() if self.summary else {}
+        return {
+            "id": self.id,
+            "customer": self.customer,
+            "guests": self.guests,
+            "is_take_away": self.is_take_away,
+            "table": self.table,
+            "is_confirmed": self.is_confirmed,
+            "is_done": self.is_done,
+            "is_voucher": self.is_voucher,
+            "is_for_service": self.is_for_service,
+            "has_tickets": self.has_tickets,
+            "price": self.price,
+            "created_at": self.created_at,
+            "confirmed_at": self.confirmed_at,
+            **summary
+        }
@@ -0,0 +1,25 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class OrderChange(Model):
+    """
+    The OrderChange model, the transaction id orders the changes by commit
+    """
+
+    id = fields.BigIntField(pk=True)
+    order = fields.ForeignKeyField(
+        model_name="models.Order",
+        related_name="order_changes",
+        on_delete=fields.CASCADE,
+        on_update=fields.CASCADE
+    )
+    # Id of the transaction that wrote the change, pg_current_xact_id()
+    transaction_id = fields.BigIntField()
+    changed_at = fields.DatetimeField(auto_now_add=True)
+
+    order_id: int
+
+    class Meta:
+        table = "order_change"
+        indexes = (("transaction_id", "order_id"),)
@@ -35,7 +35,7 @@ class OrderMenu(Model):
     class Meta:
         table = "order_menu"
 
-    async def to_dict(
+    def to_dict(
         self,
         include_menu: bool = False,
         include_menu_dates: bool = False,
@@ -58,7 +58,7 @@ class OrderMenu(Model):
         }
 
         if include_menu:
-            result["menu"] = await (await self.menu).to_dict(
+            result["menu"] = self.menu.to_dict(
                 include_menu_dates,
                 include_menu_fields,
                 include_menu_fields_products,
@@ -71,7 +71,7 @@ class OrderMenu(Model):
 
         if include_fields and hasattr(self, "order_menu_fields"):
             result["fields"] = [
-                await field.to_dict(
+                field.to_dict(
                     include_fields_products,
                     include_fields_products_ingredients,
                 )
@@ -34,7 +34,7 @@ class OrderMenuField(Model):
         table = "order_menu_field"
         unique_together = ("order_menu_id", "menu_field_id")
 
-    async def to_dict(
+    def to_dict(
         self,
         include_products: bool = False,
         include_products_ingredients: bool = False,
@@ -47,7 +47,7 @@ class OrderMenuField(Model):
 
         if include_products and hasattr(self, "order_menu_field_products"):
             result["products"] = [
-                await product.to_dict(
+                product.to_dict(
                     include_ingredients=include_products_ingredients
                 )
                 for product in self.order_menu_field_products
@@ -27,7 +27,7 @@ class OrderPrinter(Model):
         table = "order_printer"
         unique_together = ("order_id", "role_printer_id")
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "order_id": self.order_id,
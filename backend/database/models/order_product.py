@@ -58,7 +58,7 @@ class OrderProduct(Model):
     class Meta:
         table = "order_product"
 
-    async def to_dict(
+    def to_dict(
         self,
         include_product: bool = False,
         include_product_dates: bool = False,
@@ -79,16 +79,16 @@ class OrderProduct(Model):
         }
 
         if include_product:
-            result["product"] = await self.product.to_dict(
-                include_product_dates,
-                include_product_ingredients,
-                include_product_roles,
-                include_product_variants,
+            result["product"] = self.product.to_dict(
+                include_dates=include_product_dates,
+                include_ingredients=include_product_ingredients,
+                include_roles=include_product_roles,
+                include_variants=include_product_variants,
             )
 
         if include_ingredients and hasattr(self, "order_product_ingredients"):
             result["ingredients"] = [
-                await ingredient.to_dict()
+                ingredient.to_dict()
                 for ingredient in self.order_product_ingredients
             ]
 
@@ -29,11 +29,11 @@ class OrderProductIngredient(Model):
         table = "order_product_ingredient"
         unique_together = ("order_product_id", "ingredient_id")
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         result = {
             "id": self.id,
             "order_product_id": self.order_product_id,
-            "product_ingredient_id": self.ingredient_id,
+            "ingredient_id": self.ingredient_id,
             "quantity": self.quantity,
         }
 
@@ -0,0 +1,36 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class OrderSummary(Model):
+    """
+    The OrderSummary model, the ticket progress of an order kept up to
+    date by the order writes
+    """
+
+    order = fields.OneToOneField(
+        model_name="models.Order",
+        related_name="summary",
+        pk=True,
+        on_delete=fields.CASCADE,
+        on_update=fields.CASCADE
+    )
+    product_count = fields.IntField(default=0)
+    ticket_count = fields.IntField(default=0)
+    printed_ticket_count = fields.IntField(default=0)
+    completed_ticket_count = fields.IntField(default=0)
+    next_print_at = fields.DatetimeField(null=True, default=None)
+
+    order_id: int
+
+    class Meta:
+        table = "order_summary"
+
+    def to_dict(self) -> dict:
+        return {
+            "product_count": self.product_count,
+            "ticket_count": self.ticket_count,
+            "printed_ticket_count": self.printed_ticket_count,
+            "completed_ticket_count": self.completed_ticket_count,
+            "next_print_at": self.next_print_at
+        }
@@ -15,13 +15,13 @@ class PaymentMethod(Model):
     class Meta:
         table = "payment_method"
 
-    async def to_dict_name(self) -> dict:
+    def to_dict_name(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
         }
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -14,13 +14,13 @@ class Printer(Model):
     class Meta:
         table = "printer"
 
-    async def to_dict_name(self) -> dict:
+    def to_dict_name(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
         }
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -49,7 +49,7 @@ class Product(Model):
     class Meta:
         table = "product"
 
-    async def to_dict_name(self) -> dict:
+    def to_dict_name(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -57,7 +57,7 @@ class Product(Model):
             "frontend_name": self.frontend_name,
         }
 
-    async def to_dict(
+    def to_dict(
         self,
         include_dates: bool = False,
         include_ingredients: bool = False,
@@ -83,27 +83,26 @@ class Product(Model):
 
         # Add dates if pre-fetched and requested
         if include_dates and hasattr(self, "dates"):
-            result["dates"] = [await date.to_dict() for date in self.dates]
+            result["dates"] = [date.to_dict() for date in self.dates]
 
         # Add ingredients if pre-fetched and requested
         if include_ingredients and hasattr(self, "ingredients"):
             result["ingredients"] = [
-                await ingredient.to_dict_name() for ingredient in self.ingredients
+                ingredient.to_dict_name() for ingredient in self.ingredients
             ]
 
         # Add roles if pre-fetched and requested
         if include_roles and hasattr(self, "roles"):
-            result["roles"] = [await role.to_dict() for role in self.roles]
+            result["roles"] = [role.to_dict() for role in self.roles]
 
         # Add subcategory if pre-fetched and requested
         if include_subcategory and hasattr(self, "subcategory"):
-            subcategory = await self.subcategory
-            result["subcategory"] = await subcategory.to_dict()
+            result["subcategory"] = self.subcategory.to_dict()
 
         # Add variants if pre-fetched and requested
         if include_variants and hasattr(self, "variants"):
             result["variants"] = [
-                await variant.to_dict() for variant in self.variants
+                variant.to_dict() for variant in self.variants
             ]
 
         return result
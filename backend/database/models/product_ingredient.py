@@ -32,7 +32,7 @@ class ProductIngredient(Model):
         table = "product_ingredient"
         unique_together = ("product_id", "ingredient_id")
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "product_id": self.product_id,
@@ -42,8 +42,8 @@ class ProductIngredient(Model):
             "is_default": self.is_default
         }
     
-    async def to_dict_name(self):
-        ingredient_name = (await self.ingredient).name if hasattr(self, "ingredient") else None
+    def to_dict_name(self):
+        ingredient_name = self.ingredient.name if hasattr(self, "ingredient") else None
 
         return {
             "id": self.id,
@@ -27,7 +27,7 @@ class ProductRole(Model):
         table = "product_role"
         unique_together = ("role_id", "product_id")
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "role_id": self.role_id,
@@ -24,7 +24,7 @@ class ProductVariant(Model):
         table = "product_variant"
         unique_together = ("name", "product_id")
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "name": self.name,
@@ -29,7 +29,7 @@ class Revision(Model):
     class Meta:
         table = "revision"
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "order_id": self.order_id,
@@ -43,7 +43,7 @@ class Role(Model):
 
         await super().save(*args, **kwargs)
 
-    async def get_permissions(self) -> dict:
+    def get_permissions(self) -> dict:
         return {
             "can_administer": self.can_administer,
             "can_order": self.can_order,
@@ -52,10 +52,10 @@ class Role(Model):
             "can_confirm_orders": self.can_confirm_orders,
         }
 
-    async def to_dict_name(self) -> dict:
+    def to_dict_name(self) -> dict:
         return {"id": self.id, "name": self.name}
 
-    async def to_dict(
+    def to_dict(
         self,
         include_order_confirmer: bool = False,
         include_printers: bool = False,
@@ -63,12 +63,12 @@ class Role(Model):
         result = {
             "id": self.id,
             "name": self.name,
-            "permissions": await self.get_permissions(),
+            "permissions": self.get_permissions(),
         }
 
         if include_order_confirmer and hasattr(self, "order_confirmer"):
             result["order_confirmer"] = (
-                await self.order_confirmer.to_dict()
+                self.order_confirmer.to_dict()
                 if self.order_confirmer
                 else None
             )
@@ -76,7 +76,7 @@ class Role(Model):
         # Add printers if pre-fetched and requested
         if include_printers and hasattr(self, "printers"):
             result["printers"] = [
-                await printer.to_dict() for printer in self.printers
+                printer.to_dict() for printer in self.printers
             ]
 
         return result
@@ -30,7 +30,7 @@ class RolePrinter(Model):
         table = "role_printer"
         unique_together = ("role_id", "printer_id")
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "role_id": self.role_id,
@@ -17,7 +17,7 @@ class Setting(Model):
     class Meta:
         name = "setting"
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "order_requires_confirmation": self.order_requires_confirmation,
             "receipt_header": self.receipt_header,
@@ -23,7 +23,7 @@ class Stock(Model):
     class Meta:
         table = "stock"
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "ingredient_id": self.ingredient_id,
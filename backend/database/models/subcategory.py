@@ -15,14 +15,14 @@ class Subcategory(Model):
     class Meta:
         table = "subcategory"
 
-    async def to_dict_name(self) -> dict:
+    def to_dict_name(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
             "include_cover_charge": self.include_cover_charge,
         }
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -28,8 +28,12 @@ class Ticket(Model):
 
     class Meta:
         table = "ticket"
+        indexes = (
+            ("completed_at", "printed_at", "category_id"),
+            ("order_id", "category_id"),
+        )
 
-    async def to_dict(self) -> dict:
+    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "order_id": self.order_id,
@@ -38,8 +42,8 @@ class Ticket(Model):
             "completed_at": self.completed_at
         }
 
-    async def to_dict_category(self) -> dict:
-        category_name = await self.category.to_dict_name()
+    def to_dict_category(self) -> dict:
+        category_name = self.category.to_dict_name()
         return {
             "id": self.id,
             "category": category_name,
@@ -47,12 +51,12 @@ class Ticket(Model):
             "completed_at": self.completed_at
         }
     
-    async def to_dict_order(self) -> dict:
+    def to_dict_order(self) -> dict:
         return {
             "id": self.id,
             "order_id": self.order_id,
             "category_id": self.category_id,
             "printed_at": self.printed_at,
             "completed_at": self.completed_at,
-            "order": await self.order.to_dict(include_user=True, include_confirmer_user=True)
+            "order": self.order.to_dict(include_user=True, include_confirmer_user=True)
         }
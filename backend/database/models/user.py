@@ -23,7 +23,7 @@ class User(Model):
     class Meta:
         table = "user"
 
-    async def to_dict(self):
+    def to_dict(self):
         return {
             "id": self.id,
             "username": self.username,
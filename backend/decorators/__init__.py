@@ -1,3 +1,13 @@
-__all__ = ("check_role",)
+__all__ = (
+    "catalog_etag",
+    "check_role",
+    "idempotent",
+    "invalidate_catalog",
+    "retry_transaction",
+)
 
+from .catalog_etag import catalog_etag
 from .check_role import check_role
+from .idempotent import idempotent
+from .invalidate_catalog import invalidate_catalog
+from .retry_transaction import retry_transaction
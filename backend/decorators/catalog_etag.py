@@ -0,0 +1,78 @@
+import functools
+import hashlib
+import json
+
+from fastapi import Response, status
+from fastapi.encoders import jsonable_encoder
+
+from backend.services.catalog import get_catalog_state
+from backend.utils import TokenJwt
+
+
+def catalog_etag(*uncached: str):
+    """
+    Answer 304 Not Modified when the catalog shown to the user did not
+    change since the ETag sent in If-None-Match. The endpoint must declare
+    the response parameter and the if_none_match header. Requests with any
+    of the uncached flags set depend on more than the catalog and are
+    always answered in full.
+    """
+
+    def decorator(func):
+        endpoint = func.__module__.rsplit(".", 1)[-1]
+
+        @functools.wraps(func)
+        async def wrapper(
+            *args,
+            token: TokenJwt,
+            response: Response,
+            if_none_match: str | None,
+            **kwargs
+        ):
+            if any(kwargs.get(x) for x in uncached):
+                return await func(
+                    *args,
+                    token=token,
+                    response=response,
+                    if_none_match=if_none_match,
+                    **kwargs,
+                )
+
+            state = await get_catalog_state(token)
+            etag = '"%s"' % hashlib.sha256(
+                json.dumps(
+                    jsonable_encoder([endpoint, state, args, kwargs]),
+                    sort_keys=True,
+                ).encode()
+            ).hexdigest()[:32]
+
+            if if_none_match and (
+                if_none_match.strip() == "*"
+                or etag
+                in (x.strip().removeprefix("W/") for x in if_none_match.split(","))
+            ):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag},
+                )
+
+            response.headers["ETag"] = etag
+
+            result = await func(
+                *args,
+                token=token,
+                response=response,
+                if_none_match=if_none_match,
+                **kwargs,
+            )
+
+            # FastAPI does not copy the headers of the injected response
+            # onto a response returned by the endpoint
+            if isinstance(result, Response):
+                result.headers["ETag"] = etag
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,59 @@
+import functools
+import hashlib
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.models.error import UnprocessableEntity
+from backend.services.idempotency import IdempotencyStore
+from backend.utils import ErrorCodes, TokenJwt
+
+
+def idempotent(func):
+    """
+    Replay the stored response of a request already sent with the same
+    Idempotency-Key. The endpoint must declare the idempotency_key header.
+    """
+
+    endpoint = func.__module__.rsplit(".", 1)[-1]
+
+    @functools.wraps(func)
+    async def wrapper(
+        *args, token: TokenJwt, idempotency_key: str | None, **kwargs
+    ):
+        if not idempotency_key:
+            return await func(
+                *args, token=token, idempotency_key=idempotency_key, **kwargs
+            )
+
+        fingerprint = hashlib.sha256(
+            json.dumps(
+                jsonable_encoder([args, kwargs]), sort_keys=True
+            ).encode()
+        ).hexdigest()
+        scope = (idempotency_key, token.user_id, endpoint)
+
+        # The same key can be retried while the first request is running
+        async with IdempotencyStore.locked(scope):
+            stored = await IdempotencyStore.get(scope)
+
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    raise UnprocessableEntity(
+                        code=ErrorCodes.IDEMPOTENCY_KEY_REUSED,
+                        message="Chiave di idempotenza già usata per una richiesta diversa",
+                    )
+
+                return stored.response
+
+            response = await func(
+                *args, token=token, idempotency_key=idempotency_key, **kwargs
+            )
+
+            await IdempotencyStore.set(
+                scope, fingerprint, jsonable_encoder(response)
+            )
+
+            return response
+
+    return wrapper
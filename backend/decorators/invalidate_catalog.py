@@ -0,0 +1,15 @@
+import functools
+
+from backend.services.catalog import CatalogCache
+
+
+def invalidate_catalog(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            # The endpoint transaction is closed here
+            CatalogCache.invalidate()
+
+    return wrapper
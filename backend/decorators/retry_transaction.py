@@ -0,0 +1,42 @@
+import asyncio
+import functools
+import random
+
+from asyncpg.exceptions import TransactionRollbackError
+from loguru import logger
+
+from backend.services.locking import LockStats
+
+MAX_TRANSACTION_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.05
+
+
+def retry_transaction(func):
+    """
+    Run the endpoint again when its transaction is rolled back by a
+    serialization failure or a deadlock.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        for attempt in range(1, MAX_TRANSACTION_ATTEMPTS + 1):
+            try:
+                return await func(*args, **kwargs)
+            except TransactionRollbackError as e:
+                if attempt == MAX_TRANSACTION_ATTEMPTS:
+                    LockStats.failures += 1
+                    raise
+
+                LockStats.retries += 1
+                logger.warning(
+                    f"Transazione annullata ({e.sqlstate}), "
+                    f"tentativo {attempt + 1} di {MAX_TRANSACTION_ATTEMPTS}."
+                )
+
+                # Full jitter, so that the conflicting tills don't retry
+                # at the same time
+                await asyncio.sleep(
+                    random.uniform(0, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                )
+
+    return wrapper
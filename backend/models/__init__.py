@@ -1,3 +1,3 @@
-__all__ = ("BaseResponse", "UnicornException")
+__all__ = ("BaseResponse", "PaginatedResponse", "UnicornException")
 
-from .base import BaseResponse, UnicornException
+from .base import BaseResponse, PaginatedResponse, UnicornException
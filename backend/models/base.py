@@ -9,6 +9,12 @@ class BaseResponse(BaseModel):
     message: str = ""
 
 
+class PaginatedResponse(BaseResponse):
+    total_count: int | None = None
+    previous_cursor: str | None = None
+    next_cursor: str | None = None
+
+
 class UnicornException(Exception):
     def __init__(
         self,
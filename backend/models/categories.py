@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.utils import validate_name_field, validate_order_field
 
 
@@ -34,8 +34,7 @@ class CreateCategoryResponse(BaseResponse):
     category: Category
 
 
-class GetCategoriesResponse(BaseResponse):
-    total_count: int
+class GetCategoriesResponse(PaginatedResponse):
     categories: list[Category | CategoryName]
 
 
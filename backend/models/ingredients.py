@@ -1,7 +1,7 @@
 import datetime
 from pydantic import BaseModel, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.utils import validate_name_field
 
 
@@ -73,8 +73,7 @@ class GetIngredientStockResponse(BaseResponse, IngredientStock):
     pass
 
 
-class GetIngredientsResponse(BaseResponse):
-    total_count: int
+class GetIngredientsResponse(PaginatedResponse):
     ingredients: list[Ingredient | IngredientName | IngredientStock | IngredientQuantities]
 
 
@@ -2,7 +2,7 @@ import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.models.products import Product
 from backend.utils import validate_name_field, validate_short_name_field
 
@@ -114,8 +114,7 @@ class GetMenuProductsResponse(BaseResponse):
     products: list[Product]
 
 
-class GetMenusResponse(BaseResponse):
-    total_count: int
+class GetMenusResponse(PaginatedResponse):
     menus: list[Menu]
 
 
@@ -3,10 +3,11 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.models.categories import CategoryName
 from backend.models.menu import Menu
 from backend.models.payment_methods import PaymentMethodName
+from backend.models.printers import PrintJob
 from backend.models.products import Product
 from backend.models.tickets import Ticket
 from backend.models.users import User
@@ -123,7 +124,6 @@ class CreateOrderProductItem(BaseModel):
     category_id: int | None = None
 
     _price: Decimal = Decimal("0.00")
-    _has_cover_charge: bool
 
 
 class CreateOrderMenuFieldItem(BaseModel):
@@ -163,19 +163,97 @@ class CreateOrderResponse(BaseResponse):
     order: Order
 
 
+class CreateOrdersItem(BaseModel):
+    orders: list[CreateOrderItem] = Field(min_length=1)
+
+
+class CreateOrdersResult(BaseResponse):
+    index: int
+    order_id: int | None = None
+    price: Decimal | None = None
+
+
+class CreateOrdersResponse(BaseResponse):
+    results: list[CreateOrdersResult]
+
+
+class QuoteOrderProduct(BaseModel):
+    product_id: int
+    variant_id: int | None
+    quantity: int
+    price: Decimal
+
+
+class QuoteOrderMenuField(BaseModel):
+    menu_field_id: int
+    products: list[QuoteOrderProduct]
+
+
+class QuoteOrderMenu(BaseModel):
+    menu_id: int
+    quantity: int
+    price: Decimal
+    fields: list[QuoteOrderMenuField]
+
+
+class QuoteOrderResponse(BaseResponse):
+    price: Decimal
+    cover_charge: Decimal
+    products: list[QuoteOrderProduct]
+    menus: list[QuoteOrderMenu]
+
+
 class GetOrderResponse(BaseResponse, Order):
     pass
 
 
-class GetOrdersResponse(BaseResponse):
-    total_count: int
+class GetOrdersResponse(PaginatedResponse):
+    orders: list[Order]
+
+
+class OrderSummary(BaseModel):
+    id: int
+    customer: str
+    guests: int | None = None
+    is_take_away: bool
+    table: str | None = None
+    is_confirmed: bool
+    is_done: bool
+    is_voucher: bool
+    is_for_service: bool
+    has_tickets: bool
+    price: float
+    created_at: datetime.datetime
+    confirmed_at: datetime.datetime | None = None
+    product_count: int = 0
+    ticket_count: int = 0
+    printed_ticket_count: int = 0
+    completed_ticket_count: int = 0
+    next_print_at: datetime.datetime | None = None
+
+
+class GetOrderSummariesResponse(PaginatedResponse):
+    orders: list[OrderSummary]
+
+
+class SearchOrdersResponse(BaseResponse):
     orders: list[Order]
 
 
+class GetOrderChangesResponse(BaseResponse):
+    last_change_id: int
+    orders: list[Order]
+    deleted_order_ids: list[int]
+
+
 class PrintOrderItem(BaseModel):
     printer_types: list[PrinterType] | None = None
 
 
+class PrintOrderResponse(BaseResponse):
+    job: PrintJob
+
+
 class TicketOrder(BaseModel):
     id: int
     order_id: int
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.utils import validate_name_field, validate_ip_address_field
 
 
@@ -29,8 +29,7 @@ class CreatePaymentMethodResponse(BaseResponse):
     payment_method: PaymentMethod
 
 
-class GetPaymentMethodsResponse(BaseResponse):
-    total_count: int
+class GetPaymentMethodsResponse(PaginatedResponse):
     payment_methods: list[PaymentMethod | PaymentMethodName]
 
 
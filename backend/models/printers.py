@@ -1,7 +1,15 @@
+import datetime
+
 from pydantic import BaseModel, field_validator
 
-from backend.models import BaseResponse
-from backend.utils import validate_name_field, validate_ip_address_field
+from backend.models import BaseResponse, PaginatedResponse
+from backend.utils import (
+    CircuitState,
+    PrinterType,
+    PrintJobStatus,
+    validate_name_field,
+    validate_ip_address_field,
+)
 
 
 class Printer(BaseModel):
@@ -38,8 +46,7 @@ class GetPrinterResponse(BaseResponse, Printer):
     pass
 
 
-class GetPrintersResponse(BaseResponse):
-    total_count: int
+class GetPrintersResponse(PaginatedResponse):
     printers: list[Printer | PrinterName]
 
 
@@ -59,3 +66,34 @@ class UpdatePrinterIpAddressItem(BaseModel):
     @classmethod
     def validate_ip_address_field(cls, ip_address: str):
         return validate_ip_address_field(ip_address)
+
+
+class PrintJob(BaseModel):
+    id: int
+    order_id: int
+    status: PrintJobStatus
+    printer_types: dict[int, list[PrinterType]]
+    failed_printer_ids: list[int]
+    created_at: datetime.datetime
+    completed_at: datetime.datetime | None
+
+
+class GetPrintJobResponse(BaseResponse, PrintJob):
+    pass
+
+
+class PrinterStatus(BaseModel):
+    id: int
+    ip_address: str
+    state: CircuitState
+    queue_size: int
+    consecutive_failures: int
+    failure_count: int
+    success_count: int
+    last_success_at: datetime.datetime | None
+    last_failure_at: datetime.datetime | None
+    retry_at: datetime.datetime | None
+
+
+class GetPrintersStatusResponse(BaseResponse):
+    printers: list[PrinterStatus]
@@ -2,7 +2,7 @@ import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.models.subcategories import Subcategory
 from backend.utils import (
     validate_name_field,
@@ -135,8 +135,7 @@ class GetProductResponse(BaseResponse, Product):
     pass
 
 
-class GetProductsResponse(BaseResponse):
-    total_count: int
+class GetProductsResponse(PaginatedResponse):
     products: list[Product | ProductName]
 
 
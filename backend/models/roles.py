@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pydantic import BaseModel, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.utils import (
     Permission,
     validate_name_field,
@@ -52,8 +52,7 @@ class CreateRoleResponse(BaseResponse):
     role: Role
 
 
-class GetRolesResponse(BaseResponse):
-    total_count: int
+class GetRolesResponse(PaginatedResponse):
     roles: list[Role | RoleName]
 
 
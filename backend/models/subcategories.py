@@ -1,6 +1,6 @@
 from pydantic import BaseModel, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.utils import validate_name_field, validate_order_field
 
 
@@ -30,8 +30,7 @@ class CreateSubcategoryResponse(BaseResponse):
     subcategory: Subcategory
 
 
-class GetSubcategoriesResponse(BaseResponse):
-    total_count: int
+class GetSubcategoriesResponse(PaginatedResponse):
     subcategories: list[Subcategory | SubcategoryName]
 
 
@@ -2,7 +2,7 @@ import datetime
 
 from pydantic import BaseModel, field_validator
 
-from backend.models import BaseResponse
+from backend.models import BaseResponse, PaginatedResponse
 from backend.utils import validate_password_field, validate_username_field
 
 
@@ -13,8 +13,7 @@ class User(BaseModel):
     created_at: datetime.datetime
 
 
-class GetUsersResponse(BaseResponse):
-    total_count: int
+class GetUsersResponse(PaginatedResponse):
     users: list[User]
 
 
@@ -0,0 +1,409 @@
+import asyncio
+import dataclasses
+import datetime
+import secrets
+from collections import defaultdict
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Mapping
+
+from tortoise import connections
+from tortoise.transactions import in_transaction
+
+from backend.database.models import (
+    Category,
+    Menu,
+    MenuDate,
+    MenuField,
+    MenuFieldProduct,
+    MenuRole,
+    Product,
+    ProductDate,
+    ProductIngredient,
+    ProductRole,
+    ProductVariant,
+    Subcategory,
+)
+from backend.database.utils import is_valid_date
+from backend.services.orders import get_today_quantities
+from backend.utils import TokenJwt
+from backend.utils.price_utils import ExactPrice, to_cents, to_exact_price
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogCategory:
+    id: int
+    parent_category_id: int | None
+    parent_for_take_away_id: int | None
+    parent_for_main_products_id: int | None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogVariant:
+    id: int
+    name: str
+    price: float
+    price_cents: int
+    is_deleted: bool
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogIngredient:
+    id: int
+    ingredient_id: int
+    price: Decimal
+    price_cents: int
+    max_quantity: Decimal
+    is_default: bool
+    is_deleted: bool
+    sell_if_stocked: bool
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogProduct:
+    id: int
+    name: str
+    price: float
+    price_cents: int
+    is_main: bool
+    category_id: int
+    subcategory_id: int
+    include_cover_charge: bool
+    daily_max_sales: int | None
+    role_ids: frozenset[int]
+    dates: tuple[tuple[datetime.datetime, datetime.datetime], ...]
+    variants: Mapping[int, CatalogVariant]
+    ingredients: Mapping[int, CatalogIngredient]
+
+    def is_valid_date(self) -> bool:
+        return any(is_valid_date(start, end) for start, end in self.dates)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogMenuFieldProduct:
+    id: int
+    price: float
+    exact_price: ExactPrice
+    product: CatalogProduct
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogMenuField:
+    id: int
+    max_sortable_elements: int
+    additional_cost: float
+    exact_additional_cost: ExactPrice
+    is_optional: bool
+    can_exceed_max_sortable: bool
+    field_products: Mapping[int, CatalogMenuFieldProduct]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogMenu:
+    id: int
+    name: str
+    price: float
+    price_cents: int
+    daily_max_sales: int | None
+    role_ids: frozenset[int]
+    dates: tuple[tuple[datetime.datetime, datetime.datetime], ...]
+    menu_fields: Mapping[int, CatalogMenuField]
+
+    def is_valid_date(self) -> bool:
+        return any(is_valid_date(start, end) for start, end in self.dates)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Catalog:
+    """
+    Immutable, indexed view of the products and menus that can be ordered
+    """
+
+    version: int
+    categories: Mapping[int, CatalogCategory]
+    products: Mapping[int, CatalogProduct]
+    menus: Mapping[int, CatalogMenu]
+
+
+def _group_by(rows: list[dict], key: str) -> dict[int, list[dict]]:
+    result = defaultdict(list)
+
+    for row in rows:
+        result[row[key]].append(row)
+
+    return result
+
+
+async def _load_catalog(version: int) -> Catalog:
+    async with in_transaction() as connection:
+        # All the reads must see the same state of the database
+        await connection.execute_query(
+            "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY;"
+        )
+
+        categories_db = await Category.all().using_db(connection).values(
+            "id",
+            "parent_category_id",
+            "parent_for_take_away_id",
+            "parent_for_main_products_id",
+        )
+        subcategories = dict(
+            await Subcategory.all()
+            .using_db(connection)
+            .values_list("id", "include_cover_charge")
+        )
+        variants = _group_by(
+            await ProductVariant.all()
+            .using_db(connection)
+            .values("id", "name", "price", "is_deleted", "product_id"),
+            "product_id",
+        )
+        ingredients = _group_by(
+            await ProductIngredient.all()
+            .using_db(connection)
+            .values(
+                "id",
+                "ingredient_id",
+                "price",
+                "max_quantity",
+                "is_default",
+                "is_deleted",
+                "product_id",
+                "ingredient__sell_if_stocked",
+            ),
+            "product_id",
+        )
+        product_roles = _group_by(
+            await ProductRole.all()
+            .using_db(connection)
+            .values("role_id", "product_id"),
+            "product_id",
+        )
+        product_dates = _group_by(
+            await ProductDate.all()
+            .using_db(connection)
+            .values("start_date", "end_date", "product_id"),
+            "product_id",
+        )
+        products_db = await Product.all().using_db(connection).values(
+            "id",
+            "name",
+            "price",
+            "is_main",
+            "category_id",
+            "subcategory_id",
+            "daily_max_sales",
+        )
+
+        menu_roles = _group_by(
+            await MenuRole.all().using_db(connection).values("role_id", "menu_id"),
+            "menu_id",
+        )
+        menu_dates = _group_by(
+            await MenuDate.all()
+            .using_db(connection)
+            .values("start_date", "end_date", "menu_id"),
+            "menu_id",
+        )
+        field_products = _group_by(
+            await MenuFieldProduct.all()
+            .using_db(connection)
+            .values("id", "price", "product_id", "menu_field_id"),
+            "menu_field_id",
+        )
+        menu_fields = _group_by(
+            await MenuField.all()
+            .using_db(connection)
+            .values(
+                "id",
+                "max_sortable_elements",
+                "additional_cost",
+                "is_optional",
+                "can_exceed_max_sortable",
+                "menu_id",
+            ),
+            "menu_id",
+        )
+        menus_db = await Menu.all().using_db(connection).values(
+            "id", "name", "price", "daily_max_sales"
+        )
+
+    categories = {x["id"]: CatalogCategory(**x) for x in categories_db}
+
+    products = {}
+    for product in products_db:
+        product_id = product["id"]
+
+        products[product_id] = CatalogProduct(
+            id=product_id,
+            name=product["name"],
+            price=product["price"],
+            price_cents=to_cents(product["price"]),
+            is_main=product["is_main"],
+            category_id=product["category_id"],
+            subcategory_id=product["subcategory_id"],
+            include_cover_charge=subcategories[product["subcategory_id"]],
+            daily_max_sales=product["daily_max_sales"],
+            role_ids=frozenset(
+                x["role_id"] for x in product_roles[product_id]
+            ),
+            dates=tuple(
+                (x["start_date"], x["end_date"])
+                for x in product_dates[product_id]
+            ),
+            variants=MappingProxyType(
+                {
+                    x["id"]: CatalogVariant(
+                        id=x["id"],
+                        name=x["name"],
+                        price=x["price"],
+                        price_cents=to_cents(x["price"]),
+                        is_deleted=x["is_deleted"],
+                    )
+                    for x in variants[product_id]
+                }
+            ),
+            ingredients=MappingProxyType(
+                {
+                    x["ingredient_id"]: CatalogIngredient(
+                        id=x["id"],
+                        ingredient_id=x["ingredient_id"],
+                        price=x["price"],
+                        price_cents=to_cents(x["price"]),
+                        max_quantity=x["max_quantity"],
+                        is_default=x["is_default"],
+                        is_deleted=x["is_deleted"],
+                        sell_if_stocked=x["ingredient__sell_if_stocked"],
+                    )
+                    for x in ingredients[product_id]
+                }
+            ),
+        )
+
+    menus = {}
+    for menu in menus_db:
+        menu_id = menu["id"]
+
+        menus[menu_id] = CatalogMenu(
+            id=menu_id,
+            name=menu["name"],
+            price=menu["price"],
+            price_cents=to_cents(menu["price"]),
+            daily_max_sales=menu["daily_max_sales"],
+            role_ids=frozenset(x["role_id"] for x in menu_roles[menu_id]),
+            dates=tuple(
+                (x["start_date"], x["end_date"]) for x in menu_dates[menu_id]
+            ),
+            menu_fields=MappingProxyType(
+                {
+                    field["id"]: CatalogMenuField(
+                        id=field["id"],
+                        max_sortable_elements=field["max_sortable_elements"],
+                        additional_cost=field["additional_cost"],
+                        exact_additional_cost=to_exact_price(
+                            field["additional_cost"]
+                        ),
+                        is_optional=field["is_optional"],
+                        can_exceed_max_sortable=field[
+                            "can_exceed_max_sortable"
+                        ],
+                        field_products=MappingProxyType(
+                            {
+                                x["product_id"]: CatalogMenuFieldProduct(
+                                    id=x["id"],
+                                    price=x["price"],
+                                    exact_price=to_exact_price(x["price"]),
+                                    product=products[x["product_id"]],
+                                )
+                                for x in field_products[field["id"]]
+                            }
+                        ),
+                    )
+                    for field in menu_fields[menu_id]
+                }
+            ),
+        )
+
+    return Catalog(
+        version=version,
+        categories=MappingProxyType(categories),
+        products=MappingProxyType(products),
+        menus=MappingProxyType(menus),
+    )
+
+
+class CatalogCache:
+    """
+    Process-wide catalog snapshot, rebuilt lazily after every admin write
+    """
+
+    _catalog: Catalog | None = None
+    _version: int = 0
+    _lock: asyncio.Lock = asyncio.Lock()
+    # Versions of different processes are not comparable
+    _instance: str = secrets.token_hex(8)
+
+    @classmethod
+    def version(cls) -> int:
+        return cls._version
+
+    @classmethod
+    def instance(cls) -> str:
+        return cls._instance
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._version += 1
+
+    @classmethod
+    async def get(cls) -> Catalog:
+        catalog = cls._catalog
+        if catalog is not None and catalog.version == cls._version:
+            return catalog
+
+        async with cls._lock:
+            # A write may commit while the snapshot is being loaded
+            while cls._catalog is None or cls._catalog.version != cls._version:
+                cls._catalog = await _load_catalog(cls._version)
+
+            return cls._catalog
+
+
+async def get_catalog_state(token: TokenJwt) -> tuple:
+    """
+    State of the catalog as shown to the user: besides the catalog version,
+    the users that are not admins only see what is on sale right now.
+    """
+
+    catalog = await CatalogCache.get()
+    is_admin = token.permissions["can_administer"]
+    state = (CatalogCache.instance(), catalog.version, token.role_id, is_admin)
+
+    if is_admin:
+        return state
+
+    products = [x for x in catalog.products.values() if x.is_valid_date()]
+    menus = [x for x in catalog.menus.values() if x.is_valid_date()]
+
+    connection = connections.get("default")
+    product_quantities = await get_today_quantities(
+        {x.id for x in products if x.daily_max_sales}, connection
+    )
+    menu_quantities = await get_today_quantities(
+        {x.id for x in menus if x.daily_max_sales}, connection, True
+    )
+
+    return state + (
+        sorted(
+            x.id
+            for x in products
+            if not x.daily_max_sales
+            or product_quantities.get(x.id, 0) < x.daily_max_sales
+        ),
+        sorted(
+            x.id
+            for x in menus
+            if not x.daily_max_sales
+            or menu_quantities.get(x.id, 0) < x.daily_max_sales
+        ),
+    )
@@ -0,0 +1,186 @@
+import asyncio
+import collections
+import dataclasses
+import secrets
+from typing import AsyncIterator, Callable, Iterable
+
+from backend.database.models import Order, Ticket
+from backend.utils import EventType
+
+MAX_BUFFERED_EVENTS = 1024
+MAX_QUEUED_EVENTS = 256
+HEARTBEAT_INTERVAL = 15
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Event:
+    type: EventType
+    data: dict
+    order_id: int | None = None
+    # Role of the user who created the order
+    role_id: int | None = None
+    category_ids: frozenset[int] = frozenset()
+    id: int = 0
+
+
+class EventBus:
+    """
+    In-process stream of the order and ticket events. The latest events
+    are kept to resume a subscription after a reconnection.
+    """
+
+    # Event ids restart with the process, so a resume token names it
+    _instance = secrets.token_hex(8)
+    _last_id = 0
+    _events: collections.deque[Event] = collections.deque(
+        maxlen=MAX_BUFFERED_EVENTS
+    )
+    _subscribers: set[asyncio.Queue] = set()
+    _listeners: list[Callable[[Event], None]] = []
+
+    @classmethod
+    def add_listener(cls, listener: Callable[[Event], None]) -> None:
+        """
+        Call the listener with every event, as soon as it is published
+        """
+
+        cls._listeners.append(listener)
+
+    @classmethod
+    def get_resume_token(cls, event_id: int | None = None) -> str:
+        return "%s-%d" % (
+            cls._instance,
+            cls._last_id if event_id is None else event_id,
+        )
+
+    @classmethod
+    def publish(cls, events: Iterable[Event]) -> None:
+        for event in events:
+            cls._last_id += 1
+            event = dataclasses.replace(event, id=cls._last_id)
+            cls._events.append(event)
+
+            for listener in cls._listeners:
+                listener(event)
+
+            for queue in list(cls._subscribers):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # A subscriber too slow is closed, it resumes on reconnect
+                    cls._subscribers.discard(queue)
+
+                    while not queue.empty():
+                        queue.get_nowait()
+
+                    queue.put_nowait(None)
+
+    @classmethod
+    def _get_missed_events(cls, resume_token: str | None) -> list[Event]:
+        instance, _, last_id = (resume_token or "").partition("-")
+
+        if instance == cls._instance and last_id.isdigit():
+            last_id = int(last_id)
+            first_id = cls._events[0].id if cls._events else cls._last_id + 1
+
+            if first_id - 1 <= last_id <= cls._last_id:
+                return [x for x in cls._events if x.id > last_id]
+
+        # Some events are lost: the subscriber must reload everything
+        return [Event(type=EventType.RESET, data={}, id=cls._last_id)]
+
+    @classmethod
+    async def subscribe(
+        cls, resume_token: str | None = None
+    ) -> AsyncIterator[Event | None]:
+        """
+        Yield the events published after the resume token, or a reset
+        event when they are no longer available, then the new ones. None
+        is yielded when nothing is published for a while, with every
+        event up to get_resume_token() already yielded.
+        """
+
+        queue = asyncio.Queue(MAX_QUEUED_EVENTS)
+        missed = cls._get_missed_events(resume_token)
+        cls._subscribers.add(queue)
+
+        try:
+            for event in missed:
+                yield event
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                if event is None:
+                    return
+
+                yield event
+        finally:
+            cls._subscribers.discard(queue)
+
+
+async def publish_order_events(
+    event_type: EventType, order_ids: Iterable[int]
+) -> None:
+    """
+    Publish an event with the current state of every given order. It must
+    be called after the transaction changing the orders is committed.
+    """
+
+    order_ids = sorted(set(order_ids))
+    if not order_ids:
+        return
+
+    orders = (
+        await Order.filter(id__in=order_ids)
+        .select_related("user")
+        .prefetch_related("order_tickets")
+    )
+
+    EventBus.publish(
+        Event(
+            type=event_type,
+            data={**order.to_dict(), "is_deleted": order.is_deleted},
+            order_id=order.id,
+            role_id=order.user.role_id,
+            category_ids=frozenset(
+                x.category_id for x in order.order_tickets
+            ),
+        )
+        for order in orders
+    )
+
+
+async def publish_ticket_events(
+    event_type: EventType, tickets: list[Ticket]
+) -> None:
+    """
+    Publish an event with the state of every given ticket. It must be
+    called after the transaction changing the tickets is committed.
+    """
+
+    if not tickets:
+        return
+
+    role_ids = dict(
+        await Order.filter(
+            id__in={x.order_id for x in tickets}
+        ).values_list("id", "user__role_id")
+    )
+
+    EventBus.publish(
+        Event(
+            type=event_type,
+            data=ticket.to_dict(),
+            order_id=ticket.order_id,
+            role_id=role_ids.get(ticket.order_id),
+            category_ids=frozenset((ticket.category_id,)),
+        )
+        for ticket in tickets
+    )
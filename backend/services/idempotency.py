@@ -0,0 +1,128 @@
+import asyncio
+import contextlib
+import dataclasses
+import datetime
+import time
+from collections import OrderedDict
+
+from tortoise import timezone
+
+from backend.database.models import IdempotencyKey
+
+IDEMPOTENCY_TTL = datetime.timedelta(hours=24)
+MAX_CACHED_KEYS = 4096
+
+# (key, user id, endpoint)
+Scope = tuple[str, int, str]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StoredResponse:
+    fingerprint: str
+    response: dict | list | None
+    expires_at: float
+
+
+class IdempotencyStore:
+    """
+    Responses of the requests sent with an Idempotency-Key, kept in memory
+    and in the database until they expire
+    """
+
+    _responses: OrderedDict[Scope, StoredResponse] = OrderedDict()
+    # Lock of every key in use, with the number of requests using it
+    _locks: dict[Scope, tuple[asyncio.Lock, int]] = {}
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def locked(cls, scope: Scope):
+        lock, users = cls._locks.get(scope, (asyncio.Lock(), 0))
+        cls._locks[scope] = (lock, users + 1)
+
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = cls._locks[scope]
+
+            if users == 1:
+                del cls._locks[scope]
+            else:
+                cls._locks[scope] = (lock, users - 1)
+
+    @classmethod
+    def _evict(cls) -> None:
+        # Every entry has the same TTL, so the oldest ones expire first
+        now = time.monotonic()
+
+        while cls._responses:
+            scope, stored = next(iter(cls._responses.items()))
+            if (
+                stored.expires_at > now
+                and len(cls._responses) <= MAX_CACHED_KEYS
+            ):
+                break
+
+            del cls._responses[scope]
+
+    @classmethod
+    def _cache(cls, scope: Scope, fingerprint: str, response, age: float):
+        cls._responses[scope] = StoredResponse(
+            fingerprint=fingerprint,
+            response=response,
+            expires_at=(
+                time.monotonic() + IDEMPOTENCY_TTL.total_seconds() - age
+            ),
+        )
+        cls._evict()
+
+    @classmethod
+    async def get(cls, scope: Scope) -> StoredResponse | None:
+        cls._evict()
+
+        stored = cls._responses.get(scope)
+        if stored is not None and stored.expires_at > time.monotonic():
+            return stored
+
+        key, user_id, endpoint = scope
+        stored_db = await IdempotencyKey.get_or_none(
+            key=key,
+            user_id=user_id,
+            endpoint=endpoint,
+            created_at__gt=timezone.now() - IDEMPOTENCY_TTL,
+        )
+
+        if stored_db is None:
+            return None
+
+        cls._cache(
+            scope,
+            stored_db.fingerprint,
+            stored_db.response,
+            (timezone.now() - stored_db.created_at).total_seconds(),
+        )
+
+        return cls._responses.get(scope)
+
+    @classmethod
+    async def set(cls, scope: Scope, fingerprint: str, response) -> None:
+        key, user_id, endpoint = scope
+
+        await IdempotencyKey.update_or_create(
+            key=key,
+            user_id=user_id,
+            endpoint=endpoint,
+            defaults={
+                "fingerprint": fingerprint,
+                "response": response,
+                "created_at": timezone.now(),
+            },
+        )
+
+        cls._cache(scope, fingerprint, response, 0)
+
+    @classmethod
+    async def purge(cls) -> None:
+        await IdempotencyKey.filter(
+            created_at__lte=timezone.now() - IDEMPOTENCY_TTL
+        ).delete()
@@ -0,0 +1,79 @@
+import enum
+import time
+
+from tortoise import BaseDBAsyncClient
+
+from backend.models.orders import CreateOrderItem
+from backend.services.catalog import Catalog
+
+
+class LockScope(enum.IntEnum):
+    PRODUCT_SALES = 1
+    MENU_SALES = 2
+    INGREDIENT_STOCK = 3
+
+
+class LockStats:
+    """
+    Process-wide counters of the order transactions contention
+    """
+
+    retries: int = 0
+    failures: int = 0
+    locks: int = 0
+    lock_wait: float = 0.0
+
+
+def get_order_lock_keys(
+    item: CreateOrderItem, catalog: Catalog
+) -> set[tuple[int, int]]:
+    """
+    Collect the limited counters and the stocked ingredients touched by an
+    order. Unknown ids are skipped, the order checks will reject them.
+    """
+
+    keys = set()
+    products = [product.product_id for product in item.products]
+
+    for menu in item.menus:
+        menu_db = catalog.menus.get(menu.menu_id)
+        if menu_db and menu_db.daily_max_sales is not None:
+            keys.add((LockScope.MENU_SALES, menu.menu_id))
+
+        for field in menu.fields:
+            products.extend(product.product_id for product in field.products)
+
+    for product_id in products:
+        product_db = catalog.products.get(product_id)
+        if not product_db:
+            continue
+
+        if product_db.daily_max_sales is not None:
+            keys.add((LockScope.PRODUCT_SALES, product_id))
+
+        for ingredient in product_db.ingredients.values():
+            if ingredient.sell_if_stocked and not ingredient.is_deleted:
+                keys.add(
+                    (LockScope.INGREDIENT_STOCK, ingredient.ingredient_id)
+                )
+
+    return keys
+
+
+async def acquire_locks(
+    keys: set[tuple[int, int]], connection: BaseDBAsyncClient
+):
+    """
+    Take transaction-level advisory locks, always in the same order so
+    that two transactions can't wait on each other.
+    """
+
+    start = time.perf_counter()
+
+    for scope, item_id in sorted(keys):
+        await connection.execute_query(
+            "SELECT pg_advisory_xact_lock($1, $2)", [int(scope), item_id]
+        )
+
+    LockStats.locks += len(keys)
+    LockStats.lock_wait += time.perf_counter() - start
@@ -0,0 +1,51 @@
+import datetime
+from typing import Iterable
+
+from tortoise import BaseDBAsyncClient, timezone
+
+from backend.database.models import OrderChange
+from backend.services.orders import refresh_order_summaries
+
+ORDER_CHANGE_TTL = datetime.timedelta(days=7)
+
+
+async def add_order_changes(
+    order_ids: Iterable[int], connection: BaseDBAsyncClient
+) -> None:
+    """
+    Record a change of the given orders and refresh their summary. The
+    change carries the id of its transaction, so the feed can serve only
+    the changes of the transactions already finished.
+    """
+
+    order_ids = sorted(set(order_ids))
+    if not order_ids:
+        return
+
+    await refresh_order_summaries(order_ids, connection)
+    await connection.execute_query(
+        """
+        INSERT INTO order_change (order_id, transaction_id, changed_at)
+        SELECT unnest($1::int[]), pg_current_xact_id()::text::bigint, now()
+        """,
+        [order_ids],
+    )
+
+
+async def get_finished_transaction_id(connection: BaseDBAsyncClient) -> int:
+    """
+    Lowest transaction id still running: the transactions before it are
+    all finished, the ones committing later have this id or a higher one
+    """
+
+    result = await connection.execute_query_dict(
+        "SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint AS id"
+    )
+
+    return result[0]["id"]
+
+
+async def purge_order_changes() -> None:
+    await OrderChange.filter(
+        changed_at__lte=timezone.now() - ORDER_CHANGE_TTL
+    ).delete()
@@ -0,0 +1,188 @@
+import asyncio
+import datetime
+import re
+import unicodedata
+from collections import defaultdict
+
+from backend.database.models import Order
+from backend.services.events import Event, EventBus
+from backend.utils import EventType
+from backend.utils.datetime_utils import get_day_bounds, get_service_day
+
+MIN_SIMILARITY = 0.3
+
+ORDER_EVENTS = (
+    EventType.ORDER_CREATED,
+    EventType.ORDER_UPDATED,
+    EventType.ORDER_CONFIRMED,
+    EventType.ORDER_DELETED,
+)
+
+
+def normalize(text: str | None) -> str:
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(x for x in text if not unicodedata.combining(x))
+
+    return " ".join(text.casefold().split())
+
+
+def get_trigrams(text: str) -> frozenset[str]:
+    """
+    Trigrams of the words of a normalized text, padded as pg_trgm does
+    """
+
+    trigrams = set()
+    for word in re.findall(r"\w+", text):
+        word = "  " + word + " "
+        trigrams.update(word[i:i + 3] for i in range(len(word) - 2))
+
+    return frozenset(trigrams)
+
+
+class OrderSearchIndex:
+    """
+    In-memory trigram index of the customer and table of the orders of
+    the service day, kept up to date by the order events
+    """
+
+    _day: datetime.date | None = None
+    # Order id -> (customer, table, trigrams)
+    _orders: dict[int, tuple[str, str, frozenset[str]]] = {}
+    _trigrams: defaultdict[str, set[int]] = defaultdict(set)
+    # Events published while the index is loaded
+    _pending: list[Event] | None = None
+    _lock = asyncio.Lock()
+
+    @classmethod
+    def _add(cls, order_id: int, customer: str, table: str | None) -> None:
+        cls._remove(order_id)
+
+        customer, table = normalize(customer), normalize(table)
+        trigrams = get_trigrams(customer) | get_trigrams(table)
+        cls._orders[order_id] = (customer, table, trigrams)
+
+        for trigram in trigrams:
+            cls._trigrams[trigram].add(order_id)
+
+    @classmethod
+    def _remove(cls, order_id: int) -> None:
+        entry = cls._orders.pop(order_id, None)
+        if entry is None:
+            return
+
+        for trigram in entry[2]:
+            order_ids = cls._trigrams[trigram]
+            order_ids.discard(order_id)
+
+            if not order_ids:
+                del cls._trigrams[trigram]
+
+    @classmethod
+    def apply(cls, event: Event) -> None:
+        if event.type not in ORDER_EVENTS:
+            return
+
+        if cls._pending is not None:
+            cls._pending.append(event)
+            return
+
+        if cls._day is None:
+            return
+
+        if (
+            event.data["is_deleted"]
+            or get_service_day(event.data["created_at"]) != cls._day
+        ):
+            cls._remove(event.order_id)
+        else:
+            cls._add(
+                event.order_id, event.data["customer"], event.data["table"]
+            )
+
+    @classmethod
+    async def _load(cls) -> None:
+        day = get_service_day()
+        if cls._day == day:
+            return
+
+        async with cls._lock:
+            if cls._day == day:
+                return
+
+            cls._pending = []
+
+            try:
+                start, end = get_day_bounds(day)
+                orders = await Order.filter(
+                    is_deleted=False, created_at__gte=start, created_at__lt=end
+                ).values_list("id", "customer", "table")
+            except BaseException:
+                cls._pending = None
+                raise
+
+            cls._day = day
+            cls._orders = {}
+            cls._trigrams = defaultdict(set)
+
+            for order_id, customer, table in orders:
+                cls._add(order_id, customer, table)
+
+            # The events are newer than the loaded orders
+            pending, cls._pending = cls._pending, None
+            for event in pending:
+                cls.apply(event)
+
+    @classmethod
+    async def search(cls, text: str, limit: int) -> list[int]:
+        """
+        Ids of the orders of the service day matching the text, best match
+        first: same table, customer starting with the text, a word of the
+        customer starting with it, table starting with it, customer
+        containing it, and then customers similar to it.
+        """
+
+        await cls._load()
+
+        text = normalize(text)
+        trigrams = get_trigrams(text)
+        if not trigrams:
+            return []
+
+        if len(text) < 3:
+            # The padded trigrams of a shorter text only match the start
+            # and the end of the words, so the orders of the day are
+            # scanned to find it in the middle of a word too
+            candidates = cls._orders.keys()
+        else:
+            candidates = set()
+            for trigram in trigrams:
+                candidates |= cls._trigrams.get(trigram, set())
+
+        results = []
+        for order_id in candidates:
+            customer, table, order_trigrams = cls._orders[order_id]
+            similarity = len(trigrams & order_trigrams) / len(
+                trigrams | order_trigrams
+            )
+
+            if table == text:
+                rank = 0
+            elif customer.startswith(text):
+                rank = 1
+            elif any(x.startswith(text) for x in customer.split()):
+                rank = 2
+            elif table.startswith(text):
+                rank = 3
+            elif text in customer:
+                rank = 4
+            elif similarity >= MIN_SIMILARITY:
+                rank = 5
+            else:
+                continue
+
+            results.append((rank, -similarity, -order_id))
+
+        return [-x[2] for x in sorted(results)[:limit]]
+
+
+EventBus.add_listener(OrderSearchIndex.apply)
@@ -1,9 +1,11 @@
+import datetime
 from collections import defaultdict
 
 from tortoise import BaseDBAsyncClient
 
-from backend.database.models import OrderMenu, OrderProduct
-from backend.utils.datetime_utils import get_day_bounds
+from backend.database.models import DailySale, Order, OrderMenu, OrderProduct
+from backend.models.orders import CreateOrderItem
+from backend.utils.datetime_utils import get_day_bounds, get_service_day
 
 
 async def get_today_quantities(
@@ -11,22 +13,233 @@ async def get_today_quantities(
     connection: BaseDBAsyncClient,
     is_menu: bool = False,
 ) -> dict[int, int]:
-    start_of_day, end_of_day = get_day_bounds()
+    if not ids:
+        return {}
 
-    field_name = "menu_id" if is_menu else "product_id"
-    model = OrderMenu if is_menu else OrderProduct
+    return dict(
+        await DailySale.filter(
+            day=get_service_day(), is_menu=is_menu, item_id__in=ids
+        )
+        .using_db(connection)
+        .values_list("item_id", "quantity")
+    )
 
-    filter_kwargs = {
-        f"{field_name}__in": ids,
-        "order__created_at__gte": start_of_day,
-        "order__created_at__lt": end_of_day,
-    }
 
-    order_items = await model.filter(**filter_kwargs).using_db(connection)
+async def get_today_quantity(
+    item_id: int,
+    connection: BaseDBAsyncClient,
+    is_menu: bool = False,
+) -> int:
+    quantity = (
+        await DailySale.filter(
+            day=get_service_day(), is_menu=is_menu, item_id=item_id
+        )
+        .using_db(connection)
+        .first()
+        .values_list("quantity", flat=True)
+    )
+
+    return quantity or 0
+
+
+async def add_daily_sales(
+    day: datetime.date,
+    product_quantities: dict[int, int],
+    menu_quantities: dict[int, int],
+    connection: BaseDBAsyncClient,
+):
+    rows = [
+        (False, item_id, quantity)
+        for item_id, quantity in product_quantities.items()
+        if quantity
+    ] + [
+        (True, item_id, quantity)
+        for item_id, quantity in menu_quantities.items()
+        if quantity
+    ]
+
+    if not rows:
+        return
+
+    placeholders = []
+    values = [day]
+    for row in rows:
+        placeholders.append(
+            f"($1, ${len(values) + 1}, ${len(values) + 2}, ${len(values) + 3})"
+        )
+        values.extend(row)
+
+    await connection.execute_query(
+        f"""
+        INSERT INTO daily_sale (day, is_menu, item_id, quantity)
+        VALUES {", ".join(placeholders)}
+        ON CONFLICT (day, is_menu, item_id)
+        DO UPDATE SET quantity = daily_sale.quantity + EXCLUDED.quantity
+        """,
+        values,
+    )
+
+
+def get_order_item_quantities(
+    item: CreateOrderItem,
+) -> tuple[dict[int, int], dict[int, int]]:
+    product_quantities = defaultdict(int)
+    menu_quantities = defaultdict(int)
+
+    for product in item.products:
+        product_quantities[product.product_id] += product.quantity
+
+    for menu in item.menus:
+        menu_quantities[menu.menu_id] += menu.quantity
+
+        for field in menu.fields:
+            for product in field.products:
+                product_quantities[product.product_id] += product.quantity
+
+    return dict(product_quantities), dict(menu_quantities)
+
+
+async def update_order_daily_sales(
+    order: Order,
+    connection: BaseDBAsyncClient,
+    sign: int = 1,
+):
+    """
+    Add (or remove, with a negative sign) the quantities of an order
+    already stored in the database to the counters of its service day.
+    """
+
+    product_quantities = defaultdict(int)
+    menu_quantities = defaultdict(int)
+
+    for product_id, quantity in (
+        await OrderProduct.filter(order_id=order.id)
+        .using_db(connection)
+        .values_list("product_id", "quantity")
+    ):
+        product_quantities[product_id] += sign * quantity
+
+    for menu_id, quantity in (
+        await OrderMenu.filter(order_id=order.id)
+        .using_db(connection)
+        .values_list("menu_id", "quantity")
+    ):
+        menu_quantities[menu_id] += sign * quantity
+
+    await add_daily_sales(
+        get_service_day(order.created_at),
+        product_quantities,
+        menu_quantities,
+        connection,
+    )
+
+
+async def rebuild_daily_sales(
+    connection: BaseDBAsyncClient,
+    day: datetime.date = None,
+):
+    """
+    Recompute the counters of a service day from the order rows.
+    """
+
+    day = day or get_service_day()
+    start_of_day, end_of_day = get_day_bounds(day)
+
+    await DailySale.filter(day=day).using_db(connection).delete()
+
+    await connection.execute_query(
+        """
+        INSERT INTO daily_sale (day, is_menu, item_id, quantity)
+        SELECT $1::date, FALSE, op.product_id, SUM(op.quantity)
+        FROM order_product op
+        JOIN "order" o ON o.id = op.order_id
+        WHERE o.created_at >= $2 AND o.created_at < $3 AND NOT o.is_deleted
+        GROUP BY op.product_id
+        UNION ALL
+        SELECT $1::date, TRUE, om.menu_id, SUM(om.quantity)
+        FROM order_menu om
+        JOIN "order" o ON o.id = om.order_id
+        WHERE o.created_at >= $2 AND o.created_at < $3 AND NOT o.is_deleted
+        GROUP BY om.menu_id
+        """,
+        [day, start_of_day, end_of_day],
+    )
+
+
+async def refresh_order_summaries(
+    order_ids: list[int],
+    connection: BaseDBAsyncClient,
+):
+    """
+    Recompute the summary of the given orders from their rows. A ticket is
+    due when its order is confirmed, or its parent ticket completed, plus
+    the print delay of its category.
+    """
+
+    if not order_ids:
+        return
+
+    await connection.execute_query(
+        """
+        INSERT INTO order_summary (
+            order_id,
+            product_count,
+            ticket_count,
+            printed_ticket_count,
+            completed_ticket_count,
+            next_print_at
+        )
+        SELECT
+            o.id,
+            COALESCE(p.quantity, 0),
+            COUNT(t.id),
+            COUNT(t.printed_at),
+            COUNT(t.completed_at),
+            MIN(
+                CASE WHEN t.printed_at IS NULL AND t.completed_at IS NULL THEN
+                    CASE WHEN c.wait_parent_category
+                        THEN pt.completed_at
+                        ELSE o.confirmed_at
+                    END + make_interval(secs => c.print_delay)
+                END
+            )
+        FROM "order" o
+        LEFT JOIN (
+            SELECT order_id, SUM(quantity) AS quantity
+            FROM order_product
+            WHERE order_id = ANY($1::int[])
+            GROUP BY order_id
+        ) p ON p.order_id = o.id
+        LEFT JOIN ticket t ON t.order_id = o.id
+        LEFT JOIN category c ON c.id = t.category_id
+        LEFT JOIN LATERAL (
+            SELECT completed_at
+            FROM ticket
+            WHERE order_id = o.id AND category_id = c.parent_category_id
+            LIMIT 1
+        ) pt ON TRUE
+        WHERE o.id = ANY($1::int[])
+        GROUP BY o.id, p.quantity
+        ON CONFLICT (order_id) DO UPDATE SET
+            product_count = EXCLUDED.product_count,
+            ticket_count = EXCLUDED.ticket_count,
+            printed_ticket_count = EXCLUDED.printed_ticket_count,
+            completed_ticket_count = EXCLUDED.completed_ticket_count,
+            next_print_at = EXCLUDED.next_print_at
+        """,
+        [order_ids],
+    )
+
+
+async def add_missing_order_summaries(connection: BaseDBAsyncClient):
+    """
+    Create the summary of the orders written before summaries existed.
+    """
 
-    item_quantity_map = defaultdict(int)
-    for item in order_items:
-        item_id = getattr(item, field_name)
-        item_quantity_map[item_id] += item.quantity
+    order_ids = (
+        await Order.filter(summary__order_id__isnull=True)
+        .using_db(connection)
+        .values_list("id", flat=True)
+    )
 
-    return dict(item_quantity_map)
+    await refresh_order_summaries(list(order_ids), connection)
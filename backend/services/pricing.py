@@ -0,0 +1,153 @@
+import dataclasses
+
+from backend.models.orders import (
+    CreateOrderItem,
+    CreateOrderMenuFieldItem,
+    CreateOrderMenuItem,
+    CreateOrderProductItem,
+)
+from backend.services.catalog import (
+    Catalog,
+    CatalogMenu,
+    CatalogMenuField,
+    CatalogProduct,
+)
+from backend.utils.price_utils import round_cents, to_exact_price
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MenuPrice:
+    price: int
+    # Price of every product, grouped by menu field
+    fields: tuple[tuple[int, ...], ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OrderPrice:
+    price: int
+    cover_charge: int
+    include_cover_charge: bool
+    products: tuple[int, ...]
+    menus: tuple[MenuPrice, ...]
+
+
+def price_product_unit(
+    product_db: CatalogProduct,
+    product: CreateOrderProductItem,
+    is_menu: bool = False,
+) -> int:
+    """
+    Price of a single product with its variant and ingredients, in cents.
+    Inside a menu only the variant and the ingredients are paid.
+    """
+
+    price = 0 if is_menu else product_db.price_cents
+
+    if product.variant_id:
+        price += product_db.variants[product.variant_id].price_cents
+
+    for ingredient in product.ingredients:
+        price += product_db.ingredients[ingredient.ingredient_id].price_cents
+
+    return price
+
+
+def price_product(
+    product_db: CatalogProduct, product: CreateOrderProductItem
+) -> int:
+    return price_product_unit(product_db, product) * product.quantity
+
+
+def price_menu_field(
+    menu_field: CatalogMenuField, field: CreateOrderMenuFieldItem
+) -> tuple[int, ...]:
+    """
+    Price of the products of a menu field, in cents. The products beyond
+    max_sortable_elements pay the additional cost, starting from the last.
+    """
+
+    excess = (
+        sum(product.quantity for product in field.products)
+        - menu_field.max_sortable_elements
+    )
+    prices = []
+
+    for product in reversed(field.products):
+        field_product = menu_field.field_products[product.product_id]
+
+        price = (
+            price_product_unit(field_product.product, product, True)
+            * product.quantity
+        )
+        price += round_cents(field_product.exact_price, product.quantity)
+
+        if excess > 0:
+            exceeding = min(product.quantity, excess)
+            price += round_cents(menu_field.exact_additional_cost, exceeding)
+            excess -= exceeding
+
+        prices.append(price)
+
+    return tuple(reversed(prices))
+
+
+def price_menu(menu_db: CatalogMenu, menu: CreateOrderMenuItem) -> MenuPrice:
+    fields = tuple(
+        price_menu_field(menu_db.menu_fields[field.menu_field_id], field)
+        for field in menu.fields
+    )
+    price = menu_db.price_cents + sum(sum(x) for x in fields)
+
+    return MenuPrice(price=price * menu.quantity, fields=fields)
+
+
+def price_order(
+    item: CreateOrderItem, catalog: Catalog, cover_charge: float
+) -> OrderPrice:
+    """
+    Price of a validated order, in cents.
+    """
+
+    products = tuple(
+        price_product(catalog.products[product.product_id], product)
+        for product in item.products
+    )
+    menus = tuple(
+        price_menu(catalog.menus[menu.menu_id], menu) for menu in item.menus
+    )
+
+    include_cover_charge = not item.is_take_away and (
+        any(
+            catalog.products[product.product_id].include_cover_charge
+            for product in item.products
+        )
+        or any(
+            catalog.products[product.product_id].include_cover_charge
+            for menu in item.menus
+            for field in menu.fields
+            for product in field.products
+        )
+    )
+
+    guests = (
+        item.guests
+        if not item.parent_order_id and item.guests is not None
+        else 0
+    )
+    cover_charge_price = (
+        round_cents(to_exact_price(cover_charge), guests)
+        if include_cover_charge
+        else 0
+    )
+
+    return OrderPrice(
+        price=(
+            cover_charge_price
+            + sum(products)
+            + sum(menu.price for menu in menus)
+        ),
+        cover_charge=cover_charge_price,
+        include_cover_charge=include_cover_charge,
+        products=products,
+        menus=menus,
+    )
@@ -1,6 +1,10 @@
 __all__ = (
+    "CircuitState",
+    "CountMode",
+    "EventType",
     "Permission",
     "PrinterType",
+    "PrintJobStatus",
     "ErrorCodes",
     "to_snake_case",
     "TokenJwt",
@@ -17,7 +21,7 @@ __all__ = (
 	"validate_color_field",
 )
 
-from .enums import Permission, PrinterType
+from .enums import CircuitState, CountMode, EventType, Permission, PrinterType, PrintJobStatus
 from .error_codes import ErrorCodes
 from .text_utils import to_snake_case
 from .token_jwt import TokenJwt, decode_jwt, encode_jwt, validate_token
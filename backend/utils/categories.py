@@ -1,5 +1,8 @@
+from typing import Mapping
+
 from backend.database.models import Category
 from backend.models.error import Conflict, NotFound
+from backend.services.catalog import CatalogCategory
 from backend.utils import ErrorCodes
 
 
@@ -17,50 +20,74 @@ async def check_cyclic_links(
         parent_category = await getattr(parent_category, type_of_parent)
 
 
-async def collapseCategories(categories, parent_field, changes, connection):
+def collapseCategories(categories, parent_field, changes, graph):
     new_categories = []
+    seen = set(categories)
 
     for c in categories:
-        parent_id = getattr(c, parent_field)
+        parent_id = getattr(graph[c], parent_field)
 
         if parent_id is not None:
-            if not any(k.id == parent_id for k in categories + new_categories):
-                new_c = await Category.get_or_none(id=parent_id, using_db=connection)
-                if not new_c:
+            if parent_id not in seen:
+                if parent_id not in graph:
                     raise NotFound(ErrorCodes.CATEGORY_NOT_FOUND)
-                new_categories.append(new_c)
-            
-            changes[c.id] = parent_id
-        
+                new_categories.append(parent_id)
+                seen.add(parent_id)
+
+            changes[c] = parent_id
+
         else:
             new_categories.append(c)
-    
+
     return new_categories, collapseChangesChains(changes)
 
 
-async def collapseOrphanCategories(categories, changes, connection):
+def collapseOrphanCategories(categories, changes, graph):
     new_categories = []
+    seen = set(categories)
 
     for c in categories:
-        parent_id = c.parent_category_id
+        parent_id = graph[c].parent_category_id
 
         if parent_id is not None:
-            if not any(k.id == parent_id for k in categories + new_categories):
-                new_c = await Category.get_or_none(id=parent_id, using_db=connection)
-                if not new_c:
+            if parent_id not in seen:
+                if parent_id not in graph:
                     raise NotFound(ErrorCodes.CATEGORY_NOT_FOUND)
-                new_categories.append(new_c) # Category is orphan: keep only parent
-                changes[c.id] = parent_id
-            
+                new_categories.append(parent_id) # Category is orphan: keep only parent
+                seen.add(parent_id)
+                changes[c] = parent_id
+
             else:
                 new_categories.append(c) # Category is not orphan
-        
+
         else:
             new_categories.append(c)
-    
+
     return new_categories, collapseChangesChains(changes)
 
 
+def route_categories(
+    categories: list[int],
+    is_take_away: bool,
+    collapse_main_products: bool,
+    graph: Mapping[int, CatalogCategory],
+) -> tuple[list[int], dict[int, int]]:
+    """
+    Resolve the ticket categories of an order and the category remapping of
+    its products from the categories of the products.
+    """
+
+    changes = {}
+
+    if is_take_away:
+        categories, changes = collapseCategories(categories, 'parent_for_take_away_id', changes, graph)
+
+    if collapse_main_products:
+        categories, changes = collapseCategories(categories, 'parent_for_main_products_id', changes, graph)
+
+    return collapseOrphanCategories(categories, changes, graph)
+
+
 def collapseChangesChains(changes):
     resolved_changes = {}
 
@@ -8,3 +8,8 @@ def get_day_bounds(for_date: date = None):
     )
     end_of_day = start_of_day + timedelta(days=1)
     return start_of_day, end_of_day
+
+
+def get_service_day(moment: datetime = None) -> date:
+    moment = moment or datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).date()
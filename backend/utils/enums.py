@@ -12,3 +12,31 @@ class Permission(StrEnum):
 class PrinterType(StrEnum):
     RECEIPT = "receipt"
     TICKET = "ticket"
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class PrintJobStatus(StrEnum):
+    QUEUED = "queued"
+    PRINTING = "printing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class CountMode(StrEnum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+class EventType(StrEnum):
+    ORDER_CREATED = "order_created"
+    ORDER_UPDATED = "order_updated"
+    ORDER_CONFIRMED = "order_confirmed"
+    ORDER_DELETED = "order_deleted"
+    TICKET_PRINTED = "ticket_printed"
+    TICKET_COMPLETED = "ticket_completed"
+    RESET = "reset"
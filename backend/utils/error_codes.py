@@ -155,3 +155,22 @@ class ErrorCodes(Enum):
     GENERIC_HTTP_EXCEPTION = auto()
     INTERNAL_ERROR_SERVER = auto()
     REQUEST_VALIDATION_ERROR = auto()
+
+    # Codes added after the first release go at the end so that the
+    # numeric values already known by the clients do not change
+
+    # Idempotency
+    IDEMPOTENCY_KEY_REUSED = auto()
+
+    # Cursor pagination
+    INVALID_CURSOR = auto()
+
+    # Print jobs
+    PRINT_JOB_NOT_FOUND = auto()
+    PRINTER_QUEUE_FULL = auto()
+
+    # Printer health
+    PRINTER_UNAVAILABLE = auto()
+
+    # Batch orders
+    ORDER_CREATION_FAILED = auto()
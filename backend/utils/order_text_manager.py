@@ -13,21 +13,22 @@ from backend.utils import PrinterType
 if typing.TYPE_CHECKING:
     from backend.database.models import Category, Order, OrderProduct, OrderMenu
 
+DOUBLE_PATTERN = re.compile(r"<DOUBLE>(.*?)</DOUBLE>")
+
 
 class OrderTextManager:
     MAX_WIDTH = 48
 
-    def __init__(self, order: Order, category: Category):
+    def __init__(self, order: Order, category: Category | None = None):
         self.order = order
         self.category = category
 
     @staticmethod
     def _visual_length(text: str) -> int:
         length = 0
-        pattern = re.compile(r"<DOUBLE>(.*?)</DOUBLE>")
 
         pos = 0
-        for match in pattern.finditer(text):
+        for match in DOUBLE_PATTERN.finditer(text):
             start, end = match.span()
             before = text[pos:start]
             length += len(before)
@@ -341,7 +342,8 @@ class OrderTextManager:
         enriched_products = []
 
         for op in self.order.order_products:
-            if op.category_id != self.category.id:
+            # Without a category every product is listed, as on the receipt
+            if self.category is not None and op.category_id != self.category.id:
                 continue
 
             product = op.product
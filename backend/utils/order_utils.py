@@ -1,18 +1,18 @@
+import datetime
+import pytz
 from decimal import Decimal
+from typing import Mapping
 
 from tortoise import BaseDBAsyncClient
 from tortoise.exceptions import IntegrityError
 
 from backend.config import Session
 from backend.database.models import (
-    Menu,
-    MenuField,
     Order,
     OrderMenu,
     OrderMenuField,
     OrderProduct,
     OrderProductIngredient,
-    Product,
     Ticket,
 )
 from backend.models.orders import (
@@ -22,26 +22,26 @@ from backend.models.orders import (
     CreateOrderItem,
 )
 from backend.models.error import Conflict
+from backend.services.catalog import (
+    Catalog,
+    CatalogMenu,
+    CatalogMenuField,
+    CatalogProduct,
+)
 from backend.services.orders import get_today_quantities
+from backend.services.pricing import price_order
 from backend.utils import ErrorCodes
-from backend.utils.categories import collapseCategories, collapseOrphanCategories
-
-ZERO_DECIMAL = Decimal("0.00")
+from backend.utils.categories import route_categories
+from backend.utils.price_utils import from_cents
+from backend.utils.query_utils import bulk_insert
 
 
-async def _check_generic_product(
-    product_db: Product,
+def check_generic_product(
+    product_db: CatalogProduct,
     product: CreateOrderProductItem,
     is_menu: bool = False,
 ) -> tuple[bool, ErrorCodes | None]:
-    # Calculate the base price of the product
-    product_price = Decimal(product_db.price).quantize(ZERO_DECIMAL)
-
-    if is_menu:
-        product_price = ZERO_DECIMAL
-
-    # Extract variants and their IDs
-    product_variants = {variant.id: variant for variant in product_db.variants}
+    product_variants = product_db.variants
 
     # Validate variants
     if product_variants and not product.variant_id:
@@ -70,12 +70,7 @@ async def _check_generic_product(
                 else ErrorCodes.PRODUCT_VARIANT_NOT_EXIST,
             )
 
-        product_price += Decimal(product_variant.price).quantize(ZERO_DECIMAL)
-
-    # Extract ingredients and their IDs
-    product_ingredients = {
-        ingredient.ingredient_id: ingredient for ingredient in product_db.ingredients
-    }
+    product_ingredients = product_db.ingredients
 
     # Validate ingredients
     if len(set(x.ingredient_id for x in product.ingredients)) != len(
@@ -106,50 +101,38 @@ async def _check_generic_product(
                 else ErrorCodes.PRODUCT_INGREDIENT_NOT_EXIST,
             )
 
-        product_price += (Decimal(product_ingredient.price)).quantize(
-            ZERO_DECIMAL
-        )
-
-    # Assign calculated price to the product
-    product._price = product_price
-    product._has_cover_charge = product_db.subcategory.include_cover_charge
-
     return False, None
 
 
 async def check_products(
     products: list[CreateOrderProductItem],
     role_id: int,
+    catalog: Catalog,
     connection: BaseDBAsyncClient,
+    today_quantities: Mapping[int, int] | None = None,
 ) -> tuple[bool, ErrorCodes | None]:
     product_ids = {x.product_id for x in products}  # Extract product IDs
 
-    # Get products from DB
-    products_db = (
-        Product.filter(id__in=product_ids)
-        .prefetch_related(
-            "dates", "ingredients", "roles", "variants", "subcategory"
-        )
-        .using_db(connection)
-    )
-
-    # Get today's quantities
-    today_quantities = await get_today_quantities(product_ids, connection)
+    # Get products from the catalog
+    products_db = [catalog.products.get(x) for x in product_ids]
 
     # Check if all products exist
-    total_count = await products_db.count()
-    if total_count != len(product_ids):
+    if None in products_db:
         return True, ErrorCodes.PRODUCT_NOT_EXIST
 
-    for product in await products_db:
+    # Get today's quantities
+    if today_quantities is None:
+        today_quantities = await get_today_quantities(
+            {x.id for x in products_db if x.daily_max_sales}, connection
+        )
+
+    for product in products_db:
         # Check if role is valid for the product
-        if not any(role.role_id == role_id for role in product.roles):
+        if role_id not in product.role_ids:
             return True, ErrorCodes.PRODUCT_ROLE_NOT_EXIST
 
         # Check if any product date is valid
-        if not any(
-            [await date.is_valid_product_date() for date in product.dates]
-        ):
+        if not product.is_valid_date():
             return True, ErrorCodes.PRODUCT_DATE_NOT_VALID
 
         # Validate each relevant product in the order
@@ -167,68 +150,20 @@ async def check_products(
             return True, ErrorCodes.PRODUCT_DAILY_LIMIT_EXCEEDED
 
         for product_order in order_items_for_product:
-            is_invalid, error_code = await _check_generic_product(
+            is_invalid, error_code = check_generic_product(
                 product, product_order
             )
 
             if is_invalid:
                 return is_invalid, error_code
 
-            product_order._price = (
-                Decimal(product_order._price) * Decimal(product_order.quantity)
-            ).quantize(ZERO_DECIMAL)
-
     return False, None
 
 
-async def create_order_products(
-    products: list[CreateOrderProductItem],
-    order: Order,
-    connection: BaseDBAsyncClient,
-    order_menu_field: OrderMenuField | None = None,
-) -> bool:
-    product_ids = [p.product_id for p in products]
-    
-    if not product_ids:
-        return True
-
-    products_db = await Product.filter(id__in=product_ids).using_db(connection).only("id", "category_id")
-    product_category_map = { p.id: p.category_id for p in products_db }
-
-    for product in products:
-        category_id = product_category_map.get(product.product_id)
-        if category_id is None:
-            raise ValueError(ErrorCodes.PRODUCT_NOT_FOUND)
-        
-        order_product = await OrderProduct.create(
-            product_id=product.product_id,
-            price=product._price,
-            quantity=product.quantity,
-            variant_id=product.variant_id,
-            notes=product.notes,
-            order=order,
-            order_menu_field=order_menu_field,
-            category_id=category_id,
-            using_db=connection,
-        )
-
-        for ingredient in product.ingredients:
-            await OrderProductIngredient.create(
-                order_product=order_product,
-                ingredient_id=ingredient.ingredient_id,
-                quantity=ingredient.quantity,
-                using_db=connection,
-            )
-
-    return True
-
-
-async def _check_menu_field_products(
-    menu_field: MenuField, order_menu_field: CreateOrderMenuFieldItem
+def _check_menu_field_products(
+    menu_field: CatalogMenuField, order_menu_field: CreateOrderMenuFieldItem
 ) -> tuple[bool, ErrorCodes | None]:
-    menu_field_product_ids = {
-        product.product_id for product in menu_field.field_products
-    }
+    menu_field_product = menu_field.field_products
     order_menu_field_product_ids = {
         product.product_id for product in order_menu_field.products
     }
@@ -238,68 +173,37 @@ async def _check_menu_field_products(
         return True, ErrorCodes.DUPLICATE_MENU_FIELDS_PRODUCT
 
     # Check if all products in the order exist in the menu field
-    if not order_menu_field_product_ids.issubset(menu_field_product_ids):
+    if not order_menu_field_product_ids.issubset(menu_field_product.keys()):
         return True, ErrorCodes.MENU_FIELD_PRODUCT_NOT_EXIST
 
-    can_exceed_max_sortable = menu_field.can_exceed_max_sortable
-    max_free_quantity = menu_field.max_sortable_elements
     menu_field_total_quantity = sum(
         p.quantity for p in order_menu_field.products
     )
-    excess = menu_field_total_quantity - max_free_quantity
 
     if (
-        not can_exceed_max_sortable
-        and menu_field_total_quantity > max_free_quantity
+        not menu_field.can_exceed_max_sortable
+        and menu_field_total_quantity > menu_field.max_sortable_elements
     ):
         return True, ErrorCodes.MENU_FIELD_PRODUCT_QUANTITY_EXCEEDED
 
-    menu_field_product = {
-        product.product_id: product for product in menu_field.field_products
-    }
-
     for product in reversed(order_menu_field.products):
         # Validate each product using the generic product checker
-        is_invalid, error_code = await _check_generic_product(
+        is_invalid, error_code = check_generic_product(
             menu_field_product[product.product_id].product, product, True
         )
 
         if is_invalid:
             return is_invalid, error_code
 
-        # Calculate product price based on quantity
-        product._price = (
-            Decimal(product._price) * Decimal(product.quantity)
-        ).quantize(ZERO_DECIMAL)
-        product._price += (
-            Decimal(menu_field_product[product.product_id].price)
-            * Decimal(product.quantity)
-        ).quantize(ZERO_DECIMAL)
-
-        # Apply additional cost for excess quantities
-        if excess > 0:
-            additional_cost = Decimal(menu_field.additional_cost)
-
-            if product.quantity <= excess:
-                product._price += (
-                    additional_cost * Decimal(product.quantity)
-                ).quantize(ZERO_DECIMAL)
-                excess -= product.quantity
-            else:
-                product._price += (additional_cost * Decimal(excess)).quantize(
-                    ZERO_DECIMAL
-                )
-                excess = 0
-
     return False, None
 
 
-async def _check_menu_fields(
-    menu: Menu, order_menu: CreateOrderMenuItem
+def _check_menu_fields(
+    menu: CatalogMenu, order_menu: CreateOrderMenuItem
 ) -> tuple[bool, ErrorCodes | None]:
-    menu_field_ids = {field.id for field in menu.menu_fields}
+    menu_fields = menu.menu_fields
     menu_field_obligatory_ids = {
-        field.id for field in menu.menu_fields if not field.is_optional
+        field.id for field in menu_fields.values() if not field.is_optional
     }
     order_menu_field_ids = {field.menu_field_id for field in order_menu.fields}
 
@@ -312,12 +216,9 @@ async def _check_menu_fields(
         return True, ErrorCodes.MISSING_OBLIGATORY_MENU_FIELDS
 
     # Validate that all menu fields in the order exist in the menu
-    if not order_menu_field_ids.issubset(menu_field_ids):
+    if not order_menu_field_ids.issubset(menu_fields.keys()):
         return True, ErrorCodes.MENU_FIELD_NOT_EXIST
 
-    menu_fields = {field.id: field for field in menu.menu_fields}
-    menu_price = Decimal(menu.price).quantize(ZERO_DECIMAL)
-
     for field in order_menu.fields:
         # Ensure that each field has at least one product
         if len(field.products) < 1:
@@ -326,60 +227,43 @@ async def _check_menu_fields(
         menu_field = menu_fields[field.menu_field_id]
 
         # Validate products within the field
-        is_invalid, error_code = await _check_menu_field_products(
-            menu_field, field
-        )
+        is_invalid, error_code = _check_menu_field_products(menu_field, field)
 
         if is_invalid:
             return is_invalid, error_code
 
-        # Add the price of the products to the menu price
-        for product in field.products:
-            menu_price += Decimal(product._price).quantize(ZERO_DECIMAL)
-
-    # Assign the calculated menu price to the order
-    order_menu._price = Decimal(menu_price).quantize(ZERO_DECIMAL)
-
     return False, None
 
 
 async def check_menus(
     menus: list[CreateOrderMenuItem],
     role_id: int,
+    catalog: Catalog,
     connection: BaseDBAsyncClient,
+    today_quantities: Mapping[int, int] | None = None,
 ) -> tuple[bool, ErrorCodes | None]:
     menu_ids = {menu.menu_id for menu in menus}
 
-    # Get menus from DB
-    menu_db = (
-        Menu.filter(id__in=menu_ids)
-        .prefetch_related(
-            "dates",
-            "menu_fields",
-            "menu_fields__field_products",
-            "menu_fields__field_products__product__subcategory",
-            "menu_fields__field_products__product__ingredients",
-            "menu_fields__field_products__product__variants",
-            "roles",
-        )
-        .using_db(connection)
-    )
+    # Get menus from the catalog
+    menu_db = [catalog.menus.get(x) for x in menu_ids]
 
-    # Get today's quantities
-    today_quantities = await get_today_quantities(menu_ids, connection)
-
-    # Check if all products exist
-    total_count = await menu_db.count()
-    if total_count != len(menu_ids):
+    # Check if all menus exist
+    if None in menu_db:
         return True, ErrorCodes.MENU_NOT_EXIST
 
-    for menu in await menu_db:
+    # Get today's quantities
+    if today_quantities is None:
+        today_quantities = await get_today_quantities(
+            {x.id for x in menu_db if x.daily_max_sales}, connection, True
+        )
+
+    for menu in menu_db:
         # Check if role is valid for the product
-        if not any(role.role_id == role_id for role in menu.roles):
+        if role_id not in menu.role_ids:
             return True, ErrorCodes.MENU_ROLE_NOT_EXIST
 
         # Check if any product date is valid
-        if not any([await date.is_valid_menu_date() for date in menu.dates]):
+        if not menu.is_valid_date():
             return True, ErrorCodes.MENU_DATE_NOT_VALID
 
         # Filter relevant menus for the order
@@ -396,117 +280,256 @@ async def check_menus(
 
         for order_menu in order_items_for_menu:
             # Validate menu fields
-            is_invalid, error_code = await _check_menu_fields(menu, order_menu)
+            is_invalid, error_code = _check_menu_fields(menu, order_menu)
 
             if is_invalid:
                 return is_invalid, error_code
 
-            # Calculate the total menu price based on quantity
-            order_menu._price = (
-                Decimal(order_menu._price) * Decimal(order_menu.quantity)
-            ).quantize(ZERO_DECIMAL)
-
     return False, None
 
 
-async def create_order_menus(
-    menus: list[CreateOrderMenuItem],
-    order: Order,
+async def create_order_items(
+    orders: list[tuple[Order, CreateOrderItem]],
+    catalog: Catalog,
     connection: BaseDBAsyncClient,
 ) -> bool:
-    for menu in menus:
-        order_menu = await OrderMenu.create(
-            menu_id=menu.menu_id,
-            price=menu._price,
-            quantity=menu.quantity,
-            order=order,
-            using_db=connection,
+    """
+    Write all the menus, menu fields, products and product ingredients of
+    the orders with one multi-row statement per table.
+    """
+
+    # Products of the orders, each with its order and menu field
+    products: list[tuple[CreateOrderProductItem, int, int | None]] = [
+        (product, order.id, None)
+        for order, item in orders
+        for product in item.products
+    ]
+    menus = [
+        (menu, order.id) for order, item in orders for menu in item.menus
+    ]
+
+    if menus:
+        order_menu_ids = await bulk_insert(
+            OrderMenu,
+            ("menu_id", "price", "quantity", "order_id"),
+            [
+                (menu.menu_id, menu._price, menu.quantity, order_id)
+                for menu, order_id in menus
+            ],
+            connection,
         )
 
-        for field in menu.fields:
-            order_menu_field = await OrderMenuField.create(
-                order_menu=order_menu,
-                menu_field_id=field.menu_field_id,
-                using_db=connection,
+        menu_fields = [
+            (order_menu_id, field, order_id)
+            for order_menu_id, (menu, order_id) in zip(order_menu_ids, menus)
+            for field in menu.fields
+        ]
+
+        order_menu_field_ids = await bulk_insert(
+            OrderMenuField,
+            ("order_menu_id", "menu_field_id"),
+            [
+                (order_menu_id, field.menu_field_id)
+                for order_menu_id, field, _ in menu_fields
+            ],
+            connection,
+        )
+
+        for order_menu_field_id, (_, field, order_id) in zip(
+            order_menu_field_ids, menu_fields
+        ):
+            products.extend(
+                (product, order_id, order_menu_field_id)
+                for product in field.products
             )
 
-            await create_order_products(
-                field.products, order, connection, order_menu_field
+    if not products:
+        return True
+
+    rows = []
+    for product, order_id, order_menu_field_id in products:
+        product_db = catalog.products.get(product.product_id)
+        if product_db is None:
+            raise ValueError(ErrorCodes.PRODUCT_NOT_FOUND)
+
+        category_id = product_db.category_id
+
+        rows.append(
+            (
+                product.product_id,
+                product._price,
+                product.quantity,
+                product.variant_id,
+                product.notes,
+                order_id,
+                order_menu_field_id,
+                category_id,
             )
+        )
+
+    order_product_ids = await bulk_insert(
+        OrderProduct,
+        (
+            "product_id",
+            "price",
+            "quantity",
+            "variant_id",
+            "notes",
+            "order_id",
+            "order_menu_field_id",
+            "category_id",
+        ),
+        rows,
+        connection,
+    )
+
+    await bulk_insert(
+        OrderProductIngredient,
+        ("order_product_id", "ingredient_id", "quantity"),
+        [
+            (order_product_id, ingredient.ingredient_id, ingredient.quantity)
+            for order_product_id, (product, _, _) in zip(
+                order_product_ids, products
+            )
+            for ingredient in product.ingredients
+        ],
+        connection,
+    )
 
     return True
 
 
-async def create_tickets(order: Order, connection: BaseDBAsyncClient):    
-    if not order.has_tickets:
-        return #TODO: set NULL into order_product.category_id if there are no tickets
-    
-    order_products = await OrderProduct.filter(order_id=order.id).prefetch_related("product", "product__category").using_db(connection)
-    categories = []
-    main_products = 0
-
-    for op in order_products:
-        if op.product.category not in categories:
-            categories.append(op.product.category)
-
-        if op.product.is_main:
-            main_products += op.quantity
-    
-    changes = {}
-
-    if order.is_take_away:
-        categories, changes = await collapseCategories(categories, 'parent_for_take_away_id', changes, connection)
-    
-    if order.guests and (
-        (order.guests <= 4 and main_products <= order.guests) or
-        (order.guests > 4 and main_products <= 4)):
-        categories, changes = await collapseCategories(categories, 'parent_for_main_products_id', changes, connection)
-    
-    categories, changes = await collapseOrphanCategories(categories, changes, connection)
-    
+async def create_tickets(
+    orders: list[tuple[Order, CreateOrderItem]],
+    catalog: Catalog,
+    connection: BaseDBAsyncClient,
+):
+    tickets = []
+    changes = []
+
+    for order, item in orders:
+        if not order.has_tickets:
+            continue #TODO: set NULL into order_product.category_id if there are no tickets
+
+        order_products = [
+            (catalog.products[product.product_id], product.quantity)
+            for product in item.products
+        ] + [
+            (catalog.products[product.product_id], product.quantity)
+            for menu in item.menus
+            for field in menu.fields
+            for product in field.products
+        ]
+
+        categories = list(dict.fromkeys(
+            product.category_id for product, _ in order_products
+        ))
+        main_products = sum(
+            quantity for product, quantity in order_products if product.is_main
+        )
+
+        categories, order_changes = route_categories(
+            categories,
+            order.is_take_away,
+            bool(order.guests) and (
+                (order.guests <= 4 and main_products <= order.guests) or
+                (order.guests > 4 and main_products <= 4)
+            ),
+            catalog.categories,
+        )
+
+        tickets.extend(Ticket(order_id=order.id, category_id=c) for c in categories)
+        changes.extend(
+            (order.id, from_id, to_id)
+            for from_id, to_id in order_changes.items()
+        )
+
     # Create tickets
-    tickets = [Ticket(order_id=order.id, category_id=c.id) for c in categories]
     try:
         await Ticket.bulk_create(objects=tickets, using_db=connection)
     except IntegrityError:
         raise Conflict(code=ErrorCodes.TICKET_CREATION_FAILED)
-    
-    # Update collapsed categories with respective parents for order_products
-    for from_id, to_id in changes.items():
-        await OrderProduct.filter(
-            order_id=order.id,
-            category_id=from_id
-        ).using_db(connection).update(category_id=to_id)
-
-
-async def get_order_price(order: CreateOrderItem) -> Decimal:
-    cover_change = Decimal(Session.settings.cover_charge)
-    guests = Decimal(
-        order.guests
-        if not order.is_take_away and not order.parent_order_id and order.guests is not None
-        else 0
-    )
-    price = ZERO_DECIMAL
-
-    include_cover_charge = any(
-        order._has_cover_charge for order in order.products
-    )
-    include_cover_charge |= any(
-        product._has_cover_charge
-        for menu in order.menus
-        for field in menu.fields
-        for product in field.products
-    )
-
-    if include_cover_charge and not order.is_take_away:
-        price = (cover_change * guests).quantize(ZERO_DECIMAL)
-    else:
-        order.guests = None
 
-    for x in order.products:
-        price += Decimal(x._price).quantize(ZERO_DECIMAL)
+    # Update collapsed categories with respective parents for order_products
+    if changes:
+        order_ids, from_ids, to_ids = zip(*changes)
+
+        await connection.execute_query(
+            """
+            UPDATE order_product AS op
+            SET category_id = c.to_id
+            FROM unnest($1::int[], $2::int[], $3::int[]) AS c(order_id, from_id, to_id)
+            WHERE op.order_id = c.order_id AND op.category_id = c.from_id
+            """,
+            [list(order_ids), list(from_ids), list(to_ids)],
+        )
 
-    for x in order.menus:
-        price += Decimal(x._price).quantize(ZERO_DECIMAL)
 
-    return price
+def get_order_price(item: CreateOrderItem, catalog: Catalog) -> Decimal:
+    """
+    Price a validated order and assign the price of every product and menu.
+    """
+
+    order_price = price_order(item, catalog, Session.settings.cover_charge)
+
+    for product, price in zip(item.products, order_price.products):
+        product._price = from_cents(price)
+
+    for menu, menu_price in zip(item.menus, order_price.menus):
+        menu._price = from_cents(menu_price.price)
+
+        for field, prices in zip(menu.fields, menu_price.fields):
+            for product, price in zip(field.products, prices):
+                product._price = from_cents(price)
+
+    if not order_price.include_cover_charge:
+        item.guests = None
+
+    return from_cents(order_price.price)
+
+
+def get_order_fields(item: CreateOrderItem) -> dict:
+    """
+    Fields of a new order that depend on the settings and on its kind.
+    """
+
+    rome_tz = pytz.timezone("Europe/Rome")
+    now_in_rome = datetime.datetime.now(rome_tz)
+
+    return {
+        "customer": item.customer,
+        "guests": (item.guests
+            if not item.is_take_away and not item.parent_order_id
+            else None
+        ),
+        "is_take_away": (item.is_take_away
+            if not item.parent_order_id
+            else False
+        ),
+        "table": (item.table
+            if (not item.is_take_away
+            and not Session.settings.order_requires_confirmation
+            and not item.parent_order_id)
+            or not item.has_tickets
+            else None
+        ),
+        "is_confirmed": (True
+            if item.is_take_away
+            or not Session.settings.order_requires_confirmation
+            or not item.has_tickets
+            else False
+        ),
+        "confirmed_at": (now_in_rome
+            if item.is_take_away
+            or not Session.settings.order_requires_confirmation
+            or not item.has_tickets
+            else None
+        ),
+        "is_done": not item.has_tickets,
+        "is_voucher": item.is_voucher,
+        "is_for_service": item.is_for_service,
+        "has_tickets": item.has_tickets,
+        "notes": item.notes,
+        "payment_method_id": item.payment_method_id,
+        "parent_order_id": item.parent_order_id,
+    }
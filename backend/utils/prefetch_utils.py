@@ -0,0 +1,121 @@
+from typing import Mapping
+
+# Include flag -> (flag it depends on, relation paths it reads)
+Includes = Mapping[str, tuple[str | None, tuple[str, ...]]]
+
+ORDER_INCLUDES: Includes = {
+    "include_menus": (None, ("order_menus",)),
+    "include_menus_menu": ("include_menus", ("order_menus__menu",)),
+    "include_menus_menu_dates": (
+        "include_menus_menu",
+        ("order_menus__menu__dates",),
+    ),
+    "include_menus_menu_fields": (
+        "include_menus_menu",
+        ("order_menus__menu__menu_fields",),
+    ),
+    "include_menus_menu_fields_products": (
+        "include_menus_menu_fields",
+        ("order_menus__menu__menu_fields__field_products__product",),
+    ),
+    "include_menus_menu_fields_products_dates": (
+        "include_menus_menu_fields_products",
+        ("order_menus__menu__menu_fields__field_products__product__dates",),
+    ),
+    "include_menus_menu_fields_products_ingredients": (
+        "include_menus_menu_fields_products",
+        (
+            "order_menus__menu__menu_fields__field_products__product__ingredients__ingredient",
+        ),
+    ),
+    "include_menus_menu_fields_products_roles": (
+        "include_menus_menu_fields_products",
+        ("order_menus__menu__menu_fields__field_products__product__roles",),
+    ),
+    "include_menus_menu_fields_products_variants": (
+        "include_menus_menu_fields_products",
+        (
+            "order_menus__menu__menu_fields__field_products__product__variants",
+        ),
+    ),
+    "include_menus_menu_roles": (
+        "include_menus_menu",
+        ("order_menus__menu__roles",),
+    ),
+    "include_menus_fields": (
+        "include_menus",
+        ("order_menus__order_menu_fields",),
+    ),
+    "include_menus_fields_products": (
+        "include_menus_fields",
+        ("order_menus__order_menu_fields__order_menu_field_products",),
+    ),
+    "include_menus_fields_products_ingredients": (
+        "include_menus_fields_products",
+        (
+            "order_menus__order_menu_fields__order_menu_field_products__order_product_ingredients",
+        ),
+    ),
+    "include_products": (None, ("order_products",)),
+    "include_products_product": (
+        "include_products",
+        ("order_products__product",),
+    ),
+    "include_products_product_dates": (
+        "include_products_product",
+        ("order_products__product__dates",),
+    ),
+    "include_products_product_ingredients": (
+        "include_products_product",
+        ("order_products__product__ingredients__ingredient",),
+    ),
+    "include_products_product_roles": (
+        "include_products_product",
+        ("order_products__product__roles",),
+    ),
+    "include_products_product_variants": (
+        "include_products_product",
+        ("order_products__product__variants",),
+    ),
+    "include_products_ingredients": (
+        "include_products",
+        ("order_products__order_product_ingredients",),
+    ),
+    "include_payment_method": (None, ("payment_method",)),
+    "include_revisions": (None, ("order_revisions",)),
+    "include_tickets": (None, ("order_tickets",)),
+    "include_user": (None, ("user",)),
+    "include_confirmer_user": (None, ("confirmed_by",)),
+}
+
+
+def get_prefetch_paths(
+    includes: Includes, flags: Mapping[str, bool]
+) -> list[str]:
+    """
+    Relation paths to prefetch for the requested include flags. A flag is
+    ignored when the flag it depends on is not requested, as to_dict does.
+    """
+
+    def is_requested(flag: str | None) -> bool:
+        while flag is not None:
+            if not flags.get(flag):
+                return False
+
+            flag = includes[flag][0]
+
+        return True
+
+    paths = [
+        path
+        for flag, (_, flag_paths) in includes.items()
+        if is_requested(flag)
+        for path in flag_paths
+    ]
+
+    # A nested path already prefetches all its prefixes
+    return [
+        path
+        for path in paths
+        if not any(x.startswith(path + "__") for x in paths)
+    ]
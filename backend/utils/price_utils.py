@@ -0,0 +1,33 @@
+from decimal import Decimal
+
+# Exact value of a price in cents, as numerator and denominator
+ExactPrice = tuple[int, int]
+
+
+def to_exact_price(value: float | Decimal | int) -> ExactPrice:
+    numerator, denominator = value.as_integer_ratio()
+    return numerator * 100, denominator
+
+
+def round_cents(price: ExactPrice, quantity: int = 1) -> int:
+    """
+    Round price * quantity to cents, half to even like Decimal.quantize.
+    """
+
+    numerator, denominator = price
+    cents, remainder = divmod(numerator * quantity, denominator)
+
+    if remainder * 2 > denominator or (
+        remainder * 2 == denominator and cents % 2
+    ):
+        cents += 1
+
+    return cents
+
+
+def to_cents(value: float | Decimal | int) -> int:
+    return round_cents(to_exact_price(value))
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
@@ -1,28 +1,161 @@
 import asyncio
+import collections
+import dataclasses
 import datetime
+import heapq
 import pytz
-import re
+import select
+import socket
 import threading
 
-from escpos.printer import Network
+from escpos.exceptions import DeviceNotFoundError
+from escpos.printer import Dummy, Network
 from loguru import logger
 from tortoise.exceptions import IntegrityError
 from tortoise.transactions import in_transaction
 
-from backend.database.models import Order, Printer, Ticket
+from backend.database.models import Order, OrderSummary, Printer, RolePrinter, Ticket
 from backend.models.error import Conflict, NotFound
-from backend.utils import ErrorCodes, PrinterType
-from backend.utils.order_text_manager import OrderTextManager
-
+from backend.services.events import Event, EventBus, publish_ticket_events
+from backend.services.order_changes import add_order_changes
+from backend.utils import (
+    CircuitState,
+    ErrorCodes,
+    EventType,
+    PrinterType,
+    PrintJobStatus,
+)
+from backend.utils.order_text_manager import DOUBLE_PATTERN, OrderTextManager
+
+DOUBLE_SIZE_ON = b"\x1B\x21\x30"
+DOUBLE_SIZE_OFF = b"\x1B\x21\x00"
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+MAX_CACHED_TICKETS = 256
+MAX_QUEUED_JOBS = 100
+MAX_STORED_JOBS = 1000
+PRINTER_IDLE_TIMEOUT = 60
 MAX_RETRY_DELAY = 60
 RETRY_DELAY = 10
 STEP = 2
 
+# Errors of the printer or of the network, the other ones are bugs
+PRINTER_ERRORS = (OSError, DeviceNotFoundError)
+
+# Filters of the tickets still to print
+TICKETS_TO_PRINT = {
+    "printed_at": None,
+    "completed_at": None,
+    "order__is_done": False,
+    "order__is_deleted": False,
+    "order__confirmed_at__isnull": False,
+}
+
+
+@dataclasses.dataclass(slots=True)
+class PrinterHealth:
+    """
+    Circuit breaker of a printer: a failed print opens it and the printer
+    is skipped until the retry time, waiting more after every failure.
+    Then a single print or probe is tried, half-open, and closes it again
+    when it succeeds.
+    """
+
+    state: CircuitState = CircuitState.CLOSED
+    # Failures since the last success
+    consecutive_failures: int = 0
+    failure_count: int = 0
+    success_count: int = 0
+    last_success_at: datetime.datetime | None = None
+    last_failure_at: datetime.datetime | None = None
+    retry_at: datetime.datetime | None = None
+
+    def is_available(self, now: datetime.datetime) -> bool:
+        return self.state != CircuitState.OPEN or self.retry_at <= now
+
+    def add_success(self):
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.success_count += 1
+        self.last_success_at = datetime.datetime.now(datetime.timezone.utc)
+        self.retry_at = None
+
+    def add_failure(self):
+        self.state = CircuitState.OPEN
+        self.consecutive_failures += 1
+        self.failure_count += 1
+        self.last_failure_at = datetime.datetime.now(datetime.timezone.utc)
+        self.retry_at = self.last_failure_at + datetime.timedelta(
+            seconds=min(
+                RETRY_DELAY * STEP ** (self.consecutive_failures - 1),
+                MAX_RETRY_DELAY,
+            )
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_count": self.failure_count,
+            "success_count": self.success_count,
+            "last_success_at": self.last_success_at,
+            "last_failure_at": self.last_failure_at,
+            "retry_at": self.retry_at,
+        }
+
+
+@dataclasses.dataclass(slots=True)
+class PrintJob:
+    id: int
+    order_id: int
+    # Released once the job is completed
+    order: Order | None
+    # Printer id -> documents to print on it
+    printer_types: dict[int, list[PrinterType]]
+    status: PrintJobStatus = PrintJobStatus.QUEUED
+    failed_printer_ids: list[int] = dataclasses.field(default_factory=list)
+    created_at: datetime.datetime = dataclasses.field(
+        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc)
+    )
+    completed_at: datetime.datetime | None = None
+    pending_printer_ids: set[int] = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        self.pending_printer_ids = set(self.printer_types)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "order_id": self.order_id,
+            "status": self.status,
+            "printer_types": self.printer_types,
+            "failed_printer_ids": self.failed_printer_ids,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+        }
+
 
 class PrintManager:
     def __init__(self):
         self.printers: dict[int, Network] = {}
         self._printer_locks: dict[int, threading.Lock] = {}
+        self._health: dict[int, PrinterHealth] = {}
+        # (due time, order id) of the orders with tickets to print
+        self._schedule: list[tuple[datetime.datetime, int]] = []
+        self._due_times: dict[int, datetime.datetime] = {}
+        self._failures: dict[int, int] = {}
+        self._changed_orders: set[int] = set()
+        self._wakeup = asyncio.Event()
+        # Tickets and jobs to print, every printer prints its own in order
+        self._queues: dict[int, asyncio.Queue[Ticket | PrintJob]] = {}
+        self._queued_tickets: set[int] = set()
+        self._jobs: collections.OrderedDict[int, PrintJob] = collections.OrderedDict()
+        self._last_job_id = 0
+        # Key of the rendered ticket -> ESC/POS bytes of the ticket
+        self._rendered_tickets: collections.OrderedDict[
+            tuple, bytes
+        ] = collections.OrderedDict()
     
     
     @classmethod
@@ -33,6 +166,7 @@ class PrintManager:
         for printer in printers:
             new_obj.add_printer(printer.id, printer.ip_address)
 
+        EventBus.add_listener(new_obj._on_event)
         asyncio.create_task(new_obj.update_worker())
 
         return new_obj
@@ -42,153 +176,697 @@ class PrintManager:
         if printer_id not in self.printers:
             self.printers[printer_id] = Network(printer_ip_address, timeout=5)
             self._printer_locks[printer_id] = threading.Lock()
+            self._health[printer_id] = PrinterHealth()
+            self._queues[printer_id] = asyncio.Queue(MAX_QUEUED_JOBS)
+            asyncio.create_task(self._printer_worker(printer_id))
+
+
+    def get_queue_sizes(self) -> dict[int, int]:
+        return {
+            printer_id: queue.qsize()
+            for printer_id, queue in self._queues.items()
+        }
+
+
+    def get_printers_status(self) -> list[dict]:
+        queue_sizes = self.get_queue_sizes()
+
+        return [
+            {
+                "id": printer_id,
+                "ip_address": self.printers[printer_id].host,
+                "queue_size": queue_sizes[printer_id],
+                **health.to_dict(),
+            }
+            for printer_id, health in self._health.items()
+        ]
+
+
+    async def _printer_worker(self, printer_id: int):
+        queue = self._queues[printer_id]
+        health = self._health[printer_id]
+
+        while True:
+            if health.state == CircuitState.OPEN:
+                # Nothing is sent to the printer until the retry time
+                now = datetime.datetime.now(datetime.timezone.utc)
+                await asyncio.sleep((health.retry_at - now).total_seconds())
+
+                health.state = CircuitState.HALF_OPEN
+
+                # Without anything to print the printer is probed
+                if queue.empty():
+                    await self._probe_printer(printer_id)
+                    continue
+
+            try:
+                ticket = await asyncio.wait_for(
+                    queue.get(), PRINTER_IDLE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                if self.printers[printer_id]._device:
+                    await asyncio.to_thread(
+                        self._close_idle_connection, printer_id
+                    )
+
+                continue
+
+            if isinstance(ticket, PrintJob):
+                try:
+                    await self._print_job(ticket, printer_id)
+                finally:
+                    queue.task_done()
+
+                continue
+
+            try:
+                printed = await self.print_ticket(ticket, update_db=True)
+            except Exception as e:
+                logger.exception(e)
+                printed = False
+            finally:
+                self._queued_tickets.discard(ticket.id)
+                queue.task_done()
+
+            if printed:
+                self._failures.pop(ticket.order_id, None)
+            else:
+                self._retry_order(ticket.order_id)
     
 
-    def _threaded_print(self, printer: Network, content: str, lock: threading.Lock):
+    @staticmethod
+    def _get_role_printers(
+        order: Order, printer_types: list[PrinterType] | None
+    ) -> list[RolePrinter]:
+        """
+        Printers of the order for every requested type, taken from the first
+        of: the printers chosen for the order, the ones of the role of its
+        user, of the role of the user who confirmed it and of the role
+        confirming the orders of its user
+        """
+
+        role = order.user.role
+        sources = [
+            [x.role_printer for x in order.order_printers],
+            list(role.printers),
+        ]
+
+        if order.confirmed_by is not None:
+            sources.append(list(order.confirmed_by.role.printers))
+
+        if role.order_confirmer is not None:
+            sources.append(list(role.order_confirmer.printers))
+
+        role_printers = []
+        for printer_type in printer_types or list(PrinterType):
+            for source in sources:
+                matches = [x for x in source if x.printer_type == printer_type]
+
+                if matches:
+                    role_printers.extend(matches)
+                    break
+
+        return role_printers
+
+
+    async def add_job(
+        self, order: Order, printer_types: list[PrinterType] | None = None
+    ) -> PrintJob:
+        """
+        Queue the print of the order on its printers, without waiting for
+        them. The order must be fetched with its products, menus, tickets
+        and printers.
+        """
+
+        targets: dict[int, list[PrinterType]] = {}
+        for role_printer in self._get_role_printers(order, printer_types):
+            types = targets.setdefault(role_printer.printer_id, [])
+
+            if role_printer.printer_type not in types:
+                types.append(role_printer.printer_type)
+
+        if not targets:
+            raise NotFound(code=ErrorCodes.ROLE_PRINTER_NOT_FOUND, message="Nessuna stampante configurata per l'ordine")
+
+        # Nothing is queued unless every printer can take the job
+        now = datetime.datetime.now(datetime.timezone.utc)
+        for printer_id in targets:
+            queue = self._queues.get(printer_id)
+
+            if queue is None:
+                raise NotFound(code=ErrorCodes.PRINTER_NOT_FOUND, message=f"Stampante {printer_id} non configurata")
+
+            if not self._health[printer_id].is_available(now):
+                raise Conflict(code=ErrorCodes.PRINTER_UNAVAILABLE, message=f"Stampante {printer_id} non disponibile")
+
+            if queue.full():
+                raise Conflict(code=ErrorCodes.PRINTER_QUEUE_FULL, message=f"Coda della stampante {printer_id} piena")
+
+        self._last_job_id += 1
+        job = PrintJob(
+            id=self._last_job_id,
+            order_id=order.id,
+            order=order,
+            printer_types=targets,
+        )
+
+        self._jobs[job.id] = job
+        if len(self._jobs) > MAX_STORED_JOBS:
+            self._jobs.popitem(last=False)
+
+        for printer_id in targets:
+            self._queues[printer_id].put_nowait(job)
+
+        return job
+
+
+    def get_job(self, job_id: int) -> PrintJob | None:
+        return self._jobs.get(job_id)
+
+
+    async def _print_job(self, job: PrintJob, printer_id: int):
+        printer = self.printers[printer_id]
+        job.status = PrintJobStatus.PRINTING
+
+        try:
+            # Rendering a whole order is slow, it runs in the printing thread
+            data = await asyncio.to_thread(
+                self._render_order, job.order, job.printer_types[printer_id]
+            )
+            await self._send(printer_id, data)
+        except Exception as e:
+            logger.error(
+                f"Errore di stampa su {printer.host} → ordine {job.order_id}"
+            )
+            logger.exception(e)
+
+            job.failed_printer_ids.append(printer_id)
+
+        job.pending_printer_ids.discard(printer_id)
+
+        if not job.pending_printer_ids:
+            job.status = (
+                PrintJobStatus.FAILED
+                if job.failed_printer_ids
+                else PrintJobStatus.DONE
+            )
+            job.completed_at = datetime.datetime.now(datetime.timezone.utc)
+            job.order = None
+
+
+    async def _send(self, printer_id: int, data: bytes):
+        try:
+            await asyncio.to_thread(
+                self._threaded_print,
+                self.printers[printer_id],
+                data,
+                self._printer_locks[printer_id],
+            )
+        except PRINTER_ERRORS:
+            self._add_printer_failure(printer_id)
+            raise
+
+        self._health[printer_id].add_success()
+
+
+    async def _probe_printer(self, printer_id: int):
+        try:
+            await asyncio.to_thread(self._threaded_probe, printer_id)
+        except PRINTER_ERRORS:
+            self._add_printer_failure(printer_id)
+            return
+
+        logger.info(f"Stampante {printer_id} di nuovo disponibile")
+        self._health[printer_id].add_success()
+
+
+    def _add_printer_failure(self, printer_id: int):
+        health = self._health[printer_id]
+        health.add_failure()
+
+        delay = (health.retry_at - health.last_failure_at).total_seconds()
+        logger.warning(
+            f"Stampante {printer_id} non disponibile, nuovo tentativo tra {delay:.0f} secondi"
+        )
+
+
+    def _threaded_probe(self, printer_id: int):
+        # The connection is kept for the next print
+        with self._printer_locks[printer_id]:
+            self._ensure_connection(self.printers[printer_id])
+
+
+    def _threaded_print(self, printer: Network, data: bytes, lock: threading.Lock):
         # Eseguito in thread tramite asyncio.to_thread
         with lock:
-            # _print_content è già sincrona e fa I/O di rete
-            self._print_content(printer, content)
+            is_reused = self._ensure_connection(printer)
+
+            try:
+                # The whole ticket is sent with a single write
+                printer._raw(data)
+            except OSError:
+                printer.close()
+
+                if not is_reused:
+                    raise
+
+                # The printer dropped the connection while it was idle
+                self._open_connection(printer)
+                printer._raw(data)
+
             return True
 
 
+    @staticmethod
+    def _open_connection(printer: Network):
+        printer.open()
+
+        connection = printer.device
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        for option, value in (
+            ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+            ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+            ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+        ):
+            if hasattr(socket, option):
+                connection.setsockopt(
+                    socket.IPPROTO_TCP, getattr(socket, option), value
+                )
+
+
+    @staticmethod
+    def _is_connected(printer: Network) -> bool:
+        connection = printer._device
+        if not connection:
+            return False
+
+        try:
+            is_readable, _, _ = select.select([connection], [], [], 0)
+
+            # A closed connection is readable without data, the status
+            # bytes sent by the printer are discarded
+            return not is_readable or connection.recv(1024) != b""
+        except OSError:
+            return False
+
+
+    def _ensure_connection(self, printer: Network) -> bool:
+        """
+        Reuse the connection to the printer while it is alive, otherwise
+        open a new one. Return whether the connection was reused.
+        """
+
+        if self._is_connected(printer):
+            return True
+
+        printer.close()
+        self._open_connection(printer)
+
+        return False
+
+
+    def _close_idle_connection(self, printer_id: int):
+        with self._printer_locks[printer_id]:
+            self.printers[printer_id].close()
+
+
+    def _on_event(self, event: Event):
+        # Any change of an order or of its tickets can move its due time
+        if event.order_id is not None:
+            self._changed_orders.add(event.order_id)
+            self._wakeup.set()
+
+
+    def _schedule_order(self, order_id: int, due_time: datetime.datetime | None):
+        if due_time is None:
+            self._due_times.pop(order_id, None)
+        elif self._due_times.get(order_id) != due_time:
+            self._due_times[order_id] = due_time
+            heapq.heappush(self._schedule, (due_time, order_id))
+
+
+    def _schedule_order_earlier(self, order_id: int, due_time: datetime.datetime):
+        current = self._due_times.get(order_id)
+
+        if current is None or due_time < current:
+            self._schedule_order(order_id, due_time)
+
+
+    def _retry_order(self, order_id: int):
+        # Failed prints are retried later, waiting more after every failure
+        failures = self._failures.get(order_id, 0)
+        self._failures[order_id] = failures + 1
+
+        retry_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+            seconds=min(RETRY_DELAY * STEP ** failures, MAX_RETRY_DELAY)
+        )
+        self._schedule_order_earlier(order_id, retry_time)
+        self._wakeup.set()
+
+
+    async def _load_due_times(self, order_ids: set[int] | None = None):
+        # Without order ids every order with tickets to print is loaded
+        query = OrderSummary.filter(order__is_done=False, order__is_deleted=False)
+
+        if order_ids is None:
+            query = query.filter(next_print_at__isnull=False)
+        else:
+            query = query.filter(order_id__in=order_ids)
+
+        due_times = dict(await query.values_list("order_id", "next_print_at"))
+
+        for order_id in due_times if order_ids is None else order_ids:
+            self._schedule_order(order_id, due_times.get(order_id))
+
+
     async def update_worker(self):
+        is_loaded = False
+
+        while True:
+            self._wakeup.clear()
+            now = datetime.datetime.now(datetime.timezone.utc)
+            due_orders = set()
+
+            try:
+                if not is_loaded:
+                    await self._load_due_times()
+                    is_loaded = True
+
+                if self._changed_orders:
+                    order_ids, self._changed_orders = self._changed_orders, set()
+
+                    try:
+                        await self._load_due_times(order_ids)
+                    except Exception:
+                        self._changed_orders |= order_ids
+                        raise
+
+                while self._schedule and self._schedule[0][0] <= now:
+                    due_time, order_id = heapq.heappop(self._schedule)
+
+                    # Entries replaced by a later schedule are skipped
+                    if self._due_times.get(order_id) == due_time:
+                        del self._due_times[order_id]
+                        due_orders.add(order_id)
+
+                if due_orders:
+                    await self._print_due_tickets(due_orders, now)
+                    continue
+
+            except Exception as e:
+                logger.error("Errore durante la pianificazione delle stampe")
+                logger.exception(e)
+
+                for order_id in due_orders:
+                    self._schedule_order(
+                        order_id, now + datetime.timedelta(seconds=RETRY_DELAY)
+                    )
+
+                await asyncio.sleep(RETRY_DELAY)
+                continue
+
+            # Sleep until the next due order or until an order changes
+            timeout = None
+            if self._schedule:
+                timeout = (self._schedule[0][0] - now).total_seconds()
+
+            logger.debug(
+                f"Fine ciclo. Prossima stampa tra {timeout} secondi."
+            )
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+    async def _print_due_tickets(self, order_ids: set[int], now: datetime.datetime):
         prefetch_values = [
             "category__printer",
             "order__order_products__product__subcategory",
             "order__order_products__order_product_ingredients__ingredient",
             "order__order_products__variant",
             "order__order_menus__order_menu_fields__order_menu_field_products__order_product_ingredients__ingredient",
+            "order__order_menus__order_menu_fields__order_menu_field_products__product",
+            "order__order_menus__order_menu_fields__order_menu_field_products__variant",
             "order__order_menus__menu",
             "order__user",
-            "order__confirmed_by"
+            "order__confirmed_by",
+            "order__order_revisions"
         ]
 
-        while True:
-            tickets = (
-                await Ticket.filter(
-                    printed_at=None,
-                    completed_at=None,
-                    order__is_done=False,
-                    order__is_deleted=False,
-                    order__confirmed_at__isnull=False
-                )
-                .prefetch_related(*prefetch_values)
-            )
+        # A ticket leaves the queues after its print is committed, so the
+        # ones printed while the query runs are still in this copy
+        queued_tickets = set(self._queued_tickets)
 
-            rome_tz = pytz.timezone("Europe/Rome")
-            now_in_rome = datetime.datetime.now(rome_tz)
-
-            ready_tickets = []
-            printed_tickets = []
-
-            for t in tickets:
-                if getattr(t.category, "wait_parent_category"):
-                    parent_t = await Ticket.filter(
-                        order_id=t.order_id,
-                        category_id=getattr(t.category, "parent_category_id")
-                    ).first()
-                    if not parent_t:
-                        raise NotFound(ErrorCodes.TICKET_NOT_FOUND, message=f"Ticket genitore non trovato per l'ordine {t.order_id}")
-                    
-                    confirmed_at = getattr(parent_t, "completed_at", None)
-                else:
-                    confirmed_at = getattr(t.order, "confirmed_at", None)
-                
-                print_delay = getattr(t.category, "print_delay", 0) or 0
+        tickets = (
+            await Ticket.filter(order_id__in=order_ids, **TICKETS_TO_PRINT)
+            .prefetch_related(*prefetch_values)
+        )
 
-                if confirmed_at is None:
+        # Completion times of the parent tickets, read with a single query
+        parent_keys = {
+            (t.order_id, t.category.parent_category_id)
+            for t in tickets
+            if t.category.wait_parent_category
+        }
+        parent_completed_at = {}
+
+        if parent_keys:
+            parent_tickets = await Ticket.filter(
+                order_id__in={x[0] for x in parent_keys},
+                category_id__in={x[1] for x in parent_keys},
+            ).values_list("order_id", "category_id", "completed_at")
+
+            parent_completed_at = {
+                (order_id, category_id): completed_at
+                for order_id, category_id, completed_at in parent_tickets
+            }
+
+        ready_tickets = []
+
+        for t in tickets:
+            # Already waiting for its printer
+            if t.id in queued_tickets:
+                continue
+
+            if t.category.wait_parent_category:
+                parent_key = (t.order_id, t.category.parent_category_id)
+
+                if parent_key not in parent_completed_at:
+                    logger.warning(f"Comanda genitore non trovata per la comanda #{t.id} dell'ordine {t.order_id}")
                     continue
 
-                if confirmed_at + datetime.timedelta(seconds=print_delay) <= now_in_rome:
-                    ready_tickets.append(t)
+                confirmed_at = parent_completed_at[parent_key]
+            else:
+                confirmed_at = getattr(t.order, "confirmed_at", None)
 
+            print_delay = getattr(t.category, "print_delay", 0) or 0
 
-            logger.info(f"Trovate {len(ready_tickets)} comande da stampare.")
+            if confirmed_at is None:
+                continue
 
-            for ticket in ready_tickets:
-                printed = await self.print_ticket(ticket, update_db=True)
-                if printed:
-                    printed_tickets.append(ticket)
-                
-
-            # Set is_done=True for completed orders in this cycle
-            """
-            async with in_transaction() as connection:
-                orders = await Order.filter(
-                    id__in=[t.order_id for t in printed_tickets],
-                    is_done=False
-                ).prefetch_related("order_tickets").using_db(connection)
-
-                for order in orders:
-                    tickets_to_print = len([t for t in order.order_tickets if t.printed_at == None])
-                    if tickets_to_print == 0:
-                        order.is_done = True
-                    else:
-                        orders.remove(order)
-                
-                if len(orders) > 0:
-                    try:
-                        await Order.bulk_update(orders, fields=['is_done'], using_db=connection)
-                    except IntegrityError:
-                        raise Conflict(code=ErrorCodes.ORDER_UPDATE_FAILED)
-            """
+            due_time = confirmed_at + datetime.timedelta(seconds=print_delay)
 
-            logger.debug(
-                f"Fine ciclo. Attesa di {RETRY_DELAY} secondi prima del prossimo aggiornamento."
-            )
-            await asyncio.sleep(RETRY_DELAY)
+            if due_time <= now:
+                ready_tickets.append(t)
+            else:
+                self._schedule_order_earlier(t.order_id, due_time)
+
+
+        logger.info(f"Trovate {len(ready_tickets)} comande da stampare.")
+
+        for ticket in ready_tickets:
+            printer_id = ticket.category.printer_id
+            if printer_id is None:
+                continue
+
+            queue = self._queues.get(printer_id)
+            if queue is None:
+                logger.error(f"Stampante {printer_id} non configurata per la comanda #{ticket.id}")
+                self._retry_order(ticket.order_id)
+                continue
+
+            # Printers that are down are skipped until their retry time
+            health = self._health[printer_id]
+            if not health.is_available(now):
+                self._schedule_order_earlier(ticket.order_id, health.retry_at)
+                continue
+
+            try:
+                queue.put_nowait(ticket)
+            except asyncio.QueueFull:
+                logger.warning(f"Coda della stampante {printer_id} piena, comanda #{ticket.id} rimandata")
+                self._retry_order(ticket.order_id)
+                continue
+
+            self._queued_tickets.add(ticket.id)
+
+
+        # Set is_done=True for completed orders in this cycle
+        """
+        async with in_transaction() as connection:
+            orders = await Order.filter(
+                id__in=[t.order_id for t in printed_tickets],
+                is_done=False
+            ).prefetch_related("order_tickets").using_db(connection)
+
+            for order in orders:
+                tickets_to_print = len([t for t in order.order_tickets if t.printed_at == None])
+                if tickets_to_print == 0:
+                    order.is_done = True
+                else:
+                    orders.remove(order)
+
+            if len(orders) > 0:
+                try:
+                    await Order.bulk_update(orders, fields=['is_done'], using_db=connection)
+                except IntegrityError:
+                    raise Conflict(code=ErrorCodes.ORDER_UPDATE_FAILED)
+        """
 
 
     @staticmethod
-    def _print_content(printer: Network, content: str):
-        printer.open()
+    def _render_content(content: str) -> bytes:
+        """
+        Compile the text of a ticket into the ESC/POS commands to print it
+        """
+
+        printer = Dummy()
         printer.hw("INIT")
         printer.charcode("CP850")
         printer.buzzer(times=3, duration=1)
+        printer.set(align="left", font="a")
 
         content = content.replace("\r\n", "\n").replace("\r", "\n")
-        for line in content.splitlines(keepends=True):
-            printer.set(align="left", font="a",)
-
-            parts = re.split(r"(<DOUBLE>.*?</DOUBLE>)", line)
-            for part in parts:
-                if part.startswith("<DOUBLE>") and part.endswith("</DOUBLE>"):
-                    inner = part[len("<DOUBLE>") : -len("</DOUBLE>")]
-                    printer._raw(b"\x1B\x21\x30")
-                    printer.text(inner)
-                    printer._raw(b"\x1B\x21\x00")
-                else:
-                    printer.text(part)
+
+        # The double size parts never span lines, they are split out of the
+        # whole text: the odd parts are the text inside the tags
+        for i, part in enumerate(DOUBLE_PATTERN.split(content)):
+            if not part:
+                continue
+
+            if i % 2:
+                printer._raw(DOUBLE_SIZE_ON)
+                printer.text(part)
+                printer._raw(DOUBLE_SIZE_OFF)
+            else:
+                printer.text(part)
 
         printer.cut()
 
+        return printer.output
+
+
+    @classmethod
+    def _render_order(
+        cls, order: Order, printer_types: list[PrinterType]
+    ) -> bytes:
+        data = b""
+
+        for printer_type in printer_types:
+            if printer_type == PrinterType.RECEIPT:
+                text = OrderTextManager(order)
+                data += cls._render_content(
+                    text.generate_text_for_printer(PrinterType.RECEIPT)
+                )
+            else:
+                for ticket in order.order_tickets:
+                    text = OrderTextManager(order, ticket.category)
+                    data += cls._render_content(
+                        text.generate_text_for_printer(PrinterType.TICKET)
+                    )
+
+        return data
+
+
+    @staticmethod
+    def _get_ticket_key(ticket: Ticket) -> tuple:
+        """
+        Everything printed on a ticket: every update of the products adds a
+        revision, the header fields change without one, e.g. when the
+        order is confirmed again on another table
+        """
+
+        order = ticket.order
+
+        return (
+            ticket.order_id,
+            ticket.category_id,
+            max((x.id for x in order.order_revisions), default=0),
+            order.customer,
+            order.guests,
+            order.table,
+            order.notes,
+            order.user.username,
+            order.confirmed_at,
+            order.confirmed_by.username if order.confirmed_by else None,
+        )
+
+
+    def _get_ticket_data(self, ticket: Ticket) -> bytes:
+        # A reprint of an unchanged ticket reuses the bytes already rendered
+        key = self._get_ticket_key(ticket)
+
+        data = self._rendered_tickets.get(key)
+        if data is None:
+            text = OrderTextManager(ticket.order, ticket.category)
+            data = self._render_content(
+                text.generate_text_for_printer(PrinterType.TICKET)
+            )
+
+            self._rendered_tickets[key] = data
+            if len(self._rendered_tickets) > MAX_CACHED_TICKETS:
+                self._rendered_tickets.popitem(last=False)
+        else:
+            self._rendered_tickets.move_to_end(key)
+
+        return data
+
 
     async def print_ticket(self, ticket: Ticket, update_db: bool) -> bool:
         logger.debug(
             f"Stampa comanda #{ticket.id} (categoria {ticket.category_id} dell'ordine {ticket.order_id})"
         )
 
-        text = OrderTextManager(ticket.order, ticket.category)
-        content = text.generate_text_for_printer(PrinterType.TICKET)
-
         printer_id = ticket.category.printer_id
         if printer_id is None:
             return True
 
+        # The ticket may have waited in the printer queue: meanwhile it can
+        # be completed, printed by hand or deleted with its order
+        if update_db and not await Ticket.filter(
+            id=ticket.id, **TICKETS_TO_PRINT
+        ).exists():
+            logger.info(f"Comanda #{ticket.id} non più da stampare")
+            return True
+
+        data = self._get_ticket_data(ticket)
+
         printer = self.printers[printer_id]
-        lock = self._printer_locks.get(printer_id, threading.Lock())
 
         try:
-            #self._print_content(printer, content)
-            await asyncio.to_thread(self._threaded_print, printer, content, lock)
+            await self._send(printer_id, data)
 
-            # Saving printed state of ticket
+            # Saving printed state of ticket, only printed_at is written
+            # since the ticket can be completed while it prints
             if update_db:
                 rome_tz = pytz.timezone("Europe/Rome")
-                ticket.printed_at = datetime.datetime.now(rome_tz)
-                await ticket.save()
-            
+                printed_at = datetime.datetime.now(rome_tz)
+
+                async with in_transaction() as connection:
+                    is_updated = await Ticket.filter(
+                        id=ticket.id, printed_at=None
+                    ).using_db(connection).update(printed_at=printed_at)
+
+                    if is_updated:
+                        await add_order_changes([ticket.order_id], connection)
+
+                if is_updated:
+                    ticket.printed_at = printed_at
+                    await publish_ticket_events(EventType.TICKET_PRINTED, [ticket])
+
             return True
 
         except Exception as e:
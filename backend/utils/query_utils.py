@@ -1,15 +1,22 @@
-from typing import Type, TypeVar
+import base64
+import datetime
+import json
+from decimal import Decimal
+from typing import Any, Type, TypeVar
 
 from tortoise import Model, BaseDBAsyncClient
 from tortoise.exceptions import FieldError
-from tortoise.expressions import Q, Expression
+from tortoise.expressions import Q, Expression, Subquery
 from tortoise.queryset import QuerySet
 
-from backend.models.error import NotFound
-from backend.utils import ErrorCodes
+from backend.models.error import BadRequest, NotFound
+from backend.utils import CountMode, ErrorCodes
 
 T = TypeVar("T", bound=Model)
 
+# asyncpg accepts at most 32767 bind parameters per statement
+MAX_QUERY_PARAMETERS = 32767
+
 
 async def process_query_with_pagination(
     model: Type[T],
@@ -19,22 +26,257 @@ async def process_query_with_pagination(
     limit: int,
     order_by: str,
     annotate_expression: dict[str, Expression] = None,
-) -> tuple[QuerySet[T], int, int]:
+    after: str | None = None,
+    before: str | None = None,
+    count: CountMode | None = None,
+) -> tuple[QuerySet[T], int | None, int]:
+    """
+    Filter and sort a list query. With an after or before cursor the page
+    starts from the row of the cursor instead of an offset, so deep pages
+    cost the same as the first one.
+
+    The total count is exact by default for offset pagination and is only
+    computed on request for cursor pagination.
+    """
+
     query = model
 
     if annotate_expression:
         query = query.annotate(**annotate_expression)
 
     query = query.filter(query_filter).using_db(connection)
-    total_count = await query.count()
+    is_cursor = after is not None or before is not None
 
-    if not limit:
-        limit = total_count - offset
+    if count is None and not is_cursor:
+        count = CountMode.EXACT
 
-    if order_by:
+    total_count = None
+    if count == CountMode.EXACT:
+        total_count = await query.count()
+    elif count == CountMode.ESTIMATE:
+        total_count = await _estimate_count(query, connection)
+
+    if is_cursor:
+        query = _apply_cursor(
+            query,
+            model,
+            order_by,
+            after,
+            before,
+            offset,
+            limit,
+            annotate_expression,
+        )
+    else:
         try:
-            query = query.order_by(order_by)
+            # Sorted as the cursors expect, so the first page can be
+            # followed by cursor pages
+            query = query.order_by(*_get_ordering(order_by))
         except FieldError:
             raise NotFound(code=ErrorCodes.UNKNOWN_ORDER_BY_PARAMETER)
 
+    if not limit:
+        if count == CountMode.EXACT and not is_cursor:
+            limit = total_count - offset
+        else:
+            limit = await query.count() - offset
+
     return query, total_count, limit
+
+
+def get_page_cursors(
+    items: list[Model],
+    order_by: str,
+    limit: int | None,
+    after: str | None = None,
+    before: str | None = None,
+) -> tuple[str | None, str | None]:
+    """
+    Cursors of the pages before and after the given one. The limit is the
+    one requested by the client: a page without a limit, or shorter than
+    it, is the last one in its direction.
+    """
+
+    if not items:
+        return None, None
+
+    is_full = bool(limit) and len(items) >= limit
+    field = (order_by or "").lstrip("-") or "id"
+
+    previous_cursor = None
+    if after is not None or (before is not None and is_full):
+        previous_cursor = _encode_cursor(items[0], field)
+
+    next_cursor = None
+    if before is not None or is_full:
+        next_cursor = _encode_cursor(items[-1], field)
+
+    return previous_cursor, next_cursor
+
+
+def _encode_cursor(item: Model, field: str) -> str:
+    value = getattr(item, field)
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+
+    return (
+        base64.urlsafe_b64encode(json.dumps([value, item.id]).encode())
+        .decode()
+        .rstrip("=")
+    )
+
+
+def _decode_cursor(
+    cursor: str, model: Type[Model], field: str
+) -> tuple[Any, int]:
+    try:
+        value, item_id = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+
+        if value is not None and field in model._meta.fields_map:
+            value = model._meta.fields_map[field].to_python_value(value)
+
+        return value, int(item_id)
+    except (ValueError, TypeError):
+        raise BadRequest(code=ErrorCodes.INVALID_CURSOR)
+
+
+def _keyset_filter(field: str, value: Any, item_id: int, forward: bool) -> Q:
+    # Rows after (or before) the cursor, sorted by field and id with the
+    # nulls treated as the greatest values, as Postgres does
+    if forward:
+        if value is None:
+            return Q(**{f"{field}__isnull": True, "id__gt": item_id})
+
+        return (
+            Q(**{f"{field}__gt": value})
+            | Q(**{field: value, "id__gt": item_id})
+            | Q(**{f"{field}__isnull": True})
+        )
+
+    if value is None:
+        return Q(**{f"{field}__isnull": False}) | Q(
+            **{f"{field}__isnull": True, "id__lt": item_id}
+        )
+
+    return Q(**{f"{field}__lt": value}) | Q(
+        **{field: value, "id__lt": item_id}
+    )
+
+
+def _get_ordering(order_by: str | None) -> tuple[str, ...]:
+    # The id breaks the ties, in the same direction as the column
+    if not order_by or order_by.lstrip("-") == "id":
+        return (order_by or "id",)
+
+    return order_by, "-id" if order_by.startswith("-") else "id"
+
+
+def _apply_cursor(
+    query: QuerySet[T],
+    model: Type[T],
+    order_by: str,
+    after: str | None,
+    before: str | None,
+    offset: int,
+    limit: int,
+    annotate_expression: dict[str, Expression] | None,
+) -> QuerySet[T]:
+    if (after is not None and before is not None) or offset:
+        raise BadRequest(code=ErrorCodes.INVALID_CURSOR)
+
+    order_by = order_by or ""
+    is_descending = order_by.startswith("-")
+    field = order_by.lstrip("-") or "id"
+
+    if field not in model._meta.fields_db_projection and field not in (
+        annotate_expression or {}
+    ):
+        raise NotFound(code=ErrorCodes.UNKNOWN_ORDER_BY_PARAMETER)
+
+    ordering = _get_ordering(order_by)
+
+    value, item_id = _decode_cursor(after or before, model, field)
+    # A forward cursor moves towards the greatest values
+    forward = (after is not None) != is_descending
+
+    if after is not None:
+        return query.filter(
+            _keyset_filter(field, value, item_id, forward)
+        ).order_by(*ordering)
+
+    # The page before the cursor is read backwards, then sorted again
+    reversed_ordering = tuple(
+        x[1:] if x.startswith("-") else f"-{x}" for x in ordering
+    )
+    page = query.filter(_keyset_filter(field, value, item_id, forward))
+    page = page.order_by(*reversed_ordering)
+
+    if limit:
+        page = page.limit(limit)
+
+    return query.filter(id__in=Subquery(page.values("id"))).order_by(
+        *ordering
+    )
+
+
+async def _estimate_count(
+    query: QuerySet, connection: BaseDBAsyncClient
+) -> int:
+    # Rows expected by the planner, without reading them
+    result = await connection.execute_query_dict(
+        f"EXPLAIN (FORMAT JSON) {query.sql(params_inline=True)}"
+    )
+    plan = result[0]["QUERY PLAN"]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def bulk_insert(
+    model: Type[Model],
+    columns: tuple[str, ...],
+    rows: list[tuple],
+    connection: BaseDBAsyncClient,
+) -> list[int]:
+    """
+    Insert many rows with multi-row INSERT statements and return the
+    generated ids, in the same order as the given rows.
+    """
+
+    if not rows:
+        return []
+
+    table = model._meta.db_table
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    chunk_size = MAX_QUERY_PARAMETERS // len(columns)
+
+    ids = []
+    for start in range(0, len(rows), chunk_size):
+        placeholders = []
+        values = []
+
+        for row in rows[start : start + chunk_size]:
+            placeholders.append(
+                "("
+                + ", ".join(
+                    f"${len(values) + i + 1}" for i in range(len(row))
+                )
+                + ")"
+            )
+            values.extend(row)
+
+        result = await connection.execute_query_dict(
+            f'INSERT INTO "{table}" ({column_list}) '
+            f'VALUES {", ".join(placeholders)} RETURNING "id"',
+            values,
+        )
+        ids.extend(row["id"] for row in result)
+
+    return ids
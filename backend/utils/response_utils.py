@@ -0,0 +1,17 @@
+from typing import Type
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_response(model: Type[BaseModel], content: dict) -> Response:
+    """
+    Validate a plain dict once against the response model and send it
+    already serialized. FastAPI would walk a returned dict to look for
+    models and then validate it again against the response_model.
+    """
+
+    return Response(
+        model.model_validate(content).model_dump_json(),
+        media_type="application/json",
+    )
@@ -0,0 +1,44 @@
+"""
+Time the cents pricing engine against the previous Decimal(float)
+arithmetic on the same random orders.
+
+    python -m benchmarks.pricing
+"""
+
+import random
+import timeit
+
+import backend.utils  # noqa: F401
+from backend.services.pricing import price_order
+from tests.test_pricing import legacy_price_order, random_catalog, random_order
+
+ORDERS = 1000
+COVER_CHARGE = 2.5
+
+
+def main():
+    rng = random.Random(0)
+    catalog = random_catalog(rng)
+    orders = [random_order(rng, catalog) for _ in range(ORDERS)]
+
+    results = {}
+    for name, function in (
+        ("decimal", legacy_price_order),
+        ("cents", price_order),
+    ):
+        seconds = min(
+            timeit.repeat(
+                lambda: [function(x, catalog, COVER_CHARGE) for x in orders],
+                number=1,
+                repeat=5,
+            )
+        )
+        results[name] = seconds
+
+        print(f"{name:>8}: {seconds / ORDERS * 1e6:8.1f} µs per order")
+
+    print(f" speedup: {results['decimal'] / results['cents']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
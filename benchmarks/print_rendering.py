@@ -0,0 +1,65 @@
+"""
+Time the rendering of a ticket into ESC/POS bytes: the previous per-line
+printing, the single buffer rendering and a reprint read from the cache
+of the rendered tickets.
+
+    python -m benchmarks.print_rendering
+"""
+
+import timeit
+from types import SimpleNamespace
+from unittest import mock
+
+from escpos.printer import Dummy
+
+import backend.utils  # noqa: F401
+from backend.utils.order_text_manager import OrderTextManager
+from backend.utils.print_manager import PrintManager
+from tests.test_print_rendering import (
+    TICKET_TEXT,
+    legacy_print_content,
+    make_ticket,
+)
+
+TICKETS = 1000
+
+
+def render_legacy() -> bytes:
+    printer = Dummy()
+    legacy_print_content(printer, TICKET_TEXT)
+
+    return printer.output
+
+
+def main():
+    manager = PrintManager()
+    ticket = make_ticket(1, [1])
+
+    with mock.patch.object(
+        OrderTextManager,
+        "generate_text_for_printer",
+        lambda self, printer_type: TICKET_TEXT,
+    ):
+        for name, function in (
+            ("per line", render_legacy),
+            ("buffer", lambda: PrintManager._render_content(TICKET_TEXT)),
+            ("cached", lambda: manager._get_ticket_data(ticket)),
+        ):
+            size = len(function())
+            seconds = min(
+                timeit.repeat(
+                    lambda: [function() for _ in range(TICKETS)],
+                    number=1,
+                    repeat=5,
+                )
+            )
+
+            print(
+                f"{name:>8}: {seconds / TICKETS * 1e6:8.1f} µs per ticket, "
+                f"{size} bytes, "
+                f"{size * TICKETS / seconds / 1e6:8.2f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
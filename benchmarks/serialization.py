@@ -0,0 +1,255 @@
+"""
+Time the serialization of a page of orders, from the prefetched models to
+the response body: the synchronous to_dict validated once against the
+response model, against the previous coroutine per element and Pydantic
+models validated again by FastAPI.
+
+    python -m benchmarks.serialization
+"""
+
+import asyncio
+import datetime
+import gc
+import json
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from tortoise import Tortoise
+
+import backend.utils  # noqa: F401
+from backend.database.models import (
+    Order,
+    OrderMenu,
+    OrderMenuField,
+    OrderProduct,
+    OrderProductIngredient,
+)
+from backend.models.orders import GetOrdersResponse
+from backend.models.orders import Order as OrderModel
+from backend.utils.response_utils import model_response
+
+ORDERS = 100
+REPEAT = 20
+BATCH = 10
+INCLUDES = {
+    "include_menus": True,
+    "include_menus_fields": True,
+    "include_menus_fields_products": True,
+    "include_menus_fields_products_ingredients": True,
+    "include_products": True,
+    "include_products_ingredients": True,
+}
+
+
+def set_related(instance, field: str, objects: list) -> None:
+    # Fill the relation as prefetch_related does
+    getattr(instance, field)._set_result_for_query(objects)
+
+
+def make_product(product_id: int, order: Order, **kwargs) -> OrderProduct:
+    product = OrderProduct(
+        id=product_id,
+        order_id=order.id,
+        product_id=product_id % 7 + 1,
+        variant_id=None,
+        category_id=1,
+        price=7.5,
+        quantity=2,
+        notes=None,
+        **kwargs,
+    )
+    set_related(
+        product,
+        "order_product_ingredients",
+        [
+            OrderProductIngredient(
+                id=product_id * 10 + x,
+                order_product_id=product_id,
+                ingredient_id=x + 1,
+                quantity=1,
+            )
+            for x in range(2)
+        ],
+    )
+
+    return product
+
+
+def make_orders() -> list[Order]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    orders = []
+
+    for order_id in range(1, ORDERS + 1):
+        order = Order(
+            id=order_id,
+            customer=f"cliente {order_id}",
+            guests=4,
+            is_take_away=False,
+            table=str(order_id),
+            is_confirmed=True,
+            is_done=False,
+            is_voucher=False,
+            is_for_service=False,
+            has_tickets=True,
+            notes=None,
+            price=42.5,
+            created_at=now,
+            confirmed_at=now,
+            payment_method_id=1,
+        )
+        products = [
+            make_product(order_id * 100 + x, order) for x in range(5)
+        ]
+
+        menus = []
+        for menu_index in range(2):
+            menu_id = order_id * 100 + menu_index
+            menu = OrderMenu(
+                id=menu_id, order_id=order_id, menu_id=1, price=12, quantity=1
+            )
+
+            fields = []
+            for field_index in range(2):
+                field_id = menu_id * 10 + field_index
+                field = OrderMenuField(
+                    id=field_id, order_menu_id=menu_id, menu_field_id=1
+                )
+                set_related(
+                    field,
+                    "order_menu_field_products",
+                    [
+                        make_product(
+                            field_id * 10 + x,
+                            order,
+                            order_menu_field_id=field_id,
+                        )
+                        for x in range(2)
+                    ],
+                )
+                fields.append(field)
+
+            set_related(menu, "order_menu_fields", fields)
+            menus.append(menu)
+
+        set_related(order, "order_products", products)
+        set_related(order, "order_menus", menus)
+        orders.append(order)
+
+    return orders
+
+
+async def legacy_to_dict(instance) -> dict:
+    return instance.to_dict()
+
+
+async def legacy_product_to_dict(product: OrderProduct) -> dict:
+    result = product.to_dict()
+    result["ingredients"] = [
+        await legacy_to_dict(x) for x in product.order_product_ingredients
+    ]
+
+    return result
+
+
+async def legacy_order_to_dict(order: Order) -> dict:
+    result = order.to_dict()
+    result["menus"] = []
+
+    for menu in order.order_menus:
+        menu_result = menu.to_dict()
+        menu_result["fields"] = []
+
+        for field in menu.order_menu_fields:
+            field_result = field.to_dict()
+            field_result["products"] = [
+                await legacy_product_to_dict(x)
+                for x in field.order_menu_field_products
+            ]
+            menu_result["fields"].append(field_result)
+
+        result["menus"].append(menu_result)
+
+    result["products"] = [
+        await legacy_product_to_dict(x)
+        for x in order.order_products
+        if not x.order_menu_field_id
+    ]
+
+    return result
+
+
+async def legacy_response(field, orders: list[Order]) -> bytes:
+    # One coroutine per element and a Pydantic model built by the
+    # endpoint, then dumped, validated and encoded again by FastAPI
+    response = GetOrdersResponse(
+        total_count=len(orders),
+        previous_cursor=None,
+        next_cursor=None,
+        orders=[OrderModel(**await legacy_order_to_dict(x)) for x in orders],
+    )
+    content = await serialize_response(field=field, response_content=response)
+
+    return JSONResponse(content).body
+
+
+async def current_response(field, orders: list[Order]) -> bytes:
+    return model_response(
+        GetOrdersResponse,
+        {
+            "total_count": len(orders),
+            "previous_cursor": None,
+            "next_cursor": None,
+            "orders": [x.to_dict(**INCLUDES) for x in orders],
+        },
+    ).body
+
+
+async def run():
+    # The models are bound to a connection that is never opened
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["backend.database.models"]},
+    )
+    orders = make_orders()
+    field = create_model_field(
+        "Response", GetOrdersResponse, mode="serialization"
+    )
+
+    assert json.loads(await legacy_response(field, orders)) == json.loads(
+        await current_response(field, orders)
+    )
+
+    # The two paths are interleaved so that both see the same noise
+    timings = {legacy_response: [], current_response: []}
+    for _ in range(REPEAT):
+        for function, function_timings in timings.items():
+            # As timeit does, the collector does not run while timing
+            gc.collect()
+            gc.disable()
+            start = time.process_time()
+            for _ in range(BATCH):
+                await function(field, orders)
+            function_timings.append((time.process_time() - start) / BATCH)
+            gc.enable()
+
+    results = {
+        "legacy": min(timings[legacy_response]),
+        "current": min(timings[current_response]),
+    }
+    for name, seconds in results.items():
+        print(
+            f"{name:>8}: {seconds * 1e3:8.2f} ms CPU per request "
+            f"({ORDERS} orders)"
+        )
+
+    print(f" speedup: {results['legacy'] / results['current']:8.1f}x")
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,12 @@ from backend.database import init_db, stop_db
 from backend.database.models import Role, User, Setting
 from backend.models import BaseResponse, UnicornException
 from backend.models.settings import Settings
+from backend.services.idempotency import IdempotencyStore
+from backend.services.order_changes import purge_order_changes
+from backend.services.orders import (
+    add_missing_order_summaries,
+    rebuild_daily_sales,
+)
 from backend.utils import ErrorCodes, to_snake_case
 from backend.utils.print_manager import PrintManager
 
@@ -48,9 +54,9 @@ async def lifespan(_: FastAPI):
     await init_db()
     logger.info(f"Tortoise-ORM started")
 
-    # Print Manager
-    Session.print_manager = await PrintManager.create()
-    logger.info("Initializing Print Manager")
+    # Expired idempotency keys and order changes
+    await IdempotencyStore.purge()
+    await purge_order_changes()
 
     async with in_transaction() as connection:
         # Create settings row
@@ -60,7 +66,13 @@ async def lifespan(_: FastAPI):
             setting = await Setting.create(using_db=connection)
 
         # Settings
-        Session.settings = Settings(**await setting.to_dict())
+        Session.settings = Settings(**setting.to_dict())
+
+        # Daily sales counters of the current service day
+        await rebuild_daily_sales(connection)
+
+        # Summaries of the orders written before they existed
+        await add_missing_order_summaries(connection)
 
         # Create admin and base role
         role, _ = await Role.get_or_create(
@@ -85,6 +97,10 @@ async def lifespan(_: FastAPI):
     if created:
         logger.info(f"Created the admin user with password {password}")
 
+    # Print Manager, its schedule is loaded from the order summaries
+    Session.print_manager = await PrintManager.create()
+    logger.info("Initializing Print Manager")
+
     yield
 
     await stop_db()
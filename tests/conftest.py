@@ -0,0 +1,3 @@
+# The backend packages import each other, backend.utils must be loaded
+# first as the application does
+import backend.utils  # noqa: F401
@@ -0,0 +1,15 @@
+from backend.utils import ErrorCodes
+
+
+def test_new_codes_do_not_renumber_the_existing_ones():
+    # The clients know the codes by value: the ones added after the first
+    # release come after its last code
+    assert ErrorCodes.REQUEST_VALIDATION_ERROR.value == 93
+    assert [x.name for x in ErrorCodes if x.value > 93] == [
+        "IDEMPOTENCY_KEY_REUSED",
+        "INVALID_CURSOR",
+        "PRINT_JOB_NOT_FOUND",
+        "PRINTER_QUEUE_FULL",
+        "PRINTER_UNAVAILABLE",
+        "ORDER_CREATION_FAILED",
+    ]
@@ -0,0 +1,52 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from backend.services.order_search import OrderSearchIndex
+from backend.utils.datetime_utils import get_service_day
+
+ORDERS = {
+    1: ("Rossi", "4"),
+    2: ("Bianchi", "12"),
+    3: ("Sassi Mario", None),
+    4: ("Rossini", "7"),
+}
+
+
+@pytest.fixture(autouse=True)
+def index(monkeypatch):
+    # A loaded index of the current service day, without the database
+    monkeypatch.setattr(OrderSearchIndex, "_day", get_service_day())
+    monkeypatch.setattr(OrderSearchIndex, "_orders", {})
+    monkeypatch.setattr(OrderSearchIndex, "_trigrams", defaultdict(set))
+
+    for order_id, (customer, table) in ORDERS.items():
+        OrderSearchIndex._add(order_id, customer, table)
+
+
+def search(text: str, limit: int = 10) -> list[int]:
+    return asyncio.run(OrderSearchIndex.search(text, limit))
+
+
+def test_short_text_in_the_middle_of_a_word():
+    assert search("ss") == [3, 4, 1]
+    assert search("h") == [2]
+
+
+def test_short_text_ranks_like_longer_texts():
+    # Same table, then customer starting with the text
+    assert search("4") == [1]
+    assert search("ro") == [1, 4]
+    assert search("ma") == [3]
+
+
+def test_trigram_search():
+    assert search("rossi") == [1, 4]
+    assert search("ossi") == [1, 4]
+    assert search("bianci") == [2]
+
+
+def test_text_without_words():
+    assert search("-") == []
+    assert search("") == []
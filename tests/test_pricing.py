@@ -0,0 +1,409 @@
+import random
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+
+from backend.models.orders import (
+    CreateOrderItem,
+    CreateOrderMenuFieldItem,
+    CreateOrderMenuItem,
+    CreateOrderProductIngredientItem,
+    CreateOrderProductItem,
+)
+from backend.services.catalog import (
+    Catalog,
+    CatalogIngredient,
+    CatalogMenu,
+    CatalogMenuField,
+    CatalogMenuFieldProduct,
+    CatalogProduct,
+    CatalogVariant,
+)
+from backend.services.pricing import price_menu_field, price_order
+from backend.utils.price_utils import (
+    from_cents,
+    round_cents,
+    to_cents,
+    to_exact_price,
+)
+
+ZERO_DECIMAL = Decimal("0.00")
+# Prices with three decimals hit the half cent cases
+PRICES = [x / 1000 for x in range(0, 20000, 5)] + [
+    0.125, 0.375, 1.005, 2.675, 1.115, 0.045
+]
+
+
+def q(value) -> Decimal:
+    return Decimal(value).quantize(ZERO_DECIMAL)
+
+
+def legacy_price_product(
+    product_db: CatalogProduct,
+    product: CreateOrderProductItem,
+    is_menu: bool = False,
+) -> Decimal:
+    """
+    Unit price of a product as computed before the cents engine
+    """
+
+    price = ZERO_DECIMAL if is_menu else q(product_db.price)
+
+    if product.variant_id:
+        price += q(product_db.variants[product.variant_id].price)
+
+    for ingredient in product.ingredients:
+        price += q(product_db.ingredients[ingredient.ingredient_id].price)
+
+    return price
+
+
+def legacy_price_menu_field(
+    menu_field: CatalogMenuField, field: CreateOrderMenuFieldItem
+) -> list[Decimal]:
+    excess = (
+        sum(x.quantity for x in field.products)
+        - menu_field.max_sortable_elements
+    )
+    prices = []
+
+    for product in reversed(field.products):
+        field_product = menu_field.field_products[product.product_id]
+
+        price = q(
+            legacy_price_product(field_product.product, product, True)
+            * Decimal(product.quantity)
+        )
+        price += q(Decimal(field_product.price) * Decimal(product.quantity))
+
+        if excess > 0:
+            additional_cost = Decimal(menu_field.additional_cost)
+
+            if product.quantity <= excess:
+                price += q(additional_cost * Decimal(product.quantity))
+                excess -= product.quantity
+            else:
+                price += q(additional_cost * Decimal(excess))
+                excess = 0
+
+        prices.append(price)
+
+    return prices[::-1]
+
+
+def legacy_price_menu(menu_db: CatalogMenu, menu: CreateOrderMenuItem) -> Decimal:
+    price = q(menu_db.price)
+
+    for field in menu.fields:
+        for x in legacy_price_menu_field(
+            menu_db.menu_fields[field.menu_field_id], field
+        ):
+            price += q(x)
+
+    return q(q(price) * Decimal(menu.quantity))
+
+
+def legacy_price_order(
+    item: CreateOrderItem, catalog: Catalog, cover_charge: float
+) -> Decimal:
+    guests = Decimal(
+        item.guests
+        if not item.is_take_away
+        and not item.parent_order_id
+        and item.guests is not None
+        else 0
+    )
+
+    include_cover_charge = any(
+        catalog.products[x.product_id].include_cover_charge
+        for x in item.products
+    ) or any(
+        catalog.products[x.product_id].include_cover_charge
+        for menu in item.menus
+        for field in menu.fields
+        for x in field.products
+    )
+
+    price = ZERO_DECIMAL
+    if include_cover_charge and not item.is_take_away:
+        price = q(Decimal(cover_charge) * guests)
+
+    for x in item.products:
+        price += q(
+            legacy_price_product(catalog.products[x.product_id], x)
+            * Decimal(x.quantity)
+        )
+
+    for x in item.menus:
+        price += legacy_price_menu(catalog.menus[x.menu_id], x)
+
+    return price
+
+
+def random_catalog(rng: random.Random) -> Catalog:
+    products = {}
+
+    for product_id in range(1, 21):
+        variants = {
+            x: CatalogVariant(
+                id=x,
+                name=f"variante {x}",
+                price=(price := rng.choice(PRICES)),
+                price_cents=to_cents(price),
+                is_deleted=False,
+            )
+            for x in range(product_id * 10, product_id * 10 + rng.randint(0, 2))
+        }
+        ingredients = {
+            x: CatalogIngredient(
+                id=x,
+                ingredient_id=x,
+                price=(price := Decimal(str(rng.choice(PRICES)))),
+                price_cents=to_cents(price),
+                max_quantity=Decimal(1),
+                is_default=False,
+                is_deleted=False,
+                sell_if_stocked=False,
+            )
+            for x in range(product_id * 10, product_id * 10 + rng.randint(0, 3))
+        }
+
+        products[product_id] = CatalogProduct(
+            id=product_id,
+            name=f"prodotto {product_id}",
+            price=(price := rng.choice(PRICES)),
+            price_cents=to_cents(price),
+            is_main=True,
+            category_id=1,
+            subcategory_id=1,
+            include_cover_charge=rng.random() < 0.3,
+            daily_max_sales=None,
+            role_ids=frozenset({1}),
+            dates=(),
+            variants=MappingProxyType(variants),
+            ingredients=MappingProxyType(ingredients),
+        )
+
+    menus = {}
+    for menu_id in range(1, 6):
+        menu_fields = {}
+
+        for field_id in range(menu_id * 10, menu_id * 10 + rng.randint(1, 3)):
+            field_products = {
+                product_id: CatalogMenuFieldProduct(
+                    id=product_id,
+                    price=(price := rng.choice(PRICES)),
+                    exact_price=to_exact_price(price),
+                    product=products[product_id],
+                )
+                for product_id in rng.sample(sorted(products), 4)
+            }
+
+            menu_fields[field_id] = CatalogMenuField(
+                id=field_id,
+                max_sortable_elements=rng.randint(1, 3),
+                additional_cost=(price := rng.choice(PRICES)),
+                exact_additional_cost=to_exact_price(price),
+                is_optional=False,
+                can_exceed_max_sortable=True,
+                field_products=MappingProxyType(field_products),
+            )
+
+        menus[menu_id] = CatalogMenu(
+            id=menu_id,
+            name=f"menu {menu_id}",
+            price=(price := rng.choice(PRICES)),
+            price_cents=to_cents(price),
+            daily_max_sales=None,
+            role_ids=frozenset({1}),
+            dates=(),
+            menu_fields=MappingProxyType(menu_fields),
+        )
+
+    return Catalog(
+        version=0,
+        categories=MappingProxyType({}),
+        products=MappingProxyType(products),
+        menus=MappingProxyType(menus),
+    )
+
+
+def random_product(
+    rng: random.Random, product_db: CatalogProduct
+) -> CreateOrderProductItem:
+    ingredients = rng.sample(
+        sorted(product_db.ingredients),
+        rng.randint(0, len(product_db.ingredients)),
+    )
+
+    return CreateOrderProductItem(
+        product_id=product_db.id,
+        variant_id=(
+            rng.choice(sorted(product_db.variants))
+            if product_db.variants
+            else None
+        ),
+        ingredients=[
+            CreateOrderProductIngredientItem(ingredient_id=x, quantity=1)
+            for x in ingredients
+        ],
+        quantity=rng.randint(1, 7),
+    )
+
+
+def random_order(rng: random.Random, catalog: Catalog) -> CreateOrderItem:
+    products = [
+        random_product(rng, catalog.products[x])
+        for x in rng.sample(sorted(catalog.products), rng.randint(0, 6))
+    ]
+
+    menus = []
+    for menu_id in rng.sample(sorted(catalog.menus), rng.randint(0, 3)):
+        menu_db = catalog.menus[menu_id]
+        fields = []
+
+        for field_id, menu_field in menu_db.menu_fields.items():
+            product_ids = rng.sample(
+                sorted(menu_field.field_products), rng.randint(1, 3)
+            )
+            fields.append(
+                CreateOrderMenuFieldItem(
+                    menu_field_id=field_id,
+                    products=[
+                        random_product(
+                            rng, menu_field.field_products[x].product
+                        )
+                        for x in product_ids
+                    ],
+                )
+            )
+
+        menus.append(
+            CreateOrderMenuItem(
+                menu_id=menu_id, fields=fields, quantity=rng.randint(1, 4)
+            )
+        )
+
+    return CreateOrderItem(
+        customer="Rossi",
+        guests=rng.choice([None, 0, 1, 3, 7]),
+        is_take_away=rng.random() < 0.2,
+        is_voucher=False,
+        is_for_service=False,
+        has_tickets=True,
+        parent_order_id=rng.choice([None, None, None, 1]),
+        payment_method_id=1,
+        products=products,
+        menus=menus,
+    )
+
+
+@pytest.mark.parametrize(
+    "price, quantity, cents",
+    [
+        ((100, 8), 1, 12),  # 12.5 cents: half, rounded to even
+        ((300, 8), 1, 38),  # 37.5 cents: half, rounded to even
+        ((5, 2), 1, 2),
+        ((7, 2), 1, 4),
+        ((-5, 2), 1, -2),
+        ((1, 3), 3, 1),
+        ((1, 8), 2, 0),
+        ((1, 8), 4, 0),
+        ((1, 8), 12, 2),
+        ((249, 100), 1, 2),
+        ((251, 100), 1, 3),
+    ],
+)
+def test_round_cents_half_even(price, quantity, cents):
+    assert round_cents(price, quantity) == cents
+
+
+@pytest.mark.parametrize("value", PRICES)
+def test_to_cents_matches_decimal_quantize(value):
+    assert from_cents(to_cents(value)) == q(value)
+    assert from_cents(to_cents(Decimal(str(value)))) == q(Decimal(str(value)))
+
+
+def test_round_cents_matches_decimal_quantize_with_quantity():
+    rng = random.Random(0)
+
+    for _ in range(5000):
+        value = rng.choice(PRICES)
+        quantity = rng.randint(0, 50)
+
+        assert from_cents(
+            round_cents(to_exact_price(value), quantity)
+        ) == q(Decimal(value) * Decimal(quantity))
+
+
+def test_menu_field_excess_is_paid_by_the_last_products():
+    rng = random.Random(1)
+    catalog = random_catalog(rng)
+    menu_field = next(iter(catalog.menus[1].menu_fields.values()))
+    menu_field = CatalogMenuField(
+        **{
+            **{x: getattr(menu_field, x) for x in menu_field.__slots__},
+            "max_sortable_elements": 2,
+            "additional_cost": 1.005,
+            "exact_additional_cost": to_exact_price(1.005),
+        }
+    )
+    product_ids = sorted(menu_field.field_products)[:2]
+    field = CreateOrderMenuFieldItem(
+        menu_field_id=menu_field.id,
+        products=[
+            CreateOrderProductItem(product_id=product_ids[0], quantity=2),
+            CreateOrderProductItem(product_id=product_ids[1], quantity=3),
+        ],
+    )
+
+    # Without variants and ingredients only the field price and the excess
+    # are paid: the last product pays the 3 elements beyond the first 2
+    field = field.model_copy(
+        update={
+            "products": [
+                x.model_copy(update={"variant_id": None, "ingredients": []})
+                for x in field.products
+            ]
+        }
+    )
+    prices = price_menu_field(menu_field, field)
+    field_prices = [
+        menu_field.field_products[x].exact_price for x in product_ids
+    ]
+
+    assert prices == (
+        round_cents(field_prices[0], 2),
+        round_cents(field_prices[1], 3)
+        + round_cents(to_exact_price(1.005), 3),
+    )
+    assert [from_cents(x) for x in prices] == legacy_price_menu_field(
+        menu_field, field
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_order_prices_match_legacy_arithmetic(seed):
+    rng = random.Random(seed)
+    catalog = random_catalog(rng)
+
+    for _ in range(50):
+        item = random_order(rng, catalog)
+        cover_charge = rng.choice([0.0, 1.5, 2.005, 2.125])
+        price = price_order(item, catalog, cover_charge)
+
+        for product, cents in zip(item.products, price.products):
+            assert from_cents(cents) == q(
+                legacy_price_product(catalog.products[product.product_id], product)
+                * Decimal(product.quantity)
+            )
+
+        for menu, menu_price in zip(item.menus, price.menus):
+            assert from_cents(menu_price.price) == legacy_price_menu(
+                catalog.menus[menu.menu_id], menu
+            )
+
+        assert from_cents(price.price) == legacy_price_order(
+            item, catalog, cover_charge
+        )
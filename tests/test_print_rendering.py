@@ -0,0 +1,188 @@
+import datetime
+import re
+from types import SimpleNamespace
+
+import pytest
+from escpos.printer import Dummy
+
+from backend.utils.order_text_manager import OrderTextManager
+from backend.utils.print_manager import MAX_CACHED_TICKETS, PrintManager
+
+TICKET_TEXT = (
+    "╔══════════════════════════════════════════════╗\n"
+    "║          « CUCINA »                          ║\n"
+    "╚══════════════════════════════════════════════╝\n"
+    "* Ordine n. 42\n"
+    "* CLIENTE: ROSSI NICOLÒ\n"
+    "* Tavolo: 7\n"
+    "\n"
+    "<DOUBLE>2 Lasagne</DOUBLE>\n"
+    "    +formaggio +ragù\n"
+    "<DOUBLE>1 Pasta al pomodoro</DOUBLE>\n"
+    "    <DOUBLE>e basilico</DOUBLE>\n"
+    "    └ senza glutine, più cotta\r\n"
+    "x1 <DOUBLE>Menù bambini</DOUBLE>\r"
+    "    1 Patatine\n"
+)
+
+
+def legacy_print_content(printer, content: str) -> None:
+    """
+    Ticket printing as done before the single buffer rendering
+    """
+
+    printer.hw("INIT")
+    printer.charcode("CP850")
+    printer.buzzer(times=3, duration=1)
+
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+    for line in content.splitlines(keepends=True):
+        printer.set(align="left", font="a",)
+
+        parts = re.split(r"(<DOUBLE>.*?</DOUBLE>)", line)
+        for part in parts:
+            if part.startswith("<DOUBLE>") and part.endswith("</DOUBLE>"):
+                inner = part[len("<DOUBLE>") : -len("</DOUBLE>")]
+                printer._raw(b"\x1B\x21\x30")
+                printer.text(inner)
+                printer._raw(b"\x1B\x21\x00")
+            else:
+                printer.text(part)
+
+    printer.cut()
+
+
+def make_ticket(
+    ticket_id: int, revision_ids: list[int], **order_fields
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=ticket_id,
+        order_id=ticket_id * 10,
+        category_id=1,
+        category=SimpleNamespace(id=1, name="cucina"),
+        order=SimpleNamespace(
+            **{
+                "order_revisions": [
+                    SimpleNamespace(id=x) for x in revision_ids
+                ],
+                "customer": "Rossi",
+                "guests": 3,
+                "table": "7",
+                "notes": None,
+                "user": SimpleNamespace(username="cassa"),
+                "confirmed_at": None,
+                "confirmed_by": None,
+                **order_fields,
+            }
+        ),
+    )
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    # The order of every ticket rendered from its text
+    orders = []
+
+    def generate_text_for_printer(self, printer_type):
+        orders.append(self.order)
+        return TICKET_TEXT
+
+    monkeypatch.setattr(
+        OrderTextManager, "generate_text_for_printer", generate_text_for_printer
+    )
+
+    return orders
+
+
+def get_set_command() -> bytes:
+    printer = Dummy()
+    printer.set(align="left", font="a")
+
+    return printer.output
+
+
+def test_render_matches_per_line_printing():
+    legacy = Dummy()
+    legacy_print_content(legacy, TICKET_TEXT)
+    data = PrintManager._render_content(TICKET_TEXT)
+    set_command = get_set_command()
+
+    # Alignment and font are set once instead of on every line
+    assert data.count(set_command) == 1
+    assert legacy.output.count(set_command) == len(
+        TICKET_TEXT.replace("\r\n", "\n").replace("\r", "\n").splitlines()
+    )
+    assert data.replace(set_command, b"") == legacy.output.replace(
+        set_command, b""
+    )
+
+
+def test_cached_ticket_matches_fresh_rendering(renders):
+    manager = PrintManager()
+    ticket = make_ticket(1, [3, 5])
+
+    data = manager._get_ticket_data(ticket)
+    cached = manager._get_ticket_data(ticket)
+
+    assert cached == data == PrintManager._render_content(TICKET_TEXT)
+    assert len(renders) == 1
+
+
+def test_new_revision_is_rendered_again(renders):
+    manager = PrintManager()
+
+    manager._get_ticket_data(make_ticket(1, [3]))
+    manager._get_ticket_data(make_ticket(1, [3, 4]))
+    manager._get_ticket_data(make_ticket(1, [3, 4]))
+
+    assert len(renders) == 2
+
+
+def test_confirmed_again_ticket_is_rendered_again(renders):
+    manager = PrintManager()
+    confirmed_at = datetime.datetime(2024, 6, 10, 12)
+    cassa = SimpleNamespace(username="cassa")
+
+    # Confirming an order does not add a revision
+    manager._get_ticket_data(
+        make_ticket(1, [3], confirmed_at=confirmed_at, confirmed_by=cassa)
+    )
+    manager._get_ticket_data(
+        make_ticket(
+            1,
+            [3],
+            table="12",
+            confirmed_at=confirmed_at,
+            confirmed_by=cassa,
+        )
+    )
+    manager._get_ticket_data(
+        make_ticket(
+            1,
+            [3],
+            table="12",
+            confirmed_at=confirmed_at,
+            confirmed_by=SimpleNamespace(username="bar"),
+        )
+    )
+
+    assert len(renders) == 3
+
+
+def test_least_recently_used_ticket_is_evicted(renders):
+    manager = PrintManager()
+
+    for ticket_id in range(MAX_CACHED_TICKETS + 1):
+        manager._get_ticket_data(make_ticket(ticket_id, [1]))
+        # The first ticket stays the most recently used one
+        manager._get_ticket_data(make_ticket(0, [1]))
+
+    assert len(manager._rendered_tickets) == MAX_CACHED_TICKETS
+    assert (
+        PrintManager._get_ticket_key(make_ticket(0, [1]))
+        in manager._rendered_tickets
+    )
+    assert (
+        PrintManager._get_ticket_key(make_ticket(1, [1]))
+        not in manager._rendered_tickets
+    )
@@ -0,0 +1,245 @@
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from backend.utils import print_manager
+from backend.utils.print_manager import (
+    MAX_QUEUED_JOBS,
+    PrinterHealth,
+    PrintManager,
+)
+
+NOW = datetime.datetime(2024, 6, 10, 12, tzinfo=datetime.timezone.utc)
+PRINTER_ID = 1
+
+
+class FakeQuery:
+    def __init__(self, result):
+        self.result = result
+
+    def prefetch_related(self, *args):
+        return self
+
+    def values_list(self, *args):
+        return self
+
+    def __await__(self):
+        async def get_result():
+            return self.result
+
+        return get_result().__await__()
+
+
+class FakeTicketModel:
+    """
+    Ticket model answering the two queries of the scheduler: the tickets
+    to print, then the completion times of their parent tickets
+    """
+
+    def __init__(self, tickets: list, parent_tickets: list[tuple]):
+        self.results = [tickets, parent_tickets]
+        self.queries = []
+
+    def filter(self, **kwargs):
+        self.queries.append(kwargs)
+
+        return FakeQuery(self.results[len(self.queries) - 1])
+
+
+def make_ticket(
+    ticket_id: int,
+    order_id: int,
+    parent_category_id: int | None = None,
+    print_delay: int = 0,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=ticket_id,
+        order_id=order_id,
+        category=SimpleNamespace(
+            printer_id=PRINTER_ID,
+            wait_parent_category=parent_category_id is not None,
+            parent_category_id=parent_category_id,
+            print_delay=print_delay,
+        ),
+        order=SimpleNamespace(
+            confirmed_at=NOW - datetime.timedelta(minutes=1)
+        ),
+    )
+
+
+def make_manager() -> PrintManager:
+    # A printer without its worker, the queued tickets stay in the queue
+    manager = PrintManager()
+    manager._queues[PRINTER_ID] = asyncio.Queue(MAX_QUEUED_JOBS)
+    manager._health[PRINTER_ID] = PrinterHealth()
+
+    return manager
+
+
+def get_queued_ids(manager: PrintManager) -> list[int]:
+    queue = manager._queues[PRINTER_ID]
+
+    return [queue.get_nowait().id for _ in range(queue.qsize())]
+
+
+@pytest.fixture
+def tickets(monkeypatch):
+    def set_tickets(tickets: list, parent_tickets: list[tuple] = ()):
+        model = FakeTicketModel(tickets, list(parent_tickets))
+        monkeypatch.setattr(print_manager, "Ticket", model)
+
+        return model
+
+    return set_tickets
+
+
+def test_missing_parent_ticket_is_skipped(tickets):
+    ready = make_ticket(1, 10)
+    orphan = make_ticket(2, 20, parent_category_id=5)
+    tickets([ready, orphan])
+
+    async def run():
+        manager = make_manager()
+        await manager._print_due_tickets({10, 20}, NOW)
+
+        return get_queued_ids(manager)
+
+    assert asyncio.run(run()) == [1]
+
+
+def test_child_ticket_waits_for_its_parent(tickets):
+    parent_completed_at = NOW - datetime.timedelta(seconds=30)
+    tickets(
+        [
+            make_ticket(1, 10, parent_category_id=5),
+            make_ticket(2, 20, parent_category_id=5),
+            make_ticket(3, 30, parent_category_id=5, print_delay=60),
+        ],
+        [
+            (10, 5, parent_completed_at),
+            (20, 5, None),
+            (30, 5, parent_completed_at),
+        ],
+    )
+
+    async def run():
+        manager = make_manager()
+        await manager._print_due_tickets({10, 20, 30}, NOW)
+
+        return manager, get_queued_ids(manager)
+
+    manager, queued_ids = asyncio.run(run())
+
+    # The third one is due 60 seconds after its parent was completed
+    assert queued_ids == [1]
+    assert manager._due_times == {
+        30: parent_completed_at + datetime.timedelta(seconds=60)
+    }
+
+
+@pytest.mark.parametrize("orders", [1, 50])
+def test_readiness_takes_two_queries(tickets, orders):
+    model = tickets(
+        [
+            make_ticket(order_id * 2 + x, order_id, parent_category_id=5)
+            for order_id in range(orders)
+            for x in range(2)
+        ],
+        [(order_id, 5, NOW) for order_id in range(orders)],
+    )
+
+    async def run():
+        manager = make_manager()
+        await manager._print_due_tickets(set(range(orders)), NOW)
+
+        return get_queued_ids(manager)
+
+    assert len(asyncio.run(run())) == orders * 2
+    assert len(model.queries) == 2
+
+
+def test_worker_keeps_running_after_missing_parent(tickets):
+    tickets([make_ticket(1, 10), make_ticket(2, 20, parent_category_id=5)])
+
+    async def run():
+        manager = make_manager()
+
+        async def load_due_times(order_ids=None):
+            pass
+
+        manager._load_due_times = load_due_times
+        manager._schedule_order(10, NOW)
+        manager._schedule_order(20, NOW)
+
+        worker = asyncio.create_task(manager.update_worker())
+        await asyncio.sleep(0.05)
+        is_running = not worker.done()
+        worker.cancel()
+
+        return is_running, get_queued_ids(manager)
+
+    assert asyncio.run(run()) == (True, [1])
+
+
+def test_schedule_order_replaces_the_due_time():
+    manager = PrintManager()
+    later = NOW + datetime.timedelta(minutes=5)
+
+    manager._schedule_order(1, NOW)
+    manager._schedule_order(1, NOW)
+    assert manager._schedule == [(NOW, 1)]
+
+    # The previous entry stays in the heap, the due time tells it is stale
+    manager._schedule_order(1, later)
+    assert sorted(manager._schedule) == [(NOW, 1), (later, 1)]
+    assert manager._due_times == {1: later}
+
+    manager._schedule_order(1, None)
+    assert manager._due_times == {}
+
+
+def test_schedule_order_earlier_only_moves_it_earlier():
+    manager = PrintManager()
+    earlier = NOW - datetime.timedelta(minutes=5)
+
+    manager._schedule_order_earlier(1, NOW)
+    manager._schedule_order_earlier(1, NOW + datetime.timedelta(minutes=5))
+    assert manager._due_times == {1: NOW}
+
+    manager._schedule_order_earlier(1, earlier)
+    assert manager._due_times == {1: earlier}
+
+
+def test_worker_skips_stale_heap_entries():
+    async def run():
+        manager = PrintManager()
+        due_orders = []
+
+        async def load_due_times(order_ids=None):
+            pass
+
+        async def print_due_tickets(order_ids, now):
+            due_orders.append(order_ids)
+
+        manager._load_due_times = load_due_times
+        manager._print_due_tickets = print_due_tickets
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        manager._schedule_order(1, now - datetime.timedelta(seconds=2))
+        manager._schedule_order(2, now - datetime.timedelta(seconds=1))
+        # Order 1 moved later, its entry in the past is stale
+        manager._schedule_order(1, now + datetime.timedelta(minutes=5))
+
+        worker = asyncio.create_task(manager.update_worker())
+        await asyncio.sleep(0.05)
+        worker.cancel()
+
+        return due_orders, manager
+
+    due_orders, manager = asyncio.run(run())
+
+    assert due_orders == [{2}]
+    assert list(manager._due_times) == [1]
+    assert [x[1] for x in manager._schedule] == [1]
@@ -0,0 +1,218 @@
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from backend.models import UnicornException
+from backend.utils import CircuitState, ErrorCodes, PrinterType, PrintJobStatus
+from backend.utils import print_manager
+from backend.utils.print_manager import (
+    MAX_RETRY_DELAY,
+    RETRY_DELAY,
+    PrinterHealth,
+    PrintJob,
+    PrintManager,
+)
+
+PRINTER_ID = 1
+# Retry delay of the worker tests, in seconds
+TEST_RETRY_DELAY = 0.1
+
+
+class FakePrinter:
+    """
+    Print and probe functions of a printer that fails the given calls
+    """
+
+    def __init__(self, health: PrinterHealth, failures: set[int]):
+        self.health = health
+        self.failures = failures
+        self.calls = []
+
+    def _call(self, name: str):
+        self.calls.append((name, self.health.state))
+
+        if len(self.calls) in self.failures:
+            raise OSError("stampante spenta")
+
+    def print(self, printer, data: bytes, lock):
+        self._call("print")
+
+    def probe(self, printer_id: int):
+        self._call("probe")
+
+
+def make_manager(failures: set[int]) -> tuple[PrintManager, FakePrinter]:
+    # Must run in the event loop, the printer worker starts with it
+    manager = PrintManager()
+    manager.add_printer(PRINTER_ID, "10.0.0.1")
+    manager._render_order = lambda order, printer_types: b"ordine"
+    manager._get_role_printers = lambda order, printer_types: [
+        SimpleNamespace(printer_id=PRINTER_ID, printer_type=PrinterType.TICKET)
+    ]
+
+    printer = FakePrinter(manager._health[PRINTER_ID], failures)
+    manager._threaded_print = printer.print
+    manager._threaded_probe = printer.probe
+
+    return manager, printer
+
+
+def make_job(job_id: int) -> PrintJob:
+    return PrintJob(
+        id=job_id,
+        order_id=job_id,
+        order=SimpleNamespace(),
+        printer_types={PRINTER_ID: [PrinterType.TICKET]},
+    )
+
+
+async def wait_for_job(job: PrintJob):
+    while job.completed_at is None:
+        await asyncio.sleep(0.005)
+
+
+@pytest.fixture
+def short_retry_delay(monkeypatch):
+    monkeypatch.setattr(print_manager, "RETRY_DELAY", TEST_RETRY_DELAY)
+    monkeypatch.setattr(print_manager, "MAX_RETRY_DELAY", TEST_RETRY_DELAY * 4)
+
+
+def test_backoff_doubles_up_to_the_maximum():
+    health = PrinterHealth()
+    delays = []
+
+    for _ in range(6):
+        health.add_failure()
+        delays.append(
+            (health.retry_at - health.last_failure_at).total_seconds()
+        )
+
+    assert delays == [
+        min(RETRY_DELAY * 2**x, MAX_RETRY_DELAY) for x in range(6)
+    ]
+    assert delays[-1] == MAX_RETRY_DELAY
+    assert health.state == CircuitState.OPEN
+    assert health.consecutive_failures == health.failure_count == 6
+
+
+def test_open_circuit_is_available_at_its_retry_time():
+    health = PrinterHealth()
+    assert health.is_available(datetime.datetime.now(datetime.timezone.utc))
+
+    health.add_failure()
+    assert not health.is_available(health.last_failure_at)
+    assert health.is_available(health.retry_at)
+
+    health.add_success()
+    assert health.state == CircuitState.CLOSED
+    assert health.consecutive_failures == 0
+    assert health.retry_at is None
+    assert (health.failure_count, health.success_count) == (1, 1)
+
+
+def test_failed_print_opens_the_circuit_and_probe_closes_it(short_retry_delay):
+    async def run():
+        manager, printer = make_manager(failures={1})
+        health = manager._health[PRINTER_ID]
+
+        job = await manager.add_job(SimpleNamespace(id=1))
+        await wait_for_job(job)
+        assert job.status == PrintJobStatus.FAILED
+        assert health.state == CircuitState.OPEN
+
+        # Jobs fail fast while the printer is down
+        with pytest.raises(UnicornException) as error:
+            await manager.add_job(SimpleNamespace(id=2))
+        assert error.value.code == ErrorCodes.PRINTER_UNAVAILABLE
+        assert manager.get_queue_sizes() == {PRINTER_ID: 0}
+
+        # Nothing to print at the retry time, the printer is probed
+        await asyncio.sleep(TEST_RETRY_DELAY * 2)
+        assert health.state == CircuitState.CLOSED
+
+        job = await manager.add_job(SimpleNamespace(id=3))
+        await wait_for_job(job)
+        assert job.status == PrintJobStatus.DONE
+
+        return printer.calls, health
+
+    calls, health = asyncio.run(run())
+
+    assert calls == [
+        ("print", CircuitState.CLOSED),
+        ("probe", CircuitState.HALF_OPEN),
+        ("print", CircuitState.CLOSED),
+    ]
+    assert (health.failure_count, health.success_count) == (1, 2)
+
+
+def test_failed_probe_waits_longer(short_retry_delay):
+    async def run():
+        manager, printer = make_manager(failures={1, 2})
+        health = manager._health[PRINTER_ID]
+
+        await wait_for_job(await manager.add_job(SimpleNamespace(id=1)))
+        await asyncio.sleep(TEST_RETRY_DELAY * 1.5)
+
+        return printer.calls, health
+
+    calls, health = asyncio.run(run())
+
+    assert calls == [
+        ("print", CircuitState.CLOSED),
+        ("probe", CircuitState.HALF_OPEN),
+    ]
+    assert health.state == CircuitState.OPEN
+    assert health.consecutive_failures == 2
+    assert (health.retry_at - health.last_failure_at).total_seconds() == (
+        TEST_RETRY_DELAY * 2
+    )
+
+
+def test_queued_job_is_the_half_open_try(short_retry_delay):
+    async def run():
+        manager, printer = make_manager(failures={1})
+        health = manager._health[PRINTER_ID]
+
+        await wait_for_job(await manager.add_job(SimpleNamespace(id=1)))
+
+        # Queued while open, it is printed at the retry time without probe
+        job = make_job(2)
+        manager._queues[PRINTER_ID].put_nowait(job)
+        await wait_for_job(job)
+
+        return printer.calls, health, job
+
+    calls, health, job = asyncio.run(run())
+
+    assert calls == [
+        ("print", CircuitState.CLOSED),
+        ("print", CircuitState.HALF_OPEN),
+    ]
+    assert job.status == PrintJobStatus.DONE
+    assert health.state == CircuitState.CLOSED
+
+
+def test_printers_status(short_retry_delay):
+    async def run():
+        manager, _ = make_manager(failures={1})
+        await wait_for_job(await manager.add_job(SimpleNamespace(id=1)))
+
+        return manager.get_printers_status(), manager._health[PRINTER_ID]
+
+    (status,), health = asyncio.run(run())
+
+    assert status == {
+        "id": PRINTER_ID,
+        "ip_address": "10.0.0.1",
+        "queue_size": 0,
+        "state": CircuitState.OPEN,
+        "consecutive_failures": 1,
+        "failure_count": 1,
+        "success_count": 0,
+        "last_success_at": None,
+        "last_failure_at": health.last_failure_at,
+        "retry_at": health.retry_at,
+    }
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from backend.utils.query_utils import get_page_cursors
+
+
+def make_items(count: int) -> list[SimpleNamespace]:
+    return [SimpleNamespace(id=x, name=f"nome {x}") for x in range(count)]
+
+
+def test_full_page_has_next_cursor():
+    previous_cursor, next_cursor = get_page_cursors(make_items(3), "", 3)
+
+    assert previous_cursor is None
+    assert next_cursor is not None
+
+
+def test_short_page_is_the_last_one():
+    assert get_page_cursors(make_items(2), "", 3) == (None, None)
+
+
+def test_page_without_limit_is_the_last_one():
+    assert get_page_cursors(make_items(5), "", None) == (None, None)
+    assert get_page_cursors(make_items(5), "", 0) == (None, None)
+
+
+def test_after_cursor_without_limit_only_goes_back():
+    previous_cursor, next_cursor = get_page_cursors(
+        make_items(5), "name", None, after="cursor"
+    )
+
+    assert previous_cursor is not None
+    assert next_cursor is None
+
+
+def test_before_cursor_without_limit_only_goes_forward():
+    previous_cursor, next_cursor = get_page_cursors(
+        make_items(5), "-name", None, before="cursor"
+    )
+
+    assert previous_cursor is None
+    assert next_cursor is not None